@@ -16,14 +16,20 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 
+import json
+import os
+import tempfile
 from decimal import Decimal, localcontext
 from math import log
-from typing import Tuple
+from typing import List, Tuple, Union
+
+from twisted.logger import Logger
 
 from nucypher.blockchain.eth.agents import ContractAgency, NucypherTokenAgent, StakingEscrowAgent, AdjudicatorAgent, \
     WorkLockAgent
 from nucypher.blockchain.eth.registry import BaseContractRegistry
 from nucypher.blockchain.eth.token import NU
+from nucypher.config.constants import DEFAULT_CONFIG_ROOT
 
 LOG2 = Decimal(log(2))
 
@@ -327,6 +333,7 @@ class StandardTokenEconomics(BaseEconomics):
 
         self.initial_inflation = initial_inflation
         self.token_halving = halving_delay
+        self.__supply_at_period = dict()  # Memoized token supply, by period
         self.token_saturation = reward_saturation
         self.small_stake_multiplier = small_stake_multiplier
 
@@ -338,32 +345,56 @@ class StandardTokenEconomics(BaseEconomics):
                          **kwargs)
 
     def token_supply_at_period(self, period: int) -> int:
-        if period < 0:
+        return self.token_supply_series(start_period=period, end_period=period)[0]
+
+    def cumulative_rewards_at_period(self, period: int) -> int:
+        return self.token_supply_at_period(period) - self.erc20_initial_supply
+
+    def rewards_during_period(self, period: int) -> int:
+        return self.cumulative_rewards_at_period(period) - self.cumulative_rewards_at_period(period-1)
+
+    def token_supply_series(self, start_period: int, end_period: int) -> List[int]:
+        """
+        Returns the token supply at each period from `start_period` to `end_period` (inclusive).
+        Every period is evaluated once with the exact same Decimal operations, and memoized.
+        """
+        if start_period < 0:
             raise ValueError("Period must be a positive integer")
 
-        with localcontext() as ctx:
-            ctx.prec = self._precision
+        periods = range(start_period, end_period + 1)
+        missing_periods = [period for period in periods if period not in self.__supply_at_period]
+        if missing_periods:
+            with localcontext() as ctx:
+                ctx.prec = self._precision
 
-            #
-            # Eq. 3 of the mining paper
-            # https://github.com/nucypher/mining-paper/blob/master/mining-paper.pdf
-            #
+                #
+                # Eq. 3 of the mining paper
+                # https://github.com/nucypher/mining-paper/blob/master/mining-paper.pdf
+                #
 
-            t = Decimal(period)
-            S_0 = self.erc20_initial_supply
-            i_0 = 1
-            I_0 = i_0 * S_0  # in 1/years
-            T_half = self.token_halving  # in years
-            T_half_in_days = T_half * 365
+                S_0 = self.erc20_initial_supply
+                i_0 = 1
+                I_0 = i_0 * S_0  # in 1/years
+                T_half = self.token_halving  # in years
+                T_half_in_days = T_half * 365
+                I_0_T_half = I_0 * T_half  # The leading product of the supply equation; same rounding
 
-            S_t = S_0 + I_0 * T_half * (1 - 2**(-t / T_half_in_days)) / LOG2
-            return int(S_t)
+                for period in missing_periods:
+                    t = Decimal(period)
+                    S_t = S_0 + I_0_T_half * (1 - 2**(-t / T_half_in_days)) / LOG2
+                    self.__supply_at_period[period] = int(S_t)
 
-    def cumulative_rewards_at_period(self, period: int) -> int:
-        return self.token_supply_at_period(period) - self.erc20_initial_supply
+        return [self.__supply_at_period[period] for period in periods]
 
-    def rewards_during_period(self, period: int) -> int:
-        return self.cumulative_rewards_at_period(period) - self.cumulative_rewards_at_period(period-1)
+    def cumulative_rewards_series(self, start_period: int, end_period: int) -> List[int]:
+        """Returns the cumulative rewards at each period from `start_period` to `end_period` (inclusive)"""
+        initial_supply = self.erc20_initial_supply
+        return [supply - initial_supply for supply in self.token_supply_series(start_period, end_period)]
+
+    def rewards_series(self, start_period: int, end_period: int) -> List[int]:
+        """Returns the rewards minted during each period from `start_period` to `end_period` (inclusive)"""
+        supplies = self.token_supply_series(start_period - 1, end_period)
+        return [supply - previous_supply for previous_supply, supply in zip(supplies, supplies[1:])]
 
 
 class EconomicsFactory:
@@ -371,56 +402,157 @@ class EconomicsFactory:
 
     __economics = dict()
 
+    log = Logger('economics-factory')
+
+    # The immutable economic parameters read from the blockchain are also kept on disk, keyed by registry ID,
+    # and reused for as long as the block they were read at remains on the chain and the upgradeable
+    # contracts still target the same implementations.  Token supplies are always read live.
+    DEFAULT_CACHE_FILEPATH = os.path.join(DEFAULT_CONFIG_ROOT, 'economics.json')
+    cache_filepath = DEFAULT_CACHE_FILEPATH  # set to None to disable the on-disk cache
+
     @classmethod
     def get_economics(cls, registry: BaseContractRegistry) -> BaseEconomics:
         registry_id = registry.id
         try:
             return cls.__economics[registry_id]
         except KeyError:
-            economics = EconomicsFactory.retrieve_from_blockchain(registry=registry)
+            economics = None
+            if cls.cache_filepath:
+                economics = EconomicsFactory.retrieve_from_cache(registry=registry, cache_filepath=cls.cache_filepath)
+            if economics is None:
+                economics = EconomicsFactory.retrieve_from_blockchain(registry=registry, cache_filepath=cls.cache_filepath)
             cls.__economics[registry_id] = economics
             return economics
 
     @staticmethod
-    def retrieve_from_blockchain(registry: BaseContractRegistry) -> BaseEconomics:
-
-        # Agents
+    def __get_agents(registry: BaseContractRegistry) -> tuple:
         token_agent = ContractAgency.get_agent(NucypherTokenAgent, registry=registry)
         staking_agent = ContractAgency.get_agent(StakingEscrowAgent, registry=registry)
         adjudicator_agent = ContractAgency.get_agent(AdjudicatorAgent, registry=registry)
-
-        worklock_deployed = True
         try:
             worklock_agent = ContractAgency.get_agent(WorkLockAgent, registry=registry)
         except registry.UnknownContract:
-            worklock_deployed = False
+            worklock_agent = None
+        return token_agent, staking_agent, adjudicator_agent, worklock_agent
+
+    @staticmethod
+    def __read_cache(cache_filepath: str) -> dict:
+        try:
+            with open(cache_filepath, 'r') as cache_file:
+                return json.load(cache_file)
+        except FileNotFoundError:
+            return dict()
+        except (OSError, ValueError) as e:
+            EconomicsFactory.log.warn(f"Ignoring unreadable economics cache at {cache_filepath}: {e}")
+            return dict()
+
+    @staticmethod
+    def __supply_and_target_functions(agents: tuple) -> list:
+        """The calls whose results can change without a redeployment: token supplies and proxy targets"""
+        token_agent, staking_agent, *_agents = agents
+        target_functions = [agent.contract.functions.target() for agent in agents if agent and agent._proxy_name]
+        return [token_agent.contract.functions.totalSupply(),
+                staking_agent.contract.functions.getReservedReward(),
+                *target_functions]
+
+    @staticmethod
+    def retrieve_from_cache(registry: BaseContractRegistry, cache_filepath: str) -> Union[BaseEconomics, None]:
+        """
+        Returns the economics cached on disk for this registry, or None if there are none, if the block
+        they were read at is no longer on the chain (a different chain or a redeployment), or if an
+        upgradeable contract now targets a different implementation.  Token supplies are read live.
+        """
+        entry = EconomicsFactory.__read_cache(cache_filepath).get(registry.id)
+        if not entry:
+            return None
+
+        agents = EconomicsFactory.__get_agents(registry=registry)
+        contract_addresses = [agent.contract_address if agent else None for agent in agents]
+        if entry['contract_addresses'] != contract_addresses:
+            return None
+
+        # One call to confirm that this chain includes the block the economics were read at
+        blockchain = agents[1].blockchain
+        try:
+            block = blockchain.client.w3.eth.getBlock(entry['block_number'])
+        except Exception:  # BlockNotFound, or older providers raising ValueError
+            block = None
+        if not block or block['hash'].hex() != entry['block_hash']:
+            return None
+
+        # And one batch for the current supplies and proxy targets
+        contract_functions = EconomicsFactory.__supply_and_target_functions(agents)
+        total_supply, reward_supply, *target_addresses = blockchain.batch_call(contract_functions=contract_functions,
+                                                                               batch_size=len(contract_functions))
+        if target_addresses != entry.get('target_addresses'):
+            return None
+
+        # Not the "real" initial_supply value because used current reward instead of initial reward
+        initial_supply = total_supply - reward_supply
+        economics = BaseEconomics(initial_supply, total_supply, *entry['parameters'])
+        return economics
+
+    @staticmethod
+    def __write_cache(registry: BaseContractRegistry, cache_filepath: str, entry: dict) -> None:
+        cache = EconomicsFactory.__read_cache(cache_filepath)
+        cache[registry.id] = entry
+        try:
+            cache_dir = os.path.dirname(os.path.abspath(cache_filepath))
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, temp_filepath = tempfile.mkstemp(dir=cache_dir)
+            with os.fdopen(fd, 'w') as cache_file:
+                json.dump(cache, cache_file)
+            os.replace(temp_filepath, cache_filepath)
+        except OSError as e:
+            EconomicsFactory.log.warn(f"Failed to write economics cache at {cache_filepath}: {e}")
+
+    @staticmethod
+    def retrieve_from_blockchain(registry: BaseContractRegistry, cache_filepath: str = None) -> BaseEconomics:
+
+        # Agents
+        token_agent, staking_agent, adjudicator_agent, worklock_agent = EconomicsFactory.__get_agents(registry)
+        blockchain = staking_agent.blockchain
+
+        # Every parameter, in a single batch
+        agents = (token_agent, staking_agent, adjudicator_agent, worklock_agent)
+        supply_and_target_functions = EconomicsFactory.__supply_and_target_functions(agents)
+        staking_functions = staking_agent.staking_parameter_functions()
+        slashing_functions = adjudicator_agent.slashing_parameter_functions()
+        worklock_functions = worklock_agent.worklock_parameter_functions() if worklock_agent else list()
+        contract_functions = [*supply_and_target_functions,
+                              *staking_functions,
+                              *slashing_functions,
+                              *worklock_functions]
+        block = blockchain.client.w3.eth.getBlock('latest')
+        results = blockchain.batch_call(contract_functions=contract_functions,
+                                        batch_size=len(contract_functions),
+                                        block_identifier=block['number'])
+        total_supply, reward_supply, *results = results
+        target_addresses = results[:len(supply_and_target_functions) - 2]
+        results = results[len(target_addresses):]
+        staking_parameters = results[:len(staking_functions)]
+        slashing_parameters = results[len(staking_functions):len(staking_functions) + len(slashing_functions)]
+        worklock_parameters = results[len(staking_functions) + len(slashing_functions):]
 
         # Token
-        total_supply = token_agent.contract.functions.totalSupply().call()
-        reward_supply = staking_agent.contract.functions.getReservedReward().call()
         # Not the "real" initial_supply value because used current reward instead of initial reward
         initial_supply = total_supply - reward_supply
 
         # Staking Escrow
-        staking_parameters = list(staking_agent.staking_parameters())
         seconds_per_period = staking_parameters.pop(0)
         staking_parameters.insert(3, seconds_per_period // 60 // 60)  # hours_per_period
 
-        # Adjudicator
-        slashing_parameters = adjudicator_agent.slashing_parameters()
-
-        # Worklock
-        if worklock_deployed:
-            worklock_parameters = worklock_agent.worklock_parameters()
-        else:
-            worklock_parameters = list()
-
         # Aggregate (order-sensitive)
-        economics_parameters = (initial_supply,
-                                total_supply,
-                                *staking_parameters,
-                                *slashing_parameters,
-                                *worklock_parameters)
+        immutable_parameters = (*staking_parameters, *slashing_parameters, *worklock_parameters)
+        economics_parameters = (initial_supply, total_supply, *immutable_parameters)
+
+        if cache_filepath:
+            entry = dict(contract_addresses=[agent.contract_address if agent else None for agent in agents],
+                         target_addresses=target_addresses,
+                         block_number=block['number'],
+                         block_hash=block['hash'].hex(),
+                         parameters=immutable_parameters)
+            EconomicsFactory.__write_cache(registry=registry, cache_filepath=cache_filepath, entry=entry)
 
         economics = BaseEconomics(*economics_parameters)
         return economics
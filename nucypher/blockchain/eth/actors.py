@@ -19,7 +19,6 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 import csv
 import json
 import os
-import time
 from decimal import Decimal
 from pathlib import Path
 from typing import Tuple, List, Dict, Union
@@ -33,7 +32,6 @@ from constant_sorrow.constants import (
     IDLE,
     FULL
 )
-from eth_tester.exceptions import TransactionFailed
 from eth_utils import keccak, is_checksum_address, to_checksum_address
 from twisted.logger import Logger
 from web3 import Web3
@@ -70,7 +68,7 @@ from nucypher.blockchain.eth.registry import (
     BaseContractRegistry,
     IndividualAllocationRegistry
 )
-from nucypher.blockchain.eth.token import NU, Stake, StakeList, WorkTracker
+from nucypher.blockchain.eth.token import NU, Stake, StakeList, StakerSnapshotTracker, WorkTracker
 from nucypher.blockchain.eth.utils import datetime_to_period, calculate_period_duration, datetime_at_period, \
     prettify_eth_amount
 from nucypher.characters.banners import STAKEHOLDER_BANNER
@@ -470,6 +468,7 @@ class ContractAdministrator(NucypherTokenActor):
           {'beneficiary_address': '0xf7aefec2', 'amount': 999, 'duration_seconds': 31536000}]
 
         """
+        from eth_tester.exceptions import TransactionFailed
 
         if interactive and not emitter:
             raise ValueError("'emitter' is a required keyword argument when interactive is True.")
@@ -764,6 +763,7 @@ class Executive(MultiSigActor):
         return signed_hash
 
     def authorize(self, trustee, contract_function: ContractFunction) -> Authorization:
+        from eth_tester.exceptions import TransactionFailed
         try:
             transaction = contract_function.buildTransaction()
         except (TransactionFailed, ValueError):
@@ -1310,8 +1310,8 @@ class Worker(NucypherTokenActor):
                     elif not ether_balance:
                         raise RuntimeError(f"Worker {self.__worker_address} has no ether after waiting {timeout} seconds.")
 
-            # Increment
-            time.sleep(poll_rate)
+            # Wait for the next block (bonding and funding only change with the chain), at most `poll_rate` seconds
+            staking_agent.blockchain.block_watcher.wait_for_next_block(timeout=poll_rate)
 
     @property
     def eth_balance(self) -> Decimal:
@@ -1356,11 +1356,13 @@ class BlockchainPolicyAuthor(NucypherTokenActor):
                  checksum_address: str,
                  rate: int = None,
                  duration_periods: int = None,
+                 track_stakers: bool = False,
                  *args, **kwargs):
         """
         :param policy_agent: A policy agent with the blockchain attached;
                              If not passed, a default policy agent and blockchain connection will
                              be created from default values.
+        :param track_stakers: Keep the staker snapshot used for sampling warm in the background.
 
         """
         super().__init__(checksum_address=checksum_address, *args, **kwargs)
@@ -1369,6 +1371,10 @@ class BlockchainPolicyAuthor(NucypherTokenActor):
         self.staking_agent = ContractAgency.get_agent(StakingEscrowAgent, registry=self.registry)
         self.policy_agent = ContractAgency.get_agent(PolicyManagerAgent, registry=self.registry)
 
+        self.staker_tracker = StakerSnapshotTracker(staking_agent=self.staking_agent)
+        if track_stakers:
+            self.staker_tracker.start()
+
         self.economics = EconomicsFactory.get_economics(registry=self.registry)
         self.rate = rate
         self.duration_periods = duration_periods
@@ -1666,6 +1672,7 @@ class Bidder(NucypherTokenActor):
             self.transacting_power.activate()
 
         self._all_bonus_bidders = None
+        self._bonus_lot_value = None
 
     def _ensure_bidding_is_open(self, message: str = None) -> None:
         now = self.worklock_agent.blockchain.get_blocktime()
@@ -1743,16 +1750,17 @@ class Bidder(NucypherTokenActor):
         """Returns maximum allowed bid calculated from maximum allowed locked tokens"""
         max_bonus_tokens = self.economics.maximum_allowed_locked - self.economics.minimum_allowed_locked
         bonus_eth_supply = sum(self._all_bonus_bidders.values()) if self._all_bonus_bidders else self.worklock_agent.get_bonus_eth_supply()
-        bonus_worklock_supply = self.worklock_agent.get_bonus_lot_value()
+        bonus_worklock_supply = self._bonus_lot_value or self.worklock_agent.get_bonus_lot_value()
         max_bonus_bid = max_bonus_tokens * bonus_eth_supply // bonus_worklock_supply
         return max_bonus_bid
 
     def get_whales(self, force_read: bool = False) -> Dict[str, int]:
         """Returns all worklock bidders over the whale threshold as a dictionary of addresses and bonus bid values."""
+        all_bonus_bidders = self._get_all_bonus_bidders(force_read)
         max_bonus_bid_from_max_stake = self._get_max_bonus_bid_from_max_stake()
 
         bidders = dict()
-        for bidder, bid in self._get_all_bonus_bidders(force_read).items():
+        for bidder, bid in all_bonus_bidders.items():
             if bid > max_bonus_bid_from_max_stake:
                 bidders[bidder] = bid
         return bidders
@@ -1761,12 +1769,14 @@ class Bidder(NucypherTokenActor):
         if not force_read and self._all_bonus_bidders:
             return self._all_bonus_bidders
 
-        bidders = self.worklock_agent.get_bidders()
+        # All bidder work info and lot parameters, in batched reads
+        bidder_table = self.worklock_agent.get_bidder_table(force_read=force_read)
         min_bid = self.economics.worklock_min_allowed_bid
 
+        self._bonus_lot_value = bidder_table.bonus_lot_value
         self._all_bonus_bidders = dict()
-        for bidder in bidders:
-            bid = self.worklock_agent.get_deposited_eth(bidder)
+        for bidder in bidder_table.bidders:
+            bid = bidder_table.get_deposited_eth(bidder)
             if bid > min_bid:
                 self._all_bonus_bidders[bidder] = bid - min_bid
         return self._all_bonus_bidders
@@ -1782,7 +1792,7 @@ class Bidder(NucypherTokenActor):
             self._all_bonus_bidders.update(whales)
 
         bonus_eth_supply = sum(self._all_bonus_bidders.values())
-        bonus_worklock_supply = self.worklock_agent.get_bonus_lot_value()
+        bonus_worklock_supply = self._bonus_lot_value
         max_bonus_tokens = self.economics.maximum_allowed_locked - self.economics.minimum_allowed_locked
         if (min_whale_bonus_bid * bonus_worklock_supply) // bonus_eth_supply <= max_bonus_tokens:
             raise self.WhaleError(f"At least one of bidders {whales} has allowable bid")
@@ -1877,6 +1887,7 @@ class Bidder(NucypherTokenActor):
 
     @property
     def remaining_work(self) -> int:
+        from eth_tester.exceptions import TransactionFailed
         try:
             work = self.worklock_agent.get_remaining_work(checksum_address=self.checksum_address)
         except (TransactionFailed, ValueError):  # TODO: Is his how we want to handle thid?
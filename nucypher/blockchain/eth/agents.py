@@ -18,13 +18,22 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 import importlib
 import math
 import random
-from typing import Generator, List, Tuple, Union
+import threading
+import time
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Callable, Dict, Generator, Iterable, List, Tuple, Union
 
 from constant_sorrow.constants import NO_CONTRACT_AVAILABLE
+from eth_utils import encode_hex, event_abi_to_log_topic
 from eth_utils.address import to_checksum_address
-from eth_tester.exceptions import TransactionFailed
 from twisted.logger import Logger
-from web3.contract import Contract
+from web3.contract import Contract, ContractFunction
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # Staker sampling falls back to pure Python prefix sums
 
 from nucypher.blockchain.eth.constants import (
     DISPATCHER_CONTRACT_NAME,
@@ -99,6 +108,9 @@ class EthereumContractAgent:
     # TODO - #842: Gas Management
     DEFAULT_TRANSACTION_GAS_LIMITS = {}
 
+    # View calls packed into each batched read
+    DEFAULT_BATCH_SIZE = 100
+
     class ContractNotDeployed(Exception):
         pass
 
@@ -106,7 +118,8 @@ class EthereumContractAgent:
                  registry: BaseContractRegistry,
                  provider_uri: str = None,
                  contract: Contract = None,
-                 transaction_gas: int = None
+                 transaction_gas: int = None,
+                 batch_size: int = None
                  ) -> None:
 
         self.log = Logger(self.__class__.__name__)
@@ -122,10 +135,11 @@ class EthereumContractAgent:
                                                             proxy_name=self._proxy_name,
                                                             use_proxy_address=self._forward_address)
         self.__contract = contract
-        self.events = ContractEvents(contract)
+        self.events = ContractEvents(contract, blockchain=self.blockchain)
         if not transaction_gas:
             transaction_gas = EthereumContractAgent.DEFAULT_TRANSACTION_GAS_LIMITS
         self.transaction_gas = transaction_gas
+        self.batch_size = batch_size or self.DEFAULT_BATCH_SIZE
 
         super().__init__()
         self.log.info("Initialized new {} for {} with {} and {}".format(self.__class__.__name__,
@@ -160,6 +174,11 @@ class EthereumContractAgent:
             return None
         return self.contract.functions.owner().call()
 
+    def batch_call(self, contract_functions: Iterable[ContractFunction], batch_size: int = None) -> list:
+        """Execute many view calls with one round trip per `batch_size` calls, preserving order"""
+        return self.blockchain.batch_call(contract_functions=contract_functions,
+                                          batch_size=batch_size or self.batch_size)
+
     @validate_checksum_address
     def transfer_ownership(self, sender_address: str, checksum_address: str, transaction_gas_limit: int = None) -> dict:
         contract_function = self.contract.functions.transferOwnership(checksum_address)
@@ -201,6 +220,25 @@ class NucypherTokenAgent(EthereumContractAgent):
         receipt = self.blockchain.send_transaction(contract_function=contract_function, sender_address=sender_address)
         return receipt
 
+    @validate_checksum_address
+    def batch_transfer(self,
+                       transfers: List[Tuple[str, int]],
+                       sender_address: str,
+                       window: int = None,
+                       on_receipt: Callable[[int, dict], None] = None
+                       ) -> List[dict]:
+        """
+        Transfer tokens to many (target address, amount) pairs, pipelining up to `window` transactions at a time.
+        `on_receipt` is called with the index of each transfer and its receipt as soon as it succeeds.
+        """
+        contract_functions = [self.contract.functions.transfer(target_address, amount)
+                              for target_address, amount in transfers]
+        receipts = self.blockchain.send_transactions(contract_functions=contract_functions,
+                                                     sender_address=sender_address,
+                                                     window=window,
+                                                     on_receipt=on_receipt)
+        return receipts
+
     @validate_checksum_address
     def approve_and_call(self,
                          amount: int,
@@ -219,6 +257,107 @@ class NucypherTokenAgent(EthereumContractAgent):
         return approve_and_call_receipt
 
 
+class StakerSnapshot:
+    """
+    Staker data read from StakingEscrow as of one (registry id, current period, latest relevant block) key.
+    Nothing is read when the snapshot is taken: the stakers' activity, and the active staker lists
+    per duration, are filled in the first time they are requested.
+    """
+
+    def __init__(self, key: Tuple[str, int, int], read_activity: Callable[[], Tuple[List[str], List[int]]]):
+        self.key = key
+        self.registry_id, self.period, self.block_number = key
+        self.__read_activity = read_activity
+        self.__activity = None        # (stakers, last_active_periods)
+        self.active_stakers = dict()  # (periods, pagination_size) -> (n_tokens, stakers)
+        self.samplers = dict()        # (periods, pagination_size) -> StakerSampler
+
+    def __repr__(self):
+        r = f"{self.__class__.__name__}(period={self.period}, block={self.block_number})"
+        return r
+
+    def __get_activity(self) -> Tuple[List[str], List[int]]:
+        if self.__activity is None:
+            self.__activity = self.__read_activity()
+        return self.__activity
+
+    @property
+    def stakers(self) -> List[str]:
+        stakers, _last_active_periods = self.__get_activity()
+        return stakers
+
+    @property
+    def last_active_periods(self) -> List[int]:
+        _stakers, last_active_periods = self.__get_activity()
+        return last_active_periods
+
+    def partition_by_activity(self) -> Tuple[List[str], List[str], List[str]]:
+        active_stakers, pending_stakers, missing_stakers = [], [], []
+        for staker, last_active_period in zip(self.stakers, self.last_active_periods):
+            if last_active_period == self.period + 1:
+                active_stakers.append(staker)
+            elif last_active_period == self.period:
+                pending_stakers.append(staker)
+            else:
+                missing_stakers.append(staker)
+        return active_stakers, pending_stakers, missing_stakers
+
+
+class StakerSampler:
+    """
+    Stake-weighted sampling over a fixed list of active stakers.
+
+    The cumulative stake array is computed once, so each random point is mapped
+    to its staker by bisection instead of a walk over the whole staker list.
+    NumPy is used for the prefix sums and lookups when it is installed and the
+    total stake fits in a 64-bit integer.
+    """
+
+    def __init__(self, stakers: List[Tuple[str, int]]):
+        self.addresses = [address for address, _tokens in stakers]
+        cumulative_tokens = list(accumulate(tokens for _address, tokens in stakers))
+        self.total_tokens = cumulative_tokens[-1] if cumulative_tokens else 0
+        self.__vectorized = numpy is not None and self.total_tokens < 2 ** 63
+        if self.__vectorized:
+            self.__cumulative_tokens = numpy.array(cumulative_tokens, dtype=numpy.int64)
+        else:
+            self.__cumulative_tokens = cumulative_tokens
+
+    def __len__(self):
+        return len(self.addresses)
+
+    def draw(self, points: List[int]) -> List[str]:
+        """Returns the staker whose stake covers each point in [0, total_tokens)"""
+        if self.__vectorized:
+            indices = numpy.searchsorted(self.__cumulative_tokens, numpy.array(points, dtype=numpy.int64), side='right')
+            return [self.addresses[index] for index in indices.tolist()]
+        return [self.addresses[bisect_right(self.__cumulative_tokens, point)] for point in points]
+
+    def sample(self,
+               quantity: int,
+               additional_ursulas: float = 1.5,
+               attempts: int = 5,
+               random_source: random.Random = None
+               ) -> List[str]:
+        """
+        Draws `quantity` distinct stakers, sampling more points than needed (by a factor of `additional_ursulas`,
+        compounded over each of the `attempts`) to make up for points falling on the same staker.
+        """
+        if self.total_tokens == 0:
+            raise StakingEscrowAgent.NotEnoughStakers('There are no locked tokens.')
+
+        random_source = random_source or random.SystemRandom()
+        sample_size = quantity
+        for _ in range(attempts):
+            sample_size = math.ceil(sample_size * additional_ursulas)
+            points = [random_source.randrange(self.total_tokens) for _ in range(sample_size)]
+            addresses = set(self.draw(points))
+            if len(addresses) >= quantity:
+                return random_source.sample(list(addresses), quantity)
+
+        raise StakingEscrowAgent.NotEnoughStakers('Selection failed after {} attempts'.format(attempts))
+
+
 class StakingEscrowAgent(EthereumContractAgent):
 
     registry_contract_name = STAKING_ESCROW_CONTRACT_NAME
@@ -226,9 +365,73 @@ class StakingEscrowAgent(EthereumContractAgent):
 
     DEFAULT_PAGINATION_SIZE = 30    # TODO: Use dynamic pagination size (see #1424)
 
+    # Events that can change staker data between period boundaries
+    SNAPSHOT_EVENTS = ('ActivityConfirmed', 'Deposited', 'Locked', 'Divided',
+                       'Prolonged', 'Withdrawn', 'Mined', 'Slashed', 'WindDownSet')
+
+    # Seconds for which a staker snapshot is used without checking the chain for changes
+    SNAPSHOT_FRESHNESS_INTERVAL = 15  # About one block
+
     class NotEnoughStakers(Exception):
         pass
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__snapshot = None
+        self.__snapshot_lock = threading.Lock()
+        self.__snapshot_checked_at = None
+        self.__scanned_block = None     # Log scanning starts at the head seen by the first snapshot
+        self.__relevant_block = None
+        self.__snapshot_topics = [encode_hex(event_abi_to_log_topic(abi)) for abi in self.contract.abi
+                                  if abi['type'] == 'event' and abi['name'] in self.SNAPSHOT_EVENTS]
+
+    def __latest_relevant_block(self) -> int:
+        """
+        Scans new blocks, in a single log query, for events that invalidate staker snapshots.
+        The caller must hold the snapshot lock.
+        """
+        latest_block = self.blockchain.client.block_number
+        if self.__scanned_block is None:
+            # Nothing was snapshotted before now; there is no history to scan.
+            self.__scanned_block = self.__relevant_block = latest_block
+        elif latest_block > self.__scanned_block:
+            logs = self.blockchain.client.w3.eth.getLogs({'address': self.contract_address,
+                                                          'fromBlock': self.__scanned_block + 1,
+                                                          'toBlock': latest_block,
+                                                          'topics': [self.__snapshot_topics]})
+            if logs:
+                self.__relevant_block = max(self.__relevant_block, *(log['blockNumber'] for log in logs))
+            self.__scanned_block = latest_block
+        return self.__relevant_block
+
+    def get_staker_snapshot(self, refresh: bool = False) -> StakerSnapshot:
+        """
+        Returns the cached staker snapshot, replacing it only when the period has rolled over,
+        a staking event has been emitted since it was taken, or `refresh` is requested.
+        The chain is checked for such changes at most once per `SNAPSHOT_FRESHNESS_INTERVAL`.
+        """
+        with self.__snapshot_lock:
+            snapshot = self.__snapshot
+            now = time.monotonic()
+            if not refresh and snapshot is not None and \
+                    now - self.__snapshot_checked_at < self.SNAPSHOT_FRESHNESS_INTERVAL:
+                return snapshot
+
+            registry_id = self.registry.id if self.registry else None
+            key = (registry_id, self.get_current_period(), self.__latest_relevant_block())
+            self.__snapshot_checked_at = now
+            if refresh or snapshot is None or snapshot.key != key:
+                snapshot = StakerSnapshot(key=key, read_activity=self.__read_staker_activity)
+                self.__snapshot = snapshot
+                self.log.debug(f"Took new staker snapshot {snapshot}")
+        return snapshot
+
+    def __read_staker_activity(self) -> Tuple[List[str], List[int]]:
+        stakers = self.get_stakers()
+        last_active_periods = self.batch_call(self.contract.functions.getLastActivePeriod(staker)
+                                              for staker in stakers)
+        return stakers, last_active_periods
+
     #
     # Staker Network Status
     #
@@ -244,7 +447,7 @@ class StakingEscrowAgent(EthereumContractAgent):
     def get_stakers(self) -> List[str]:
         """Returns a list of stakers"""
         num_stakers = self.get_staker_population()
-        stakers = [self.contract.functions.stakers(i).call() for i in range(num_stakers)]
+        stakers = self.batch_call(self.contract.functions.stakers(i) for i in range(num_stakers))
         return stakers
 
     def partition_stakers_by_activity(self) -> Tuple[List[str], List[str], List[str]]:
@@ -252,28 +455,44 @@ class StakingEscrowAgent(EthereumContractAgent):
         The first list contains stakers that already confirmed next period.
         The second, stakers that confirmed for current period but haven't confirmed next yet.
         The third contains stakers that have missed activity confirmation before current period"""
-
-        num_stakers = self.get_staker_population()
-        current_period = self.get_current_period()
-
-        active_stakers, pending_stakers, missing_stakers = [], [], []
-        for i in range(num_stakers):
-            staker = self.contract.functions.stakers(i).call()
-            last_active_period = self.get_last_active_period(staker)
-            if last_active_period == current_period + 1:
-                active_stakers.append(staker)
-            elif last_active_period == current_period:
-                pending_stakers.append(staker)
-            else:
-                missing_stakers.append(staker)
-
-        return active_stakers, pending_stakers, missing_stakers
+        return self.get_staker_snapshot().partition_by_activity()
 
     def get_all_active_stakers(self, periods: int, pagination_size: int = None) -> Tuple[int, List[str]]:
-        """Only stakers which confirmed the current period (in the previous period) are used."""
+        """
+        Only stakers which confirmed the current period (in the previous period) are used.
+        Results are shared through the current staker snapshot.
+        """
         if not periods > 0:
             raise ValueError("Period must be > 0")
 
+        snapshot = self.get_staker_snapshot()
+        n_tokens, stakers = self.__get_active_stakers(snapshot=snapshot, periods=periods, pagination_size=pagination_size)
+        return n_tokens, [list(staker) for staker in stakers]
+
+    def __get_active_stakers(self, snapshot: StakerSnapshot, periods: int, pagination_size: int = None):
+        try:
+            return snapshot.active_stakers[(periods, pagination_size)]
+        except KeyError:
+            n_tokens, stakers = self._read_active_stakers(periods=periods, pagination_size=pagination_size)
+            snapshot.active_stakers[(periods, pagination_size)] = n_tokens, stakers
+            return n_tokens, stakers
+
+    def get_sampler(self, duration: int, pagination_size: int = None) -> StakerSampler:
+        """Returns a stake-weighted sampler over the stakers locked for `duration` periods, built once per snapshot"""
+        if not duration > 0:
+            raise ValueError("Period must be > 0")
+        snapshot = self.get_staker_snapshot()
+        try:
+            return snapshot.samplers[(duration, pagination_size)]
+        except KeyError:
+            _n_tokens, stakers = self.__get_active_stakers(snapshot=snapshot,
+                                                           periods=duration,
+                                                           pagination_size=pagination_size)
+            sampler = StakerSampler(stakers=stakers)
+            snapshot.samplers[(duration, pagination_size)] = sampler
+            return sampler
+
+    def _read_active_stakers(self, periods: int, pagination_size: int = None) -> Tuple[int, List[str]]:
         if pagination_size is None:
             pagination_size = StakingEscrowAgent.DEFAULT_PAGINATION_SIZE if self.blockchain.is_light else 0
         elif pagination_size < 0:
@@ -364,12 +583,32 @@ class StakingEscrowAgent(EthereumContractAgent):
         return first_period, last_period, periods, locked
 
     @validate_checksum_address
-    def get_all_stakes(self, staker_address: str):
-        stakes_length = self.contract.functions.getSubStakesLength(staker_address).call()
+    def get_all_stakes(self, staker_address: str) -> List[Tuple[int, int, int]]:
+        """Returns all of the staker's sub-stakes as (first period, last period, locked value), in batched reads"""
+        f = self.contract.functions
+        stakes_length = f.getSubStakesLength(staker_address).call()
         if stakes_length == 0:
-            return iter(())  # Empty iterable, There are no stakes
+            return list()  # There are no stakes
+        contract_functions = list()
         for stake_index in range(stakes_length):
-            yield self.get_substake_info(staker_address=staker_address, stake_index=stake_index)
+            contract_functions.append(f.getSubStakeInfo(staker_address, stake_index))
+            contract_functions.append(f.getLastPeriodOfSubStake(staker_address, stake_index))
+        results = self.batch_call(contract_functions)
+        stakes = [(first_period, last_period, locked_value)
+                  for (first_period, *others, locked_value), last_period in zip(results[::2], results[1::2])]
+        return stakes
+
+    @validate_checksum_address
+    def get_latest_staker_event_block(self, staker_address: str, from_block: int, to_block: int) -> Union[int, None]:
+        """Returns the latest block in the range where StakingEscrow emitted an event for this staker, if any"""
+        staker_topic = '0x' + staker_address[2:].lower().rjust(64, '0')
+        logs = self.blockchain.client.w3.eth.getLogs({'address': self.contract_address,
+                                                      'fromBlock': from_block,
+                                                      'toBlock': to_block,
+                                                      'topics': [None, staker_topic]})
+        if not logs:
+            return None
+        return max(log['blockNumber'] for log in logs)
 
     @validate_checksum_address
     def deposit_tokens(self, amount: int, lock_periods: int, sender_address: str):
@@ -517,6 +756,10 @@ class StakingEscrowAgent(EthereumContractAgent):
         return receipt
 
     def staking_parameters(self) -> Tuple:
+        staking_parameters = tuple(self.batch_call(self.staking_parameter_functions()))
+        return staking_parameters
+
+    def staking_parameter_functions(self) -> List[ContractFunction]:
         parameter_signatures = (
             # Period
             'secondsPerPeriod',  # Seconds in single period
@@ -533,11 +776,7 @@ class StakingEscrowAgent(EthereumContractAgent):
             'minWorkerPeriods'           # Min amount of periods while a worker can't be changed
         )
 
-        def _call_function_by_name(name: str):
-            return getattr(self.contract.functions, name)().call()
-
-        staking_parameters = tuple(map(_call_function_by_name, parameter_signatures))
-        return staking_parameters
+        return [getattr(self.contract.functions, name)() for name in parameter_signatures]
 
     #
     # Contract Utilities
@@ -551,9 +790,10 @@ class StakingEscrowAgent(EthereumContractAgent):
 
         """
 
-        for index in range(self.get_staker_population()):
-            staker_address = self.contract.functions.stakers(index).call()
-            yield staker_address
+        num_stakers = self.get_staker_population()
+        for start in range(0, num_stakers, self.batch_size):
+            indices = range(start, min(start + self.batch_size, num_stakers))
+            yield from self.batch_call(self.contract.functions.stakers(index) for index in indices)
 
     def sample(self,
                quantity: int,
@@ -583,41 +823,13 @@ class StakingEscrowAgent(EthereumContractAgent):
         Only stakers which confirmed the current period (in the previous period) are used.
         """
 
-        system_random = random.SystemRandom()
-        n_tokens, stakers = self.get_all_active_stakers(periods=duration, pagination_size=pagination_size)
-        if n_tokens == 0:
+        sampler = self.get_sampler(duration=duration, pagination_size=pagination_size)
+        if sampler.total_tokens == 0:
             raise self.NotEnoughStakers('There are no locked tokens for duration {}.'.format(duration))
 
-        sample_size = quantity
-        for _ in range(attempts):
-            sample_size = math.ceil(sample_size * additional_ursulas)
-            points = sorted(system_random.randrange(n_tokens) for _ in range(sample_size))
-            self.log.debug(f"Sampling {sample_size} stakers with random points: {points}")
-
-            addresses = set()
-
-            point_index = 0
-            sum_of_locked_tokens = 0
-            staker_index = 0
-            stakers_len = len(stakers)
-            while staker_index < stakers_len and point_index < sample_size:
-                current_staker = stakers[staker_index][0]
-                staker_tokens = stakers[staker_index][1]
-                next_sum_value = sum_of_locked_tokens + staker_tokens
-
-                point = points[point_index]
-                if sum_of_locked_tokens <= point < next_sum_value:
-                    addresses.add(to_checksum_address(current_staker))
-                    point_index += 1
-                else:
-                    staker_index += 1
-                    sum_of_locked_tokens = next_sum_value
-
-            self.log.debug(f"Sampled {len(addresses)} stakers: {list(addresses)}")
-            if len(addresses) >= quantity:
-                return system_random.sample(addresses, quantity)
-
-        raise self.NotEnoughStakers('Selection failed after {} attempts'.format(attempts))
+        addresses = sampler.sample(quantity=quantity, additional_ursulas=additional_ursulas, attempts=attempts)
+        self.log.debug(f"Sampled {len(addresses)} stakers: {addresses}")
+        return addresses
 
     def get_completed_work(self, bidder_address: str):
         total_completed_work = self.contract.functions.getCompletedWork(bidder_address).call()
@@ -988,6 +1200,10 @@ class AdjudicatorAgent(EthereumContractAgent):
         return self.contract.functions.penaltyHistory(staker_address).call()
 
     def slashing_parameters(self) -> Tuple:
+        slashing_parameters = tuple(self.batch_call(self.slashing_parameter_functions()))
+        return slashing_parameters
+
+    def slashing_parameter_functions(self) -> List[ContractFunction]:
         parameter_signatures = (
             'hashAlgorithm',                    # Hashing algorithm
             'basePenalty',                      # Base for the penalty calculation
@@ -996,17 +1212,48 @@ class AdjudicatorAgent(EthereumContractAgent):
             'rewardCoefficient',                # Coefficient for calculating the reward
         )
 
-        def _call_function_by_name(name: str):
-            return getattr(self.contract.functions, name)().call()
+        return [getattr(self.contract.functions, name)() for name in parameter_signatures]
 
-        staking_parameters = tuple(map(_call_function_by_name, parameter_signatures))
-        return staking_parameters
+
+class BidderTable:
+    """
+    WorkLock bidders and their work info structs (deposited ETH, completed work, claimed, index),
+    read together with the lot parameters as of one block.
+    """
+
+    def __init__(self,
+                 block_number: int,
+                 work_info: Dict[str, Tuple[int, int, bool, int]],
+                 lot_value: int,
+                 min_allowable_locked_tokens: int):
+        self.block_number = block_number
+        self.work_info = work_info
+        self.lot_value = lot_value
+        self.min_allowable_locked_tokens = min_allowable_locked_tokens
+
+    def __len__(self):
+        return len(self.work_info)
+
+    @property
+    def bidders(self) -> List[str]:
+        return list(self.work_info)
+
+    @property
+    def bonus_lot_value(self) -> int:
+        return self.lot_value - len(self.work_info) * self.min_allowable_locked_tokens
+
+    def get_deposited_eth(self, checksum_address: str) -> int:
+        return self.work_info[checksum_address][0]
 
 
 class WorkLockAgent(EthereumContractAgent):
 
     registry_contract_name = "WorkLock"
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__bidder_table = None
+
     #
     # Transactions
     #
@@ -1168,9 +1415,31 @@ class WorkLockAgent(EthereumContractAgent):
     def get_bidders(self) -> List[str]:
         """Returns a list of bidders"""
         num_bidders = self.get_bidders_population()
-        bidders = [self.contract.functions.bidders(i).call() for i in range(num_bidders)]
+        bidders = self.batch_call(self.contract.functions.bidders(i) for i in range(num_bidders))
         return bidders
 
+    def get_bidder_table(self, force_read: bool = False) -> BidderTable:
+        """
+        Returns every bidder's work info along with the lot parameters, read in batched calls.
+        The table is cached until a new block is mined (or `force_read` is passed).
+        """
+        block_number = self.blockchain.client.block_number
+        table = self.__bidder_table
+        if table is not None and table.block_number == block_number and not force_read:
+            return table
+
+        f = self.contract.functions
+        bidders = self.get_bidders()
+        lot_value, min_allowable_locked_tokens, *work_info = self.batch_call([f.tokenSupply(),
+                                                                             f.minAllowableLockedTokens(),
+                                                                             *(f.workInfo(b) for b in bidders)])
+        table = BidderTable(block_number=block_number,
+                            work_info=dict(zip(bidders, (tuple(info) for info in work_info))),
+                            lot_value=lot_value,
+                            min_allowable_locked_tokens=min_allowable_locked_tokens)
+        self.__bidder_table = table
+        return table
+
     def is_claiming_available(self) -> bool:
         """Returns True if claiming is available"""
         return self.contract.functions.isClaimingAvailable().call()
@@ -1206,6 +1475,10 @@ class WorkLockAgent(EthereumContractAgent):
         return date
 
     def worklock_parameters(self) -> Tuple:
+        parameters = tuple(self.batch_call(self.worklock_parameter_functions()))
+        return parameters
+
+    def worklock_parameter_functions(self) -> List[ContractFunction]:
         parameter_signatures = (
             'tokenSupply',
             'startBidDate',
@@ -1216,11 +1489,7 @@ class WorkLockAgent(EthereumContractAgent):
             'minAllowedBid',
         )
 
-        def _call_function_by_name(name: str):
-            return getattr(self.contract.functions, name)().call()
-
-        parameters = tuple(map(_call_function_by_name, parameter_signatures))
-        return parameters
+        return [getattr(self.contract.functions, name)() for name in parameter_signatures]
 
 
 class SeederAgent(EthereumContractAgent):
@@ -1271,6 +1540,7 @@ class MultiSigAgent(EthereumContractAgent):
 
     @property
     def owners(self) -> Tuple[str]:
+        from eth_tester.exceptions import TransactionFailed
         i = 0
         owners = list()
         array_is_within_bounds = True
@@ -1,4 +1,6 @@
 import functools
+import threading
+from collections import OrderedDict
 from datetime import datetime
 
 from twisted.logger import Logger
@@ -8,7 +10,25 @@ import eth_utils
 
 from nucypher.crypto.api import keccak_digest
 
-__VERIFIED_ADDRESSES = set()
+__VERIFIED_ADDRESSES = OrderedDict()  # Recently validated checksum addresses, least recently used first
+__VERIFIED_ADDRESSES_LOCK = threading.Lock()
+VERIFIED_ADDRESSES_CACHE_SIZE = 4096
+
+
+def _recently_verified(checksum_address) -> bool:
+    with __VERIFIED_ADDRESSES_LOCK:
+        try:
+            __VERIFIED_ADDRESSES.move_to_end(checksum_address)
+        except (KeyError, TypeError):  # Unknown, or not even hashable
+            return False
+        return True
+
+
+def _remember_verified(checksum_address: str) -> None:
+    with __VERIFIED_ADDRESSES_LOCK:
+        if len(__VERIFIED_ADDRESSES) >= VERIFIED_ADDRESSES_CACHE_SIZE:
+            __VERIFIED_ADDRESSES.popitem(last=False)
+        __VERIFIED_ADDRESSES[checksum_address] = True
 
 
 class InvalidChecksumAddress(eth_utils.exceptions.ValidationError):
@@ -24,6 +44,10 @@ def validate_checksum_address(func: Callable) -> Callable:
     verifying the input type on failure; Raises TypeError
     or InvalidChecksumAddress if validation fails, respectively.
 
+    The signature is inspected once, when the function is decorated; each call
+    only looks up the address parameters, and recently validated addresses are
+    not validated again.
+
     EIP-55 Specification: https://github.com/ethereum/EIPs/blob/master/EIPS/eip-55.md
     ETH Utils Implementation: https://github.com/ethereum/eth-utils
 
@@ -32,28 +56,45 @@ def validate_checksum_address(func: Callable) -> Callable:
     parameter_name_suffix = '_address'
     log = Logger('EIP-55-validator')
 
+    # (name, position, default) of each address parameter
+    address_parameters = list()
+    for position, (parameter_name, parameter) in enumerate(inspect.signature(func).parameters.items()):
+        if not parameter_name.endswith(parameter_name_suffix):
+            continue
+        if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+            continue
+        if parameter.kind == parameter.KEYWORD_ONLY:
+            position = None
+        address_parameters.append((parameter_name, position, parameter.default))
+
+    if not address_parameters:
+        return func
+
+    missing = inspect.Parameter.empty
+
     @functools.wraps(func)
     def wrapped(*args, **kwargs):
 
         # Check for the presence of checksum addresses in this call
-        params = inspect.getcallargs(func, *args, **kwargs)
-        addresses_as_parameters = (parameter_name for parameter_name in params
-                                   if parameter_name.endswith(parameter_name_suffix))
-        for parameter_name in addresses_as_parameters:
-            checksum_address = params[parameter_name]
-
-            if checksum_address in __VERIFIED_ADDRESSES:
+        for parameter_name, position, default in address_parameters:
+            if position is not None and position < len(args):
+                checksum_address = args[position]
+            else:
+                checksum_address = kwargs.get(parameter_name, default)
+                if checksum_address is missing:
+                    continue  # Not passed; let the call itself fail
+
+            if _recently_verified(checksum_address):
                 continue
 
-            signature = inspect.signature(func)
-            parameter_is_optional = signature.parameters[parameter_name].default is None
+            parameter_is_optional = default is None
             if parameter_is_optional and checksum_address is None:
                 continue
 
             address_is_valid = eth_utils.is_checksum_address(checksum_address)
             # OK!
             if address_is_valid:
-                __VERIFIED_ADDRESSES.add(checksum_address)
+                _remember_verified(checksum_address)
                 continue
 
             # Invalid Type
@@ -67,8 +108,8 @@ def validate_checksum_address(func: Callable) -> Callable:
             message = '"{}" is not a valid EIP-55 checksum address.'.format(checksum_address)
             log.debug(message)
             raise InvalidChecksumAddress(message)
-        else:
-            return func(*args, **kwargs)
+
+        return func(*args, **kwargs)
 
     return wrapped
 
@@ -15,16 +15,28 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import json
+import sqlite3
+import threading
+
+from eth_utils import encode_hex, event_abi_to_log_topic
+from hexbytes import HexBytes
+from twisted.logger import Logger
+
 from nucypher.blockchain.eth.interfaces import BlockchainInterfaceFactory
 
 
 class EventRecord:
-    def __init__(self, event: dict):
+    def __init__(self, event: dict, timestamp: int = None):
         self.raw_event = dict(event)
         self.args = dict(event['args'])
         self.block_number = event['blockNumber']
         self.transaction_hash = event['transactionHash'].hex()
 
+        if timestamp is not None:
+            self.timestamp = timestamp
+            return
+
         try:
             blockchain = BlockchainInterfaceFactory.get_interface()
         except BlockchainInterfaceFactory.NoRegisteredInterfaces:
@@ -42,8 +54,9 @@ class EventRecord:
 
 class ContractEvents:
 
-    def __init__(self, contract):
+    def __init__(self, contract, blockchain=None):
         self.contract = contract
+        self.blockchain = blockchain
         self.names = tuple(e.event_name for e in contract.events)
 
     def __get_web3_event_by_name(self, event_name):
@@ -57,6 +70,15 @@ class ContractEvents:
 
         def wrapper(from_block=None, to_block=None, **argument_filters):
 
+            event_index = getattr(self.blockchain, 'event_index', None)
+            if event_index is not None:
+                yield from event_index.get_events(contract=self.contract,
+                                                  event_name=event_name,
+                                                  from_block=from_block,
+                                                  to_block=to_block,
+                                                  **argument_filters)
+                return
+
             if from_block is None:
                 from_block = 0  # TODO: we can do better. Get contract creation block.
             if to_block is None:
@@ -75,4 +97,163 @@ class ContractEvents:
 
     def __iter__(self):
         for event_name in self.names:
-            yield self[event_name]
\ No newline at end of file
+            yield self[event_name]
+
+
+class ContractEventIndex:
+    """
+    An embedded SQLite index of decoded contract events and their block timestamps.
+
+    Logs are synced incrementally, in windows of at most `block_window` blocks, up to
+    `confirmations` blocks behind the chain head; the unconfirmed tail is always read
+    from the provider. If the last indexed block is no longer on the canonical chain,
+    the index is rewound by `confirmations` blocks and synced again.
+    """
+
+    DEFAULT_CONFIRMATIONS = 12
+    DEFAULT_BLOCK_WINDOW = 5_000
+
+    _TABLES = (
+        """CREATE TABLE IF NOT EXISTS events (
+               contract_address TEXT, event_name TEXT, block_number INTEGER, log_index INTEGER,
+               transaction_hash TEXT, args TEXT,
+               PRIMARY KEY (contract_address, block_number, log_index))""",
+        "CREATE INDEX IF NOT EXISTS events_by_name ON events (contract_address, event_name, block_number)",
+        "CREATE TABLE IF NOT EXISTS blocks (block_number INTEGER PRIMARY KEY, timestamp INTEGER)",
+        "CREATE TABLE IF NOT EXISTS sync_state (contract_address TEXT PRIMARY KEY, block_number INTEGER, block_hash TEXT)",
+    )
+
+    def __init__(self, blockchain, db_filepath: str, confirmations: int = None, block_window: int = None):
+        self.log = Logger(self.__class__.__name__)
+        self.blockchain = blockchain
+        self.db_filepath = db_filepath
+        self.confirmations = confirmations if confirmations is not None else self.DEFAULT_CONFIRMATIONS
+        self.block_window = block_window or self.DEFAULT_BLOCK_WINDOW
+
+        self.__lock = threading.RLock()
+        self.__db = sqlite3.connect(db_filepath, check_same_thread=False)
+        with self.__db:
+            for statement in self._TABLES:
+                self.__db.execute(statement)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.db_filepath})"
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__db.close()
+
+    @staticmethod
+    def __encode_args(args: dict) -> str:
+        def encode_bytes(value):
+            if isinstance(value, (bytes, bytearray)):
+                return {'__bytes__': bytes(value).hex()}
+            raise TypeError(f"Cannot index event argument {value!r}")
+        return json.dumps(dict(args), default=encode_bytes)
+
+    @staticmethod
+    def __decode_args(args: str) -> dict:
+        def decode_bytes(value: dict):
+            if '__bytes__' in value:
+                return bytes.fromhex(value['__bytes__'])
+            return value
+        return json.loads(args, object_hook=decode_bytes)
+
+    def __block_hash(self, block_number: int) -> str:
+        return self.blockchain.client.w3.eth.getBlock(block_number)['hash'].hex()
+
+    def synced_block(self, contract_address: str) -> int:
+        """The last block number indexed for `contract_address`, or -1"""
+        with self.__lock:
+            row = self.__db.execute("SELECT block_number FROM sync_state WHERE contract_address = ?",
+                                    (contract_address,)).fetchone()
+        return row[0] if row else -1
+
+    def sync(self, contract) -> int:
+        """Index the confirmed logs of `contract` that are not yet on disk; returns the last indexed block"""
+        with self.__lock:
+            row = self.__db.execute("SELECT block_number, block_hash FROM sync_state WHERE contract_address = ?",
+                                    (contract.address,)).fetchone()
+            synced_block, synced_hash = row if row else (-1, None)
+
+            if synced_block >= 0 and synced_hash != self.__block_hash(synced_block):
+                rewind_block = max(synced_block - max(self.confirmations, 1), -1)
+                self.log.warn(f"Reorg detected at block #{synced_block}; rewinding event index to #{rewind_block}")
+                with self.__db:
+                    self.__db.execute("DELETE FROM events WHERE contract_address = ? AND block_number > ?",
+                                      (contract.address, rewind_block))
+                    self.__db.execute("DELETE FROM blocks WHERE block_number > ?", (rewind_block,))
+                synced_block = rewind_block
+
+            topics = {encode_hex(event_abi_to_log_topic(abi)): abi['name']
+                      for abi in contract.abi if abi['type'] == 'event'}
+            confirmed_block = self.blockchain.client.block_number - self.confirmations
+            while synced_block < confirmed_block:
+                window_end = min(synced_block + self.block_window, confirmed_block)
+                logs = self.blockchain.client.w3.eth.getLogs({'address': contract.address,
+                                                              'fromBlock': synced_block + 1,
+                                                              'toBlock': window_end})
+                rows = list()
+                for log in logs:
+                    try:
+                        event_name = topics[encode_hex(log['topics'][0])]
+                    except (IndexError, KeyError):
+                        continue  # Anonymous or unknown event
+                    event = getattr(contract.events, event_name)().processLog(log)
+                    rows.append((contract.address, event_name, event['blockNumber'], event['logIndex'],
+                                 event['transactionHash'].hex(), self.__encode_args(event['args'])))
+
+                with self.__db:
+                    self.__db.executemany("INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?)", rows)
+                    self.__db.execute("INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)",
+                                      (contract.address, window_end, self.__block_hash(window_end)))
+                synced_block = window_end
+
+            return synced_block
+
+    def get_block_timestamp(self, block_number: int, cache: bool = True) -> int:
+        with self.__lock:
+            row = self.__db.execute("SELECT timestamp FROM blocks WHERE block_number = ?", (block_number,)).fetchone()
+            if row:
+                return row[0]
+            timestamp = self.blockchain.client.w3.eth.getBlock(block_number)['timestamp']
+            if cache:
+                with self.__db:
+                    self.__db.execute("INSERT OR REPLACE INTO blocks VALUES (?, ?)", (block_number, timestamp))
+            return timestamp
+
+    def get_events(self, contract, event_name: str, from_block: int = None, to_block=None, **argument_filters):
+        """Yields EventRecords for `event_name`, served from disk up to the last confirmed block"""
+        synced_block = self.sync(contract)
+        from_block = from_block or 0
+        if to_block is None or to_block == 'latest':
+            to_block = self.blockchain.client.block_number
+
+        with self.__lock:
+            rows = self.__db.execute("""SELECT block_number, log_index, transaction_hash, args FROM events
+                                        WHERE contract_address = ? AND event_name = ?
+                                        AND block_number BETWEEN ? AND ?
+                                        ORDER BY block_number, log_index""",
+                                     (contract.address, event_name, from_block, min(to_block, synced_block))).fetchall()
+
+        for block_number, log_index, transaction_hash, args in rows:
+            args = self.__decode_args(args)
+            if any(args.get(name) != value for name, value in argument_filters.items()):
+                continue
+            event = dict(args=args,
+                         event=event_name,
+                         blockNumber=block_number,
+                         logIndex=log_index,
+                         transactionHash=HexBytes(transaction_hash),
+                         address=contract.address)
+            yield EventRecord(event, timestamp=self.get_block_timestamp(block_number))
+
+        # Unconfirmed blocks are never indexed
+        if to_block > synced_block:
+            event_method = getattr(contract.events, event_name)
+            event_filter = event_method.createFilter(fromBlock=max(from_block, synced_block + 1),
+                                                     toBlock=to_block,
+                                                     argument_filters=argument_filters)
+            for entry in event_filter.get_all_entries():
+                timestamp = self.get_block_timestamp(entry['blockNumber'], cache=False)
+                yield EventRecord(entry, timestamp=timestamp)
@@ -17,15 +17,18 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 
 import collections
+import heapq
+import math
 import os
 import pprint
-from typing import List, Callable
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, TYPE_CHECKING
 from typing import Tuple
 from typing import Union
 from urllib.parse import urlparse
 
 import click
-import maya
 import requests
 import time
 from constant_sorrow.constants import (
@@ -35,14 +38,16 @@ from constant_sorrow.constants import (
     NO_PROVIDER_PROCESS,
     READ_ONLY_INTERFACE
 )
-from eth_tester import EthereumTester
 from eth_utils import to_checksum_address
+from hexbytes import HexBytes
 from twisted.logger import Logger
 from web3 import Web3, WebsocketProvider, HTTPProvider, IPCProvider, middleware
 from web3.contract import ContractConstructor, Contract
 from web3.contract import ContractFunction
 from web3.exceptions import TimeExhausted
 from web3.exceptions import ValidationError
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
 from web3.gas_strategies import time_based
 from web3.middleware import geth_poa_middleware
 
@@ -59,18 +64,84 @@ from nucypher.blockchain.eth.providers import (
     _get_HTTP_provider
 )
 from nucypher.blockchain.eth.registry import BaseContractRegistry
-from nucypher.blockchain.eth.sol.compile import SolidityCompiler
+from nucypher.blockchain.eth.watchers import BlockHeadWatcher
 from nucypher.blockchain.eth.utils import prettify_eth_amount
 from nucypher.characters.control.emitters import StdoutEmitter, JSONRPCStdoutEmitter
 from nucypher.utilities.logging import GlobalLoggerSettings
 
-Web3Providers = Union[IPCProvider, WebsocketProvider, HTTPProvider, EthereumTester]
+if TYPE_CHECKING:
+    # eth-tester and the Solidity compiler are only needed by test providers and deployers
+    from eth_tester import EthereumTester
+    from nucypher.blockchain.eth.sol.compile import SolidityCompiler
+    # The event index is only loaded once enabled
+    from nucypher.blockchain.eth.events import ContractEventIndex
+
+Web3Providers = Union[IPCProvider, WebsocketProvider, HTTPProvider, 'EthereumTester']
 
 
 class VersionedContract(Contract):
     version = None
 
 
+class NonceManager:
+    """
+    Hands out consecutive transaction nonces per sender, reading the pending transaction
+    count from the provider only when a sender is first seen or explicitly synced.
+
+    Nonces reserved for transactions that are never broadcast can be released; released
+    nonces are handed out again before new ones so that no gap stalls later transactions.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.__lock = threading.Lock()
+        self.__next_nonces = dict()
+        self.__released_nonces = dict()
+
+    def sync(self, sender_address: str) -> int:
+        """Catch up with transactions sent around this manager; returns the next nonce to be reserved"""
+        with self.__lock:
+            pending_nonce = self.client.w3.eth.getTransactionCount(sender_address, 'pending')
+            next_nonce = max(pending_nonce, self.__next_nonces.get(sender_address, 0))
+            self.__next_nonces[sender_address] = next_nonce
+            released = self.__released_nonces.get(sender_address, [])
+            self.__released_nonces[sender_address] = [nonce for nonce in released if nonce >= pending_nonce]
+            return next_nonce
+
+    def reserve(self, sender_address: str) -> int:
+        with self.__lock:
+            released = self.__released_nonces.get(sender_address)
+            if released:
+                return heapq.heappop(released)
+        if sender_address not in self.__next_nonces:
+            self.sync(sender_address)
+        with self.__lock:
+            nonce = self.__next_nonces[sender_address]
+            self.__next_nonces[sender_address] = nonce + 1
+            return nonce
+
+    def release(self, sender_address: str, nonce: int) -> None:
+        with self.__lock:
+            if nonce == self.__next_nonces.get(sender_address, 0) - 1:
+                self.__next_nonces[sender_address] = nonce  # Nothing was issued after it
+            else:
+                heapq.heappush(self.__released_nonces.setdefault(sender_address, []), nonce)
+
+    def gaps(self, sender_address: str) -> List[int]:
+        """Released nonces lower than nonces already handed out; transactions above them are stalled"""
+        with self.__lock:
+            return sorted(self.__released_nonces.get(sender_address, []))
+
+    def reset(self, sender_address: str = None) -> None:
+        with self.__lock:
+            if sender_address is None:
+                self.__next_nonces.clear()
+                self.__released_nonces.clear()
+            else:
+                self.__next_nonces.pop(sender_address, None)
+                self.__released_nonces.pop(sender_address, None)
+
+
 class BlockchainInterface:
     """
     Interacts with a solidity compiler and a registry in order to instantiate compiled
@@ -80,6 +151,9 @@ class BlockchainInterface:
     TIMEOUT = 600  # seconds
     NULL_ADDRESS = '0x' + '0' * 40
 
+    DEFAULT_PIPELINE_WINDOW = 16    # transactions in flight per sender
+    REPLACEMENT_GAS_PRICE_BUMP = 1.125  # Geth rejects same-nonce replacements priced less than 10% higher
+
     DEFAULT_GAS_STRATEGY = 'medium'
     GAS_STRATEGIES = {'glacial': time_based.glacial_gas_price_strategy,     # 24h
                       'slow': time_based.slow_gas_price_strategy,           # 1h
@@ -110,6 +184,9 @@ class BlockchainInterface:
     class NotEnoughConfirmations(InterfaceError):
         pass
 
+    class BatchCallFailed(InterfaceError):
+        pass
+
     def __init__(self,
                  emitter = None,  # TODO # 1754
                  poa: bool = False,
@@ -194,6 +271,9 @@ class BlockchainInterface:
         self.client = NO_BLOCKCHAIN_CONNECTION  # type: Web3Client
         self.transacting_power = READ_ONLY_INTERFACE
         self.is_light = light
+        self.event_index = None
+        self.nonce_manager = NO_BLOCKCHAIN_CONNECTION
+        self.__block_watcher = None
 
         try:
             gas_strategy = self.GAS_STRATEGIES[gas_strategy]
@@ -261,6 +341,7 @@ class BlockchainInterface:
         try:
             self.w3 = self.Web3(provider=self._provider)
             self.client = Web3Client.from_w3(w3=self.w3)
+            self.nonce_manager = NonceManager(client=self.client)
         except requests.ConnectionError:  # RPC
             raise self.ConnectionFailed(f'Connection Failed - {str(self.provider_uri)} - is RPC enabled?')
         except FileNotFoundError:         # IPC File Protocol
@@ -374,6 +455,7 @@ class BlockchainInterface:
                           sender_address: str,
                           payload: dict = None,
                           transaction_gas_limit: int = None,
+                          nonce: int = None
                           ) -> dict:
 
         #
@@ -383,7 +465,8 @@ class BlockchainInterface:
         if not payload:
             payload = {}
 
-        nonce = self.client.w3.eth.getTransactionCount(sender_address, 'pending')
+        if nonce is None:
+            nonce = self.client.w3.eth.getTransactionCount(sender_address, 'pending')
         payload.update({'chainId': int(self.client.chain_id),
                         'nonce': nonce,
                         'from': sender_address,
@@ -427,6 +510,24 @@ class BlockchainInterface:
                                        confirmations: int = 0
                                        ) -> dict:
 
+        txhash = self.__sign_and_broadcast(unsigned_transaction=unsigned_transaction,
+                                           transaction_name=transaction_name)
+        receipt = self.__wait_for_receipt(txhash=txhash, transaction_name=transaction_name)
+        self.__check_receipt(receipt=receipt, txhash=txhash, confirmations=confirmations)
+        return receipt
+
+    def __wait_for_receipt(self, txhash: bytes, transaction_name: str = "") -> dict:
+        try:
+            receipt = self.block_watcher.wait_for_receipt(txhash, timeout=self.TIMEOUT)
+        except TimeExhausted:
+            # TODO: #1504 - Handle transaction timeout
+            raise
+        else:
+            self.log.debug(f"[RECEIPT-{transaction_name}] | txhash: {receipt['transactionHash'].hex()}")
+        return receipt
+
+    def __sign_and_broadcast(self, unsigned_transaction: dict, transaction_name: str = "") -> bytes:
+
         #
         # Setup
         #
@@ -462,13 +563,9 @@ class BlockchainInterface:
 
         emitter.message(f'Broadcasting {transaction_name} Transaction ({cost} gwei @ {price})...', color='yellow')
         txhash = self.client.send_raw_transaction(signed_raw_transaction)
-        try:
-            receipt = self.client.wait_for_receipt(txhash, timeout=self.TIMEOUT)
-        except TimeExhausted:
-            # TODO: #1504 - Handle transaction timeout
-            raise
-        else:
-            self.log.debug(f"[RECEIPT-{transaction_name}] | txhash: {receipt['transactionHash'].hex()}")
+        return txhash
+
+    def __check_receipt(self, receipt: dict, txhash: bytes, confirmations: int = 0) -> None:
 
         #
         # Confirm
@@ -492,17 +589,116 @@ class BlockchainInterface:
 
         # Block confirmations
         if confirmations:
-            start = maya.now()
-            confirmations_so_far = self.get_confirmations(receipt)
-            while confirmations_so_far < confirmations:
-                self.log.info(f"So far, we've received {confirmations_so_far} confirmations. "
-                              f"Waiting for {confirmations - confirmations_so_far} more.")
-                time.sleep(3)
-                confirmations_so_far = self.get_confirmations(receipt)
-                if (maya.now() - start).seconds > self.TIMEOUT:
-                    raise self.NotEnoughConfirmations
+            self.log.info(f"Waiting for {confirmations} confirmations of {receipt['transactionHash'].hex()}")
+            try:
+                self.block_watcher.wait_for_confirmations(receipt=receipt,
+                                                          confirmations=confirmations,
+                                                          timeout=self.TIMEOUT)
+            except TimeExhausted:
+                raise self.NotEnoughConfirmations
 
-        return receipt
+    @validate_checksum_address
+    def send_transactions(self,
+                          contract_functions: List[ContractFunction],
+                          sender_address: str,
+                          payload: dict = None,
+                          transaction_gas_limit: int = None,
+                          window: int = None,
+                          confirmations: int = 0,
+                          on_receipt: Callable[[int, dict], None] = None
+                          ) -> List[dict]:
+        """
+        Pipelined counterpart of `send_transaction`: broadcasts up to `window` transactions with
+        consecutive nonces before waiting, then collects that window's receipts concurrently.
+        Receipts are returned in the order of `contract_functions`.
+
+        `on_receipt` is called with the index of each contract function and its receipt as soon as
+        that transaction is known to have succeeded.  If any transaction fails, the others already
+        broadcast in the same window are still waited for and reported before the error is raised.
+        """
+        window = window or self.DEFAULT_PIPELINE_WINDOW
+        if window < 1:
+            raise ValueError("Pipeline window must be > 0")
+
+        contract_functions = list(contract_functions)
+        self.nonce_manager.sync(sender_address)
+
+        def wait_for_receipt(txhash) -> Tuple[Union[dict, None], Union[Exception, None]]:
+            try:
+                return self.block_watcher.wait_for_receipt(txhash, timeout=self.TIMEOUT), None
+            except Exception as e:
+                return None, e
+
+        receipts = list()
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            for start in range(0, len(contract_functions), window):
+                txhashes, error = list(), None
+                for contract_function in contract_functions[start:start + window]:
+                    nonce = self.nonce_manager.reserve(sender_address)
+                    try:
+                        transaction = self.build_transaction(contract_function=contract_function,
+                                                             sender_address=sender_address,
+                                                             payload=dict(payload or {}),
+                                                             transaction_gas_limit=transaction_gas_limit,
+                                                             nonce=nonce)
+                        txhash = self.__sign_and_broadcast(unsigned_transaction=transaction,
+                                                           transaction_name=contract_function.fn_name.upper())
+                    except Exception as e:
+                        self.nonce_manager.release(sender_address, nonce)
+                        self.fill_nonce_gaps(sender_address)
+                        error = e
+                        break
+                    txhashes.append(txhash)
+
+                window_receipts = executor.map(wait_for_receipt, txhashes)
+                for index, (txhash, (receipt, wait_error)) in enumerate(zip(txhashes, window_receipts), start=start):
+                    try:
+                        if wait_error:
+                            raise wait_error
+                        self.__check_receipt(receipt=receipt, txhash=txhash, confirmations=confirmations)
+                    except Exception as e:
+                        error = error or e
+                        continue
+                    receipts.append(receipt)
+                    if on_receipt:
+                        on_receipt(index, receipt)
+
+                if error:
+                    raise error
+
+        return receipts
+
+    def replace_transaction(self, transaction: dict, gas_price: int = None) -> bytes:
+        """
+        Re-broadcasts a pending `transaction` under the same nonce, with its gas price bumped
+        by at least `REPLACEMENT_GAS_PRICE_BUMP` (or to `gas_price`, if higher).
+        """
+        replacement = dict(transaction)
+        bumped_gas_price = math.ceil(transaction['gasPrice'] * self.REPLACEMENT_GAS_PRICE_BUMP)
+        replacement['gasPrice'] = max(bumped_gas_price, gas_price or 0)
+        return self.__sign_and_broadcast(unsigned_transaction=replacement, transaction_name='REPLACEMENT')
+
+    def fill_nonce_gaps(self, sender_address: str) -> List[bytes]:
+        """Unblocks stalled transactions by spending each released nonce on an empty self-transfer"""
+        txhashes = list()
+        for _gap in self.nonce_manager.gaps(sender_address):
+            nonce = self.nonce_manager.reserve(sender_address)  # Released nonces are handed out first
+            filler = {'chainId': int(self.client.chain_id),
+                      'nonce': nonce,
+                      'from': sender_address,
+                      'to': sender_address,
+                      'value': 0,
+                      'gas': 21000,
+                      'gasPrice': self.client.gas_price}
+            txhashes.append(self.__sign_and_broadcast(unsigned_transaction=filler, transaction_name='NONCE-GAP'))
+        return txhashes
+
+    @property
+    def block_watcher(self) -> BlockHeadWatcher:
+        """The chain head watcher shared by everything waiting on blocks through this interface"""
+        if self.__block_watcher is None:
+            self.__block_watcher = BlockHeadWatcher(w3=self.w3)
+        return self.__block_watcher
 
     def get_confirmations(self, receipt: dict) -> int:
         tx_block_number = receipt.get('blockNumber')
@@ -513,11 +709,74 @@ class BlockchainInterface:
                              f"as it seems to come from {-confirmations} blocks in the future...")
         return confirmations
 
+    def enable_event_index(self, db_filepath: str, **options) -> 'ContractEventIndex':
+        """Serve contract event queries for agents on this interface from a local event index"""
+        from nucypher.blockchain.eth.events import ContractEventIndex
+        self.event_index = ContractEventIndex(blockchain=self, db_filepath=db_filepath, **options)
+        return self.event_index
+
     def get_blocktime(self):
         highest_block = self.w3.eth.getBlock('latest')
         now = highest_block['timestamp']
         return now
 
+    def batch_call(self,
+                   contract_functions: Iterable[ContractFunction],
+                   batch_size: int,
+                   block_identifier: Union[int, str] = 'latest'
+                   ) -> list:
+        """
+        Execute many contract view calls, packing up to `batch_size` of them into
+        each JSON-RPC batch request. Results are decoded like `ContractFunction.call`
+        and returned in the same order as `contract_functions`.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be > 0")
+        if isinstance(block_identifier, int):
+            block_identifier = hex(block_identifier)
+
+        contract_functions = list(contract_functions)
+        results = list()
+        for start in range(0, len(contract_functions), batch_size):
+            chunk = contract_functions[start:start + batch_size]
+            calls = [('eth_call', [{'to': function.address, 'data': function._encode_transaction_data()},
+                                   block_identifier]) for function in chunk]
+            raw_results = self._send_rpc_batch(calls=calls)
+            results.extend(self.__decode_call_result(function, raw_result)
+                           for function, raw_result in zip(chunk, raw_results))
+        return results
+
+    def _send_rpc_batch(self, calls: List[Tuple[str, list]]) -> list:
+        """
+        Send several JSON-RPC requests in a single round trip and return their raw results in order.
+        Providers without wire-level batching (IPC, websockets, eth-tester) serve the requests in sequence.
+        """
+        if not isinstance(self.provider, HTTPProvider):
+            return [self.w3.manager.request_blocking(method, params) for method, params in calls]
+
+        payload = [dict(jsonrpc='2.0', method=method, params=params, id=request_id)
+                   for request_id, (method, params) in enumerate(calls)]
+        response = requests.post(self.provider.endpoint_uri, json=payload, **self.provider.get_request_kwargs())
+        response.raise_for_status()
+        responses = response.json()
+        if not isinstance(responses, list):
+            raise self.BatchCallFailed(f"Provider does not support batch requests: {responses}")
+
+        results = list()
+        for rpc_response in sorted(responses, key=lambda r: r['id']):
+            if 'error' in rpc_response:
+                raise self.BatchCallFailed(rpc_response['error'])
+            results.append(rpc_response['result'])
+        return results
+
+    def __decode_call_result(self, contract_function: ContractFunction, raw_result: Union[str, bytes]):
+        output_types = get_abi_output_types(contract_function.abi)
+        output_data = self.w3.codec.decode_abi(output_types, HexBytes(raw_result))
+        normalized_data = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, output_data)
+        if len(normalized_data) == 1:
+            return normalized_data[0]
+        return normalized_data
+
     @validate_checksum_address
     def send_transaction(self,
                          contract_function: Union[ContractFunction, ContractConstructor],
@@ -527,19 +786,29 @@ class BlockchainInterface:
                          confirmations: int = 0
                          ) -> dict:
 
-        transaction = self.build_transaction(contract_function=contract_function,
-                                             sender_address=sender_address,
-                                             payload=payload,
-                                             transaction_gas_limit=transaction_gas_limit)
-
         try:
             transaction_name = contract_function.fn_name.upper()
         except AttributeError:
             transaction_name = 'DEPLOY' if isinstance(contract_function, ContractConstructor) else 'UNKNOWN'
 
-        receipt = self.sign_and_broadcast_transaction(unsigned_transaction=transaction,
-                                                      transaction_name=transaction_name,
-                                                      confirmations=confirmations)
+        # Nonces come from the nonce manager, so that they never collide with pipelined transactions;
+        # syncing first accounts for transactions sent around it.
+        self.nonce_manager.sync(sender_address)
+        nonce = self.nonce_manager.reserve(sender_address)
+        try:
+            transaction = self.build_transaction(contract_function=contract_function,
+                                                 sender_address=sender_address,
+                                                 payload=payload,
+                                                 transaction_gas_limit=transaction_gas_limit,
+                                                 nonce=nonce)
+            txhash = self.__sign_and_broadcast(unsigned_transaction=transaction, transaction_name=transaction_name)
+        except Exception:
+            self.nonce_manager.release(sender_address, nonce)
+            self.fill_nonce_gaps(sender_address)
+            raise
+
+        receipt = self.__wait_for_receipt(txhash=txhash, transaction_name=transaction_name)
+        self.__check_receipt(receipt=receipt, txhash=txhash, confirmations=confirmations)
         return receipt
 
     def get_contract_by_name(self,
@@ -659,8 +928,9 @@ class BlockchainDeployerInterface(BlockchainInterface):
     class DeploymentFailed(RuntimeError):
         pass
 
-    def __init__(self, compiler: SolidityCompiler = None, ignore_solidity_check: bool = False, *args, **kwargs):
+    def __init__(self, compiler: 'SolidityCompiler' = None, ignore_solidity_check: bool = False, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        from nucypher.blockchain.eth.sol.compile import SolidityCompiler
         self.compiler = compiler or SolidityCompiler(ignore_solidity_check=ignore_solidity_check)
 
     def connect(self):
@@ -668,7 +938,7 @@ class BlockchainDeployerInterface(BlockchainInterface):
         self._setup_solidity(compiler=self.compiler)
         return self.is_connected
 
-    def _setup_solidity(self, compiler: SolidityCompiler = None):
+    def _setup_solidity(self, compiler: 'SolidityCompiler' = None):
         if compiler:
             # Execute the compilation if we're recompiling
             # Otherwise read compiled contract data from the registry.
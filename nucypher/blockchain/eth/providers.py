@@ -3,11 +3,8 @@
 import os
 from urllib.parse import urlparse
 
-from eth_tester import EthereumTester
-from eth_tester import PyEVMBackend
 from web3 import WebsocketProvider, HTTPProvider, IPCProvider
 from web3.exceptions import InfuraKeyNotFound
-from web3.providers.eth_tester.main import EthereumTesterProvider
 
 from nucypher.blockchain.eth.clients import NuCypherGethDevProcess
 
@@ -67,6 +64,8 @@ def _get_auto_provider(provider_uri):
 
 def _get_tester_pyevm(provider_uri):
     # https://web3py.readthedocs.io/en/latest/providers.html#httpprovider
+    from eth_tester import EthereumTester, PyEVMBackend
+    from web3.providers.eth_tester.main import EthereumTesterProvider
     from nucypher.utilities.sandbox.constants import PYEVM_GAS_LIMIT, NUMBER_OF_ETH_TEST_ACCOUNTS
 
     # Initialize
@@ -184,6 +184,38 @@ class RegistrySourceManager:
             raise self.NoSourcesAvailable
 
 
+class RegistryIndex:
+    """
+    Parsed registry contents, with contract records indexed by name, name and version, and address.
+    Built once per registry revision so that lookups don't re-read and re-scan the registry.
+    """
+
+    def __init__(self, registry_data: Union[list, dict], registry_class_name: str, key=None):
+        self.key = key
+        self.by_name = dict()
+        self.by_name_and_version = dict()
+        self.by_address = dict()
+
+        blake = hashlib.blake2b()
+        blake.update(registry_class_name.encode())
+        blake.update(json.dumps(registry_data).encode())
+        self.id = blake.digest().hex()
+
+        if isinstance(registry_data, dict):
+            return  # Allocation registries are keyed by beneficiary already
+
+        for contract in registry_data:
+            if len(contract) == 3:
+                name, address, abi = contract
+                version = None
+            else:
+                name, version, address, abi = contract
+            record = (name, version, address, abi)
+            self.by_name.setdefault(name, list()).append(record)
+            self.by_name_and_version.setdefault((name, version), list()).append(record)
+            self.by_address.setdefault(address, list()).append(record)
+
+
 class BaseContractRegistry(ABC):
     """
     Records known contracts on the disk for future access and utility. This
@@ -223,6 +255,7 @@ class BaseContractRegistry(ABC):
     def __init__(self, source=NO_REGISTRY_SOURCE, *args, **kwargs):
         self.__source = source
         self.log = Logger("registry")
+        self._index = None
 
     def __eq__(self, other) -> bool:
         if self is other:
@@ -236,11 +269,24 @@ class BaseContractRegistry(ABC):
     @property
     def id(self) -> str:
         """Returns a hexstr of the registry contents."""
-        blake = hashlib.blake2b()
-        blake.update(self.__class__.__name__.encode())
-        blake.update(json.dumps(self.read()).encode())
-        digest = blake.digest().hex()
-        return digest
+        return self._get_index().id
+
+    def _index_key(self):
+        """Identifies the revision of the registry contents; the index is rebuilt when it changes."""
+        return None
+
+    def _get_index(self) -> RegistryIndex:
+        key = self._index_key()
+        index = self._index
+        if index is None or index.key != key:
+            try:
+                index = RegistryIndex(registry_data=self.read(), registry_class_name=self.__class__.__name__, key=key)
+            except ValueError:
+                message = "Missing or corrupted registry data"
+                self.log.critical(message)
+                raise self.InvalidRegistry(message)
+            self._index = index
+        return index
 
     @abstractmethod
     def _destroy(self) -> None:
@@ -309,31 +355,24 @@ class BaseContractRegistry(ABC):
     def search(self, contract_name: str = None, contract_version: str = None, contract_address: str = None) -> tuple:
         """
         Searches the registry for a contract with the provided name or address
-        and returns the contracts component data.
+        and returns the contracts component data. A search by address can be
+        narrowed to records of a given contract name (and version).
         """
-        if not (bool(contract_name) ^ bool(contract_address)):
-            raise ValueError("Pass contract_name or contract_address, not both.")
+        if not (bool(contract_name) or bool(contract_address)):
+            raise ValueError("Pass contract_name or contract_address.")
         if bool(contract_version) and not bool(contract_name):
             raise ValueError("Pass contract_version together with contract_name.")
 
-        contracts = list()
-        registry_data = self.read()
-
-        try:
-            for contract in registry_data:
-                if len(contract) == 3:
-                    name, address, abi = contract
-                    version = None
-                else:
-                    name, version, address, abi = contract
-                if contract_name == name and \
-                        (contract_version is None or version == contract_version) or \
-                        contract_address == address:
-                    contracts.append((name, version, address, abi))
-        except ValueError:
-            message = "Missing or corrupted registry data"
-            self.log.critical(message)
-            raise self.InvalidRegistry(message)
+        index = self._get_index()
+        if contract_address:
+            contracts = [(name, version, address, abi)
+                         for name, version, address, abi in index.by_address.get(contract_address, list())
+                         if (contract_name is None or name == contract_name) and
+                         (contract_version is None or version == contract_version)]
+        elif contract_version is not None:
+            contracts = index.by_name_and_version.get((contract_name, contract_version), list())
+        else:
+            contracts = index.by_name.get(contract_name, list())
 
         if not contracts:
             raise self.UnknownContract(contract_name)
@@ -343,7 +382,7 @@ class BaseContractRegistry(ABC):
             self.log.critical(m)
             raise self.InvalidRegistry(m)
 
-        result = tuple(contracts) if contract_name else contracts[0]
+        result = contracts[0] if contract_address else tuple(contracts)
         return result
 
 
@@ -366,8 +405,16 @@ class LocalContractRegistry(BaseContractRegistry):
 
     def _swap_registry(self, filepath: str) -> bool:
         self.__filepath = filepath
+        self._index = None
         return True
 
+    def _index_key(self):
+        try:
+            stat = os.stat(self.__filepath)
+        except FileNotFoundError:
+            return None
+        return self.__filepath, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
     def read(self) -> Union[list, dict]:
         """
         Reads the registry file and parses the JSON and returns a list.
@@ -410,6 +457,7 @@ class LocalContractRegistry(BaseContractRegistry):
             registry_file.seek(0)
             registry_file.write(json.dumps(registry_data))
             registry_file.truncate()
+        self._index = None
 
     def _destroy(self) -> None:
         os.remove(self.filepath)
@@ -435,6 +483,7 @@ class TemporaryContractRegistry(LocalContractRegistry):
         self.log.info("Cleared temporary registry at {}".format(self.filepath))
         with open(self.filepath, 'w') as registry_file:
             registry_file.write('')
+        self._index = None
 
     def commit(self, filepath) -> str:
         """writes the current state of the registry to a file"""
@@ -460,12 +509,17 @@ class InMemoryContractRegistry(BaseContractRegistry):
 
     def clear(self):
         self.__registry_data = None
+        self._index = None
 
     def _swap_registry(self, filepath: str) -> bool:
         raise NotImplementedError
 
+    def _index_key(self):
+        return None  # Only changes through write, which drops the index
+
     def write(self, registry_data: list) -> None:
         self.__registry_data = json.dumps(registry_data)
+        self._index = None
 
     def read(self) -> list:
         try:
@@ -494,6 +548,7 @@ class InMemoryContractRegistry(BaseContractRegistry):
 
     def _destroy(self) -> None:
         self.__registry_data = dict()
+        self._index = None
 
 
 class AllocationRegistry(LocalContractRegistry):
@@ -585,12 +640,17 @@ class InMemoryAllocationRegistry(AllocationRegistry):
 
     def clear(self):
         self.__registry_data = None
+        self._index = None
 
     def _swap_registry(self, filepath: str) -> bool:
         raise NotImplementedError
 
+    def _index_key(self):
+        return None  # Only changes through write, which drops the index
+
     def write(self, registry_data: dict) -> None:
         self.__registry_data = json.dumps(registry_data)
+        self._index = None
 
     def read(self) -> dict:
         try:
@@ -28,7 +28,8 @@ from constant_sorrow.constants import (
     UNKNOWN_WORKER_STATUS
 )
 from eth_utils import currency, is_checksum_address
-from twisted.internet import task, reactor
+from twisted.internet import task, reactor, threads
+from twisted.internet.defer import CancelledError
 from twisted.logger import Logger
 
 from nucypher.blockchain.eth.agents import StakingEscrowAgent, ContractAgency
@@ -245,6 +246,7 @@ class Stake:
                         index: int,
                         stake_info: Tuple[int, int, int],
                         economics,
+                        worker_address: str = None,
                         *args, **kwargs
                         ) -> 'Stake':
 
@@ -260,7 +262,9 @@ class Stake:
                        validate_now=False,
                        *args, **kwargs)
 
-        instance.worker_address = instance.staking_agent.get_worker_from_staker(staker_address=checksum_address)
+        if worker_address is None:
+            worker_address = instance.staking_agent.get_worker_from_staker(staker_address=checksum_address)
+        instance.worker_address = worker_address
         return instance
 
     def to_stake_info(self) -> Tuple[int, int, int]:
@@ -480,6 +484,10 @@ class Stake:
 
 
 class WorkTracker:
+    """
+    Confirms the worker's activity as soon as the blockchain interface's block head watcher
+    sees the period roll over; a slow looping call remains as a fallback.
+    """
 
     CLOCK = reactor
     REFRESH_RATE = 60 * 15  # Fifteen minutes
@@ -499,6 +507,7 @@ class WorkTracker:
         self.__current_period = None
         self.__start_time = NOT_STAKING
         self.__uptime_period = NOT_STAKING
+        self.__period_rollover = None
         self._abort_on_error = True
 
     @property
@@ -507,6 +516,8 @@ class WorkTracker:
 
     def stop(self) -> None:
         self._tracking_task.stop()
+        if self.__period_rollover:
+            self.__period_rollover.cancel()
         self.log.info(f"STOPPED WORK TRACKING")
 
     def start(self, act_now: bool = False, force: bool = False) -> None:
@@ -525,11 +536,35 @@ class WorkTracker:
 
         d = self._tracking_task.start(interval=self._refresh_rate)
         d.addErrback(self.handle_working_errors)
+        self.__wait_for_period_rollover()
         self.log.info(f"STARTED WORK TRACKING")
 
         if act_now:
             self._do_work()
 
+    def __wait_for_period_rollover(self) -> None:
+        if self.__period_rollover:
+            self.__period_rollover.cancel()
+        period = self.__current_period
+        block_watcher = self.staking_agent.blockchain.block_watcher
+        d = block_watcher.when(lambda: self.staking_agent.get_current_period() != period)
+        d.addCallback(self.__on_period_rollover)
+        d.addErrback(self.__handle_rollover_errors)
+        self.__period_rollover = d
+
+    def __on_period_rollover(self, _result) -> None:
+        self.__period_rollover = None
+        try:
+            self._do_work()
+        finally:
+            if self._tracking_task.running:
+                self.__wait_for_period_rollover()
+
+    def __handle_rollover_errors(self, failure) -> None:
+        if failure.check(CancelledError):
+            return
+        self.handle_working_errors(failure)
+
     def _crash_gracefully(self, failure=None) -> None:
         """
         A facility for crashing more gracefully in the event that
@@ -571,6 +606,44 @@ class WorkTracker:
             self.worker.confirm_activity()  # < --- blockchain WRITE
 
 
+class StakerSnapshotTracker:
+    """
+    Keeps a staking agent's staker snapshot current by checking, in a worker thread, whether
+    the period has rolled over or relevant staking events were emitted, so that sampling
+    seldom has to wait on that check.  Staker data itself is only read when it is requested.
+    """
+
+    CLOCK = reactor
+    REFRESH_RATE = 60  # One minute
+
+    def __init__(self, staking_agent: StakingEscrowAgent, refresh_rate: int = None):
+        self.log = Logger('staker-snapshot-tracker')
+        self.staking_agent = staking_agent
+        self._refresh_rate = refresh_rate or self.REFRESH_RATE
+        self._tracking_task = task.LoopingCall(self._refresh)
+        self._tracking_task.clock = self.CLOCK
+
+    def start(self, now: bool = True) -> None:
+        if self._tracking_task.running:
+            return
+        d = self._tracking_task.start(interval=self._refresh_rate, now=now)
+        d.addErrback(self.handle_tracking_errors)
+        self.log.info("STARTED STAKER SNAPSHOT TRACKING")
+
+    def stop(self) -> None:
+        if self._tracking_task.running:
+            self._tracking_task.stop()
+            self.log.info("STOPPED STAKER SNAPSHOT TRACKING")
+
+    def handle_tracking_errors(self, failure) -> None:
+        self.log.warn(f"Unhandled error during staker snapshot tracking: {failure.getTraceback()}")
+
+    def _refresh(self):
+        d = threads.deferToThread(self.staking_agent.get_staker_snapshot)
+        d.addErrback(self.handle_tracking_errors)  # Keep tracking through transient provider errors
+        return d
+
+
 class StakeList(UserList):
 
     @validate_checksum_address
@@ -595,6 +668,8 @@ class StakeList(UserList):
                 raise ValueError(f'{checksum_address} is not a valid EIP-55 checksum address')
         self.checksum_address = checksum_address
         self.__updated = None
+        self.__read_period = None
+        self.__scanned_block = None
 
     @property
     def updated(self) -> maya.MayaDT:
@@ -608,33 +683,61 @@ class StakeList(UserList):
     def terminal_period(self) -> int:
         return self.__terminal_period
 
-    @validate_checksum_address
-    def refresh(self) -> None:
-        """Public staking cache invalidation method"""
-        return self.__read_stakes()
+    def refresh(self, force: bool = False) -> None:
+        """
+        Public staking cache invalidation method.  Stakes are only re-read if the period changed or
+        the staker had on-chain activity since the last read, unless `force` is passed.
+        """
+        return self.__read_stakes(force=force)
 
-    def __read_stakes(self) -> None:
+    def __is_stale(self, current_period: int, latest_block: int) -> bool:
+        if self.__read_period != current_period or self.__scanned_block is None:
+            return True
+        if latest_block <= self.__scanned_block:
+            return False
+        event_block = self.staking_agent.get_latest_staker_event_block(staker_address=self.checksum_address,
+                                                                       from_block=self.__scanned_block + 1,
+                                                                       to_block=latest_block)
+        return event_block is not None
+
+    def __read_stakes(self, force: bool = False) -> None:
         """Rewrite the local staking cache by reading on-chain stakes"""
 
         existing_records = len(self)
 
         # Candidate replacement cache values
         current_period = self.staking_agent.get_current_period()
+        latest_block = self.staking_agent.blockchain.client.block_number
+        if not force and not self.__is_stale(current_period=current_period, latest_block=latest_block):
+            self.__scanned_block = latest_block
+            self.__updated = maya.now()
+            return
         onchain_stakes, initial_period, terminal_period = list(), 0, current_period
 
-        # Read from blockchain
+        # Read from blockchain, in batches
+        worker_address = self.staking_agent.get_worker_from_staker(staker_address=self.checksum_address)
         stakes_reader = self.staking_agent.get_all_stakes(staker_address=self.checksum_address)
+        changed_records = abs(existing_records - len(stakes_reader))
         for onchain_index, stake_info in enumerate(stakes_reader):
 
             if not stake_info:
                 onchain_stake = EMPTY_STAKING_SLOT
 
             else:
-                onchain_stake = Stake.from_stake_info(checksum_address=self.checksum_address,
-                                                      stake_info=stake_info,
-                                                      staking_agent=self.staking_agent,
-                                                      index=onchain_index,
-                                                      economics=self.economics)
+                cached_stake = self.data[onchain_index] if onchain_index < existing_records else None
+                if cached_stake and cached_stake is not EMPTY_STAKING_SLOT \
+                        and cached_stake.to_stake_info() == tuple(stake_info) \
+                        and cached_stake.worker_address == worker_address:
+                    onchain_stake = cached_stake  # Unchanged
+                else:
+                    if onchain_index < existing_records:
+                        changed_records += 1
+                    onchain_stake = Stake.from_stake_info(checksum_address=self.checksum_address,
+                                                          stake_info=stake_info,
+                                                          staking_agent=self.staking_agent,
+                                                          index=onchain_index,
+                                                          economics=self.economics,
+                                                          worker_address=worker_address)
 
                 # rack the earliest terminal period
                 if onchain_stake.first_locked_period:
@@ -653,8 +756,9 @@ class StakeList(UserList):
         if onchain_stakes:
             self.__initial_period = initial_period
             self.__terminal_period = terminal_period
-            changed_records = abs(existing_records - len(onchain_stakes))
             self.log.debug(f"Updated {changed_records} local staking cache entries.")
+        self.__read_period = current_period
+        self.__scanned_block = latest_block
 
         # Record most recent cache update
         self.__updated = maya.now()
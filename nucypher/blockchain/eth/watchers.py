@@ -0,0 +1,213 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+from twisted.internet import reactor
+from twisted.internet.defer import Deferred
+from twisted.logger import Logger
+from twisted.python.failure import Failure
+from web3 import Web3
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+
+class BlockHeadWatcher:
+    """
+    Follows the chain head on behalf of every waiter in the process.
+
+    A single background thread reads the head, from a new-block filter when the provider
+    supports one or by polling the block number otherwise, and wakes all waiters each time
+    it advances. The thread only runs while someone is waiting.
+    """
+
+    POLL_INTERVAL = 1  # seconds
+
+    def __init__(self, w3: Web3, poll_interval: float = None):
+        self.log = Logger('block-head-watcher')
+        self.w3 = w3
+        self.poll_interval = poll_interval or self.POLL_INTERVAL
+
+        self.__condition = threading.Condition()
+        self.__thread = None
+        self.__head = None
+        self.__block_filter = None
+        self.__waiters = 0
+        self.__pending = list()         # (predicate, deferred) pairs for reactor-driven waiters
+        self.__unchecked_pending = False
+
+    @property
+    def head(self) -> Optional[int]:
+        """The last block number seen by the watcher, if any"""
+        return self.__head
+
+    @property
+    def running(self) -> bool:
+        return self.__thread is not None
+
+    def __ensure_running(self) -> None:
+        # Caller holds the condition
+        if self.__thread is None:
+            self.__thread = threading.Thread(target=self.__watch, name='block-head-watcher', daemon=True)
+            self.__thread.start()
+
+    def __read_head(self) -> Optional[int]:
+        """Returns the current block number, or None if the new-block filter reports no new blocks"""
+        if self.__block_filter is None:
+            try:
+                self.__block_filter = self.w3.eth.filter('latest')
+            except (ValueError, NotImplementedError):
+                self.log.debug("Provider does not support block filters; polling the block number instead")
+                self.__block_filter = False
+        if self.__block_filter:
+            try:
+                if not self.__block_filter.get_new_entries():
+                    return None
+            except ValueError:
+                self.__block_filter = None  # The node dropped the filter; install a new one next time
+        return self.w3.eth.blockNumber
+
+    def __watch(self) -> None:
+        while True:
+            with self.__condition:
+                if not self.__waiters and not self.__pending:
+                    self.__thread = None
+                    return
+                check_pending = self.__unchecked_pending
+                self.__unchecked_pending = False
+
+            try:
+                head = self.__read_head()
+            except Exception as e:
+                self.log.warn(f"Failed to read the chain head: {e}")
+                head = None
+
+            if head is not None and head != self.__head:
+                with self.__condition:
+                    self.__head = head
+                    self.__condition.notify_all()
+                check_pending = True
+
+            if check_pending:
+                self.__check_pending()
+            time.sleep(self.poll_interval)
+
+    def __check_pending(self) -> None:
+        with self.__condition:
+            pending = list(self.__pending)
+        for predicate, d in pending:
+            try:
+                result = predicate()
+            except Exception:
+                result, failure = None, Failure()
+            else:
+                failure = None
+            if not (result or failure):
+                continue
+            with self.__condition:
+                if (predicate, d) not in self.__pending:
+                    continue  # Cancelled while the predicate was being evaluated
+                self.__pending.remove((predicate, d))
+            reactor.callFromThread(self.__fire, d, failure or result)
+
+    @staticmethod
+    def __fire(d: Deferred, result) -> None:
+        if d.called:
+            return  # Cancelled after the predicate was met, but before the reactor got to it
+        if isinstance(result, Failure):
+            d.errback(result)
+        else:
+            d.callback(result)
+
+    def __cancel(self, d: Deferred) -> None:
+        with self.__condition:
+            self.__pending = [(predicate, pending) for predicate, pending in self.__pending if pending is not d]
+
+    #
+    # Blocking waits
+    #
+
+    def wait_for(self, predicate: Callable, timeout: float = None):
+        """Blocks until `predicate` returns a truthy value, re-evaluating it each time the head advances"""
+        deadline = time.monotonic() + timeout if timeout else None
+        with self.__condition:
+            self.__waiters += 1
+            self.__ensure_running()
+        try:
+            while True:
+                seen_head = self.__head
+                result = predicate()
+                if result:
+                    return result
+                with self.__condition:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeExhausted(f"Condition not met after {timeout} seconds")
+                    self.__condition.wait_for(lambda: self.__head != seen_head, timeout=remaining)
+        finally:
+            with self.__condition:
+                self.__waiters -= 1
+
+    def wait_for_next_block(self, timeout: float = None) -> bool:
+        """Blocks until the head advances; returns False if `timeout` passed first"""
+        with self.__condition:
+            seen_head = self.__head
+            self.__waiters += 1
+            self.__ensure_running()
+            try:
+                return self.__condition.wait_for(lambda: self.__head not in (seen_head, None), timeout=timeout)
+            finally:
+                self.__waiters -= 1
+
+    def __get_receipt(self, transaction_hash) -> Optional[dict]:
+        try:
+            return self.w3.eth.getTransactionReceipt(transaction_hash)
+        except TransactionNotFound:
+            return None
+
+    def __is_confirmed(self, receipt: dict, confirmations: int) -> bool:
+        return self.w3.eth.blockNumber - receipt['blockNumber'] >= confirmations
+
+    def wait_for_receipt(self, transaction_hash, timeout: float = None) -> dict:
+        return self.wait_for(lambda: self.__get_receipt(transaction_hash), timeout=timeout)
+
+    def wait_for_confirmations(self, receipt: dict, confirmations: int, timeout: float = None) -> dict:
+        self.wait_for(lambda: self.__is_confirmed(receipt, confirmations), timeout=timeout)
+        return receipt
+
+    #
+    # Deferred waits
+    #
+
+    def when(self, predicate: Callable) -> Deferred:
+        """
+        Returns a Deferred that fires, on the reactor thread, with the first truthy result of `predicate`.
+        Cancelling the Deferred stops the watcher from evaluating `predicate`.
+        """
+        d = Deferred(canceller=self.__cancel)
+        with self.__condition:
+            self.__pending.append((predicate, d))
+            self.__unchecked_pending = True
+            self.__ensure_running()
+        return d
+
+    def when_receipt(self, transaction_hash) -> Deferred:
+        return self.when(lambda: self.__get_receipt(transaction_hash))
+
+    def when_confirmed(self, receipt: dict, confirmations: int) -> Deferred:
+        return self.when(lambda: self.__is_confirmed(receipt, confirmations) and receipt)
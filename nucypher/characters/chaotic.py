@@ -2,6 +2,7 @@ import json
 import os
 from datetime import datetime, timedelta
 from decimal import Decimal
+from typing import Any, List, Tuple
 
 import eth_utils
 import math
@@ -307,34 +308,54 @@ class Felix(Character, NucypherTokenActor):
 
         return int(amount)
 
-    def __transfer(self, disbursement: int, recipient_address: str) -> str:
-        """Perform a single token transfer transaction from one account to another."""
+    def __transfer(self, disbursements: List[Tuple[Any, int]]) -> List[str]:
+        """
+        Perform a batch of token transfer transactions, pipelined, from Felix to each recipient,
+        recording every disbursement as soon as its transfer succeeds.
+        """
 
         # Re-unlock from cache
         self.blockchain.transacting_power.activate()
 
-        self.__disbursement += 1
-        receipt = self.token_agent.transfer(amount=disbursement,
-                                            target_address=recipient_address,
-                                            sender_address=self.checksum_address)
-        txhash = receipt['transactionHash']
-        if self.distribute_ether:
-            ether = self.ETHER_AIRDROP_AMOUNT
-            transaction = {'to': recipient_address,
-                           'from': self.checksum_address,
-                           'value': ether,
-                           'gasPrice': self.blockchain.client.gas_price}
-            ether_txhash = self.blockchain.client.send_transaction(transaction)
-
-            self.log.info(f"Disbursement #{self.__disbursement} OK | NU {txhash.hex()[-6:]} | ETH {ether_txhash.hex()[:-6]} "
-                          f"({str(NU(disbursement, 'NuNit'))} + {self.ETHER_AIRDROP_AMOUNT} wei) -> {recipient_address}")
+        txhashes = list()
 
-        else:
-            self.log.info(
-                f"Disbursement #{self.__disbursement} OK | {txhash.hex()[-6:]} |"
-                f"({str(NU(disbursement, 'NuNit'))} -> {recipient_address}")
-                
-        return txhash
+        def record_disbursement(index: int, receipt: dict) -> None:
+            recipient, disbursement = disbursements[index]
+            self.__disbursement += 1
+            txhash = receipt['transactionHash']
+            if self.distribute_ether:
+                ether = self.ETHER_AIRDROP_AMOUNT
+                transaction = {'to': recipient.address,
+                               'from': self.checksum_address,
+                               'value': ether,
+                               'gasPrice': self.blockchain.client.gas_price}
+                ether_txhash = self.blockchain.client.send_transaction(transaction)
+
+                self.log.info(f"Disbursement #{self.__disbursement} OK | NU {txhash.hex()[-6:]} | ETH {ether_txhash.hex()[:-6]} "
+                              f"({str(NU(disbursement, 'NuNit'))} + {self.ETHER_AIRDROP_AMOUNT} wei) -> {recipient.address}")
+
+            else:
+                self.log.info(
+                    f"Disbursement #{self.__disbursement} OK | {txhash.hex()[-6:]} |"
+                    f"({str(NU(disbursement, 'NuNit'))} -> {recipient.address}")
+
+            self.__distributed += disbursement
+
+            # Update the database record
+            recipient.last_disbursement_amount = str(disbursement)
+            recipient.total_received = str(int(recipient.total_received) + disbursement)
+            recipient.last_disbursement_time = datetime.now()
+
+            self.db.session.add(recipient)
+            self.db.session.commit()
+            txhashes.append(txhash)
+
+        self.token_agent.batch_transfer(transfers=[(recipient.address, disbursement)
+                                                   for recipient, disbursement in disbursements],
+                                        sender_address=self.checksum_address,
+                                        window=self.BATCH_SIZE,
+                                        on_receipt=record_disbursement)
+        return txhashes
 
     def airdrop_tokens(self):
         """
@@ -419,19 +440,8 @@ class Felix(Character, NucypherTokenActor):
         for batch, staged_disbursement in enumerate(batches, start=1):
             self.log.info(f"======= Batch #{batch} ========")
 
-            for recipient, disbursement in staged_disbursement:
-
-                # Perform the transfer... leaky faucet.
-                self.__transfer(disbursement=disbursement, recipient_address=recipient.address)
-                self.__distributed += disbursement
-
-                # Update the database record
-                recipient.last_disbursement_amount = str(disbursement)
-                recipient.total_received = str(int(recipient.total_received) + disbursement)
-                recipient.last_disbursement_time = datetime.now()
-
-                self.db.session.add(recipient)
-                self.db.session.commit()
+            # Perform the batch of transfers... leaky faucet.
+            self.__transfer(disbursements=staged_disbursement)
 
             # end inner loop
             self.log.info(f"Completed Airdrop #{self.__airdrop} Batch #{batch} of {total_batches}.")
@@ -53,11 +53,13 @@ from nucypher.characters.control.controllers import (
 )
 from nucypher.characters.control.interfaces import AliceInterface, BobInterface, EnricoInterface
 from nucypher.config.storages import NodeStorage, ForgetfulNodeStorage
-from nucypher.crypto.api import keccak_digest, encrypt_and_sign
+from nucypher.crypto.api import encrypt_and_sign
 from nucypher.crypto.constants import PUBLIC_KEY_LENGTH, PUBLIC_ADDRESS_LENGTH
 from nucypher.crypto.kits import UmbralMessageKit
 from nucypher.crypto.powers import SigningPower, DecryptingPower, DelegatingPower, TransactingPower, PowerUpError
 from nucypher.crypto.signing import InvalidSignature
+from nucypher.crypto.utils import construct_map_id, construct_policy_hrac
+from nucypher.crypto.workers import CryptoWorkerPool
 from nucypher.datastore.keypairs import HostingKeypair
 from nucypher.datastore.threading import ThreadedSession
 from nucypher.network.exceptions import NodeSeemsToBeDown
@@ -102,6 +104,9 @@ class Alice(Character, BlockchainPolicyAuthor):
                  network_middleware: RestMiddleware = None,
                  controller: bool = True,
 
+                 # Crypto
+                 crypto_workers: CryptoWorkerPool = None,
+
                  *args, **kwargs) -> None:
 
         #
@@ -109,6 +114,7 @@ class Alice(Character, BlockchainPolicyAuthor):
         #
 
         self.timeout = timeout
+        self.crypto_workers = crypto_workers  # Grants are encrypted serially without a worker pool
 
         if is_me:
             self.m = m
@@ -444,6 +450,8 @@ class Bob(Character):
         from nucypher.policy.collections import WorkOrderHistory  # Need a bigger strategy to avoid circulars.
         self._completed_work_orders = WorkOrderHistory()
 
+        self.__policy_identifiers = dict()  # (Alice's verifying key, label) -> (HRAC, map ID)
+
         self.log = Logger(self.__class__.__name__)
         self.log.info(self.banner)
 
@@ -547,13 +555,18 @@ class Bob(Character):
         return partial(self.verify_from, alice, decrypt=True)
 
     def construct_policy_hrac(self, verifying_key: Union[bytes, UmbralPublicKey], label: bytes) -> bytes:
-        _hrac = keccak_digest(bytes(verifying_key) + self.stamp + label)
+        _hrac = construct_policy_hrac(bytes(verifying_key), bytes(self.stamp), label)
         return _hrac
 
     def construct_hrac_and_map_id(self, verifying_key, label):
-        hrac = self.construct_policy_hrac(verifying_key, label)
-        map_id = keccak_digest(bytes(verifying_key) + hrac).hex()
-        return hrac, map_id
+        key = (bytes(verifying_key), label)
+        try:
+            return self.__policy_identifiers[key]
+        except KeyError:
+            hrac = self.construct_policy_hrac(verifying_key, label)
+            map_id = construct_map_id(bytes(verifying_key), hrac)
+            self.__policy_identifiers[key] = hrac, map_id
+            return hrac, map_id
 
     def get_treasure_map_from_known_ursulas(self, network_middleware, map_id):
         """
@@ -797,12 +810,9 @@ class Bob(Character):
                     try:
                         capsule.attach_cfrag(pre_task.cfrag)
                     except UmbralCorrectnessError:
-                        task = work_order.tasks[0]
                         # TODO: WARNING - This block is untested.
-                        from nucypher.policy.collections import IndisputableEvidence
-                        evidence = IndisputableEvidence(task=task, work_order=work_order)
                         # I got a lot of problems with you people ...
-                        the_airing_of_grievances.append(evidence)
+                        the_airing_of_grievances.append((pre_task, work_order))
 
                     if len(capsule) >= m:
                         capsules_to_activate.discard(capsule)
@@ -816,7 +826,9 @@ class Bob(Character):
 
             if the_airing_of_grievances:
                 # ... and now you're gonna hear about it!
-                raise self.IncorrectCFragsReceived(the_airing_of_grievances)
+                from nucypher.policy.collections import IndisputableEvidence
+                evidence = IndisputableEvidence.from_tasks(the_airing_of_grievances)
+                raise self.IncorrectCFragsReceived(evidence)
                 # TODO: Find a better strategy for handling incorrect CFrags #500
                 #  - There maybe enough cfrags to still open the capsule
                 #  - This line is unreachable when NotEnoughUrsulas
@@ -16,6 +16,8 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 """
 
+import os
+
 import click
 import maya
 
@@ -29,6 +31,7 @@ from nucypher.blockchain.eth.interfaces import BlockchainInterfaceFactory
 from nucypher.blockchain.eth.registry import InMemoryContractRegistry, LocalContractRegistry
 from nucypher.blockchain.eth.utils import datetime_at_period
 from nucypher.characters.banners import NU_BANNER
+from nucypher.config.constants import DEFAULT_CONFIG_ROOT
 from nucypher.cli.actions import get_provider_process
 from nucypher.cli.config import group_general_config
 from nucypher.cli.options import (
@@ -136,7 +139,7 @@ def stakers(general_config, registry_options, staking_address):
     staking_agent = ContractAgency.get_agent(StakingEscrowAgent, registry=registry)
     policy_agent = ContractAgency.get_agent(PolicyManagerAgent, registry=registry)
 
-    stakers_list = [staking_address] if staking_address else staking_agent.get_stakers()
+    stakers_list = [staking_address] if staking_address else staking_agent.get_staker_snapshot().stakers
     paint_stakers(emitter=emitter, stakers=stakers_list, staking_agent=staking_agent, policy_agent=policy_agent)
 
 
@@ -161,15 +164,21 @@ def locked_tokens(general_config, registry_options, periods):
 @option_event_name
 @click.option('--from-block', help="Collect events from this block number", type=click.INT)
 @click.option('--to-block', help="Collect events until this block number", type=click.INT)
+@click.option('--index-events', help="Serve events from a local index, syncing new blocks incrementally",
+              is_flag=True, envvar='NUCYPHER_INDEX_EVENTS')
 # TODO: Add options for number of periods in the past (default current period), or range of blocks
 # TODO: Add way to input additional event filters? (e.g., staker, etc)
-def events(general_config, registry_options, contract_name, from_block, to_block, event_name):
+def events(general_config, registry_options, contract_name, from_block, to_block, index_events, event_name):
     """
     Show events associated to NuCypher contracts
     """
     emitter = _setup_emitter(general_config)
     registry = registry_options.get_registry(emitter, general_config.debug)
     blockchain = BlockchainInterfaceFactory.get_interface(provider_uri=registry_options.provider_uri)
+    if index_events and blockchain.event_index is None:
+        os.makedirs(DEFAULT_CONFIG_ROOT, exist_ok=True)
+        db_filepath = os.path.join(DEFAULT_CONFIG_ROOT, f'events-{blockchain.client.chain_id}.db')
+        blockchain.enable_event_index(db_filepath=db_filepath)
 
     if not contract_name:
         if event_name:
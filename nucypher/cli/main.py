@@ -17,16 +17,58 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 
-import click
+import importlib
 
-from nucypher.cli.commands import ursula, alice, bob, enrico, felix, stake, status, worklock
-from nucypher.cli.painting import echo_version
+import click
 
-
-@click.group()
-@click.option('--version', help="Echo the CLI version", is_flag=True, callback=echo_version, expose_value=False, is_eager=True)
-def nucypher_cli():
-    pass
+from nucypher.characters.banners import NUCYPHER_BANNER
+
+
+class LazyCommandGroup(click.Group):
+    """
+    A command group whose sub-commands are given as ('module:attribute', short help) pairs and
+    only imported when invoked, so that running one command, or listing them all in the help
+    text, does not pay for importing the blockchain and network stacks of all the others.
+    """
+
+    def __init__(self, *args, lazy_commands: dict = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands or {})
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx, name):
+        if name not in self.commands and name in self.lazy_commands:
+            import_path, _short_help = self.lazy_commands[name]
+            module_path, attribute = import_path.split(':')
+            command = getattr(importlib.import_module(module_path), attribute)
+            self.add_command(command, name=name)
+        return super().get_command(ctx, name)
+
+    def format_commands(self, ctx, formatter):
+        """Lists the sub-commands without importing the ones that were not used yet"""
+        names = [name for name in self.list_commands(ctx)
+                 if name in self.lazy_commands or not self.commands[name].hidden]
+        if not names:
+            return
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = list()
+        for name in names:
+            if name in self.commands:
+                short_help = self.commands[name].get_short_help_str(limit)
+            else:
+                _import_path, short_help = self.lazy_commands[name]
+            rows.append((name, short_help))
+        with formatter.section('Commands'):
+            formatter.write_dl(rows)
+
+
+def echo_version(ctx, param, value):
+    if not value or ctx.resilient_parsing:
+        return
+    click.secho(NUCYPHER_BANNER, bold=True)
+    ctx.exit()
 
 
 #
@@ -50,25 +92,38 @@ stdin --> cli.main --- alice
 
 New character CLI modules must be added here
 for the entry point to be attached to the nucypher base command.
+Entry points are imported on first use, so adding one here does not
+slow down the others; their short help is listed here for the same reason.
 
 Inversely, commenting out an entry point here will disable it.
 """
 
-ENTRY_POINTS = (
+ENTRY_POINTS = {
 
     # Utility Commands
-    status.status,  # Network Status
-    # device.device,  # TODO: nucypher device  # Hardware Wallet Management
+    'status': ('nucypher.cli.commands.status:status',  # Network Status
+               'Echo a snapshot of live NuCypher Network metadata.'),
+    # 'device': ('nucypher.cli.commands.device:device', ''),  # TODO: nucypher device  # Hardware Wallet Management
 
     # Characters
-    alice.alice,  # Author of Policies
-    bob.bob,  # Builder of Capsules
-    enrico.enrico,  # Encryptor of Data
-    stake.stake,  # Stake Management
-    ursula.ursula,  # Untrusted Re-Encryption Proxy
-    felix.felix,    # Faucet
-    worklock.worklock  # WorkLock
-)
-
-for entry_point in ENTRY_POINTS:
-    nucypher_cli.add_command(entry_point)
+    'alice': ('nucypher.cli.commands.alice:alice',  # Author of Policies
+              '"Alice the Policy Authority" management commands.'),
+    'bob': ('nucypher.cli.commands.bob:bob',  # Builder of Capsules
+            '"Bob the Data Recipient" management commands.'),
+    'enrico': ('nucypher.cli.commands.enrico:enrico',  # Encryptor of Data
+               '"Enrico the Encryptor" management commands.'),
+    'stake': ('nucypher.cli.commands.stake:stake',  # Stake Management
+              'Manage stakes and other staker-related operations.'),
+    'ursula': ('nucypher.cli.commands.ursula:ursula',  # Untrusted Re-Encryption Proxy
+               '"Ursula the Untrusted" PRE Re-encryption node management commands.'),
+    'felix': ('nucypher.cli.commands.felix:felix',  # Faucet
+              '"Felix the Faucet" management commands.'),
+    'worklock': ('nucypher.cli.commands.worklock:worklock',  # WorkLock
+                 "Participate in NuCypher's WorkLock to obtain NU tokens")
+}
+
+
+@click.group(cls=LazyCommandGroup, lazy_commands=ENTRY_POINTS)
+@click.option('--version', help="Echo the CLI version", is_flag=True, callback=echo_version, expose_value=False, is_eager=True)
+def nucypher_cli():
+    pass
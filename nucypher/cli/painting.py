@@ -43,18 +43,11 @@ from nucypher.blockchain.eth.registry import BaseContractRegistry
 from nucypher.blockchain.eth.sol import SOLIDITY_COMPILER_VERSION
 from nucypher.blockchain.eth.token import NU
 from nucypher.blockchain.eth.utils import datetime_at_period, etherscan_url, prettify_eth_amount
-from nucypher.characters.banners import NUCYPHER_BANNER, NU_BANNER
+from nucypher.characters.banners import NU_BANNER
 from nucypher.config.constants import SEEDNODES
 from nucypher.network.nicknames import nickname_from_seed
 
 
-def echo_version(ctx, param, value):
-    if not value or ctx.resilient_parsing:
-        return
-    click.secho(NUCYPHER_BANNER, bold=True)
-    ctx.exit()
-
-
 def paint_new_installation_help(emitter, new_configuration):
     character_config_class = new_configuration.__class__
     character_name = character_config_class._NAME.lower()
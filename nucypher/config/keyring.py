@@ -19,6 +19,7 @@ import contextlib
 import json
 import os
 import stat
+import weakref
 from json import JSONDecodeError
 from os.path import abspath
 from typing import ClassVar, Tuple, Callable, Union, Dict, List
@@ -378,6 +379,7 @@ class NucypherKeyring:
 
         # Set Initial State
         self.__derived_key_material = KEYRING_LOCKED
+        self.__derived_powers = weakref.WeakSet()  # Derived powers holding label secrets until lock
 
     def __del__(self) -> None:
         self.lock()
@@ -457,6 +459,8 @@ class NucypherKeyring:
     def lock(self) -> bool:
         """Make efforts to remove references to the cached key data"""
         self.__derived_key_material = KEYRING_LOCKED
+        for derived_power in list(self.__derived_powers):
+            derived_power.lock()
         return self.is_unlocked
 
     def unlock(self, password: str) -> bool:
@@ -505,6 +509,7 @@ class NucypherKeyring:
             wrap_key = _derive_wrapping_key_from_key_material(salt=key_data['wrap_salt'], key_material=self.__derived_key_material)
             keying_material = SecretBox(wrap_key).decrypt(key_data['key'])
             new_cryptopower = power_class(keying_material=keying_material)
+            self.__derived_powers.add(new_cryptopower)
 
         else:
             failure_message = "{} is an invalid type for deriving a CryptoPower.".format(power_class.__name__)
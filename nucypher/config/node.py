@@ -84,6 +84,7 @@ class CharacterConfiguration(BaseConfiguration):
                  learn_on_same_thread: bool = False,
                  abort_on_learning_error: bool = False,
                  start_learning_now: bool = True,
+                 lazy_warm_start: bool = False,
 
                  # Network
                  controller_port: int = None,
@@ -152,6 +153,7 @@ class CharacterConfiguration(BaseConfiguration):
         self.learn_on_same_thread = learn_on_same_thread
         self.abort_on_learning_error = abort_on_learning_error
         self.start_learning_now = start_learning_now
+        self.lazy_warm_start = lazy_warm_start
         self.save_metadata = save_metadata
         self.reload_metadata = reload_metadata
         self.known_nodes = known_nodes or set()  # handpicked
@@ -355,6 +357,7 @@ class CharacterConfiguration(BaseConfiguration):
             learn_on_same_thread=self.learn_on_same_thread,
             abort_on_learning_error=self.abort_on_learning_error,
             start_learning_now=self.start_learning_now,
+            lazy_warm_start=self.lazy_warm_start,
             save_metadata=self.save_metadata,
             node_storage=self.node_storage.payload(),
         )
@@ -15,19 +15,27 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import atexit
 import binascii
 import os
+import shutil
 import sqlite3
+import struct
 import tempfile
+import threading
 from abc import abstractmethod, ABC
+from contextlib import contextmanager, suppress
 from typing import Callable, Tuple, Union, Set, Any
 
 import OpenSSL
+from bytestring_splitter import VariableLengthBytestring
+from constant_sorrow.constants import NEVER_SEEN
 from cryptography import x509
 from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.serialization import Encoding
 from cryptography.x509 import Certificate, NameOID
-from eth_utils import is_checksum_address
+from eth_utils import is_checksum_address, to_canonical_address, to_checksum_address
 from twisted.logger import Logger
 
 from nucypher.blockchain.eth.decorators import validate_checksum_address
@@ -43,6 +51,7 @@ class NodeStorage(ABC):
     NODE_DESERIALIZER = binascii.unhexlify
     TLS_CERTIFICATE_ENCODING = Encoding.PEM
     TLS_CERTIFICATE_EXTENSION = '.{}'.format(TLS_CERTIFICATE_ENCODING.name.lower())
+    TLS_CERTIFICATE_FINGERPRINT_ALGORITHM = hashes.SHA256()
 
     class NodeStorageError(Exception):
         pass
@@ -67,6 +76,11 @@ class NodeStorage(ABC):
         self.federated_only = federated_only
         self.character_class = character_class or Ursula
 
+        # Certificate write coalescing
+        self.__certificate_fingerprints = dict()  # certificate filepath -> fingerprint
+        self.__batch_depth = 0
+        self.__unsynced_certificates = list()  # Filepaths written within the current batch
+
     def __getitem__(self, item):
         return self.get(checksum_address=item, federated_only=self.federated_only)
 
@@ -115,16 +129,77 @@ class NodeStorage(ABC):
         if force is False and certificate_already_exists:
             raise FileExistsError('A TLS certificate already exists at {}.'.format(certificate_filepath))
 
+        # Skip identical certificates
+        fingerprint = certificate.fingerprint(self.TLS_CERTIFICATE_FINGERPRINT_ALGORITHM)
+        public_pem_bytes = certificate.public_bytes(self.TLS_CERTIFICATE_ENCODING)
+        if certificate_already_exists:
+            if certificate_filepath not in self.__certificate_fingerprints:
+                with open(certificate_filepath, 'rb') as certificate_file:
+                    if certificate_file.read() == public_pem_bytes:
+                        self.__certificate_fingerprints[certificate_filepath] = fingerprint
+            if self.__certificate_fingerprints.get(certificate_filepath) == fingerprint:
+                return certificate_filepath
+
         # Write
         os.makedirs(os.path.dirname(certificate_filepath), exist_ok=True)
-        with open(certificate_filepath, 'wb') as certificate_file:
-            public_pem_bytes = certificate.public_bytes(self.TLS_CERTIFICATE_ENCODING)
+        temp_filepath = f'{certificate_filepath}.tmp'
+        with open(temp_filepath, 'wb') as certificate_file:
             certificate_file.write(public_pem_bytes)
+            if not self._batching:
+                certificate_file.flush()
+                os.fsync(certificate_file.fileno())
+        os.replace(temp_filepath, certificate_filepath)
+        self.__certificate_fingerprints[certificate_filepath] = fingerprint
+        if self._batching:
+            self.__unsynced_certificates.append(certificate_filepath)
 
         self.log.debug(f"Saved TLS certificate for {checksum_address}: {certificate_filepath}")
 
         return certificate_filepath
 
+    @contextmanager
+    def batch(self):
+        """
+        Coalesce the writes of many nodes, such as those of a learning round:
+        Within the batch, certificates are written without being individually synced,
+        and the batch's files and their directories are synced once when the batch ends.  Storage backends
+        may also buffer node metadata until the end of the batch.
+        """
+        self.__batch_depth += 1
+        try:
+            yield
+        finally:
+            self.__batch_depth -= 1
+            if not self.__batch_depth:
+                self._flush_batch()
+
+    @property
+    def _batching(self) -> bool:
+        return bool(self.__batch_depth)
+
+    @staticmethod
+    def __fsync_path(path: str) -> None:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return  # Gone already, or directories can't be opened on this platform
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass  # Directories can't be synced on this platform
+        finally:
+            os.close(fd)
+
+    def _flush_batch(self) -> None:
+        if self.__unsynced_certificates:
+            certificate_filepaths = list(dict.fromkeys(self.__unsynced_certificates))
+            for certificate_filepath in certificate_filepaths:
+                self.__fsync_path(certificate_filepath)
+            for directory in dict.fromkeys(os.path.dirname(filepath) for filepath in certificate_filepaths):
+                self.__fsync_path(directory)  # Persists the renames
+            self.log.debug(f"Synced a batch of {len(certificate_filepaths)} TLS certificates")
+            self.__unsynced_certificates = list()  # Filepaths written within the current batch
+
     @abstractmethod
     def store_node_certificate(self, certificate: Certificate) -> str:
         raise NotImplementedError
@@ -275,9 +350,25 @@ class ForgetfulNodeStorage(NodeStorage):
         return not bool(self.__metadata or self.__certificates)
 
 
+class InMemoryNodeStorage(ForgetfulNodeStorage):
+    """
+    Forgetful storage of node metadata which leaves nothing behind on the filesystem.
+    TLS connections to stored nodes need their certificates as files, so those are kept
+    in a temporary directory which is removed when the process exits.
+    """
+    _name = ':memory-only:'
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        atexit.register(shutil.rmtree, self._temp_certificates_dir, ignore_errors=True)
+
+
 class SQLiteForgetfulNodeStorage(ForgetfulNodeStorage):
     """
-    SQLite forgetful storage of node metadata
+    SQLite storage of node status, alongside forgetful storage of node metadata.
+
+    The node status table is kept across restarts and uses write-ahead logging,
+    so that status dashboards can query it concurrently with the learner.
     """
     _name = 'sqlite'
     DB_FILE_NAME = 'nodes.sqlite'
@@ -286,24 +377,41 @@ class SQLiteForgetfulNodeStorage(ForgetfulNodeStorage):
     NODE_DB_NAME = 'node_info'
     NODE_DB_SCHEMA = [('staker_address', 'text primary key'), ('rest_url', 'text'), ('nickname', 'text'),
                       ('timestamp', 'text'), ('last_seen', 'text'), ('fleet_state_icon', 'text')]
+    NODE_DB_INDEXES = ('last_seen', )  # staker_address is indexed as the primary key
 
     def __init__(self, db_filepath: str = DEFAULT_DB_FILEPATH, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.db_filepath = db_filepath
-        self.db_conn = sqlite3.connect(self.db_filepath)
+        self.__db_lock = threading.Lock()
+        self.__pending_rows = dict()
+        self.db_conn = self.__connect()
         self.init_db_tables()
 
     def __del__(self):
-        try:
+        with suppress(AttributeError):
             self.db_conn.close()
-        finally:
-            if os.path.exists(self.db_filepath):
-                os.remove(self.db_filepath)
+
+    def __connect(self) -> sqlite3.Connection:
+        # The learner writes from the reactor's thread pool; Access is serialized by the lock.
+        db_conn = sqlite3.connect(self.db_filepath, check_same_thread=False)
+        if self.db_filepath != ':memory:':
+            db_conn.execute('PRAGMA journal_mode=WAL')
+        return db_conn
 
     def store_node_metadata(self, node, filepath: str = None):
-        self.__write_node_metadata(node)
+        row = self.__node_row(node)
+        if self._batching:
+            self.__pending_rows[row[0]] = row
+        else:
+            self.__write_rows([row])
         return super().store_node_metadata(node=node, filepath=filepath)
 
+    def _flush_batch(self) -> None:
+        super()._flush_batch()
+        rows, self.__pending_rows = list(self.__pending_rows.values()), dict()
+        if rows:
+            self.__write_rows(rows)
+
     @validate_checksum_address
     def remove(self,
                checksum_address: str,
@@ -312,45 +420,52 @@ class SQLiteForgetfulNodeStorage(ForgetfulNodeStorage):
                ) -> Tuple[bool, str]:
 
         if metadata is True:
-            with self.db_conn:
-                self.db_conn.execute(f"DELETE FROM {self.NODE_DB_NAME} WHERE staker_address='{checksum_address}'")
+            self.__pending_rows.pop(checksum_address, None)
+            with self.__db_lock, self.db_conn:
+                self.db_conn.execute(f"DELETE FROM {self.NODE_DB_NAME} WHERE staker_address=?", (checksum_address, ))
 
         return super().remove(checksum_address=checksum_address, metadata=metadata, certificate=certificate)
 
     def clear(self, metadata: bool = True, certificates: bool = True) -> None:
         if metadata is True:
-            with self.db_conn:
+            self.__pending_rows = dict()
+            with self.__db_lock, self.db_conn:
                 self.db_conn.execute(f"DELETE FROM {self.NODE_DB_NAME}")
 
         super().clear(metadata=metadata, certificates=certificates)
 
     def initialize(self) -> bool:
-        if os.path.exists(self.db_filepath):
-            os.remove(self.db_filepath)
-        self.db_conn = sqlite3.connect(self.db_filepath)
         self.init_db_tables()
         return super().initialize()
 
     def init_db_tables(self):
-        with self.db_conn:
-            # ensure tables are empty
-            self.db_conn.execute(f"DROP TABLE IF EXISTS {self.NODE_DB_NAME}")
-
-            # create fresh new node table (same column names as FleetStateTracker.abridged_nodes_details)
+        with self.__db_lock, self.db_conn:
+            # create the node table if needed (same column names as FleetStateTracker.abridged_nodes_details)
             node_db_schema = ", ".join(f"{schema[0]} {schema[1]}" for schema in self.NODE_DB_SCHEMA)
-            self.db_conn.execute(f"CREATE TABLE {self.NODE_DB_NAME} ({node_db_schema})")
+            self.db_conn.execute(f"CREATE TABLE IF NOT EXISTS {self.NODE_DB_NAME} ({node_db_schema})")
+            for column in self.NODE_DB_INDEXES:
+                self.db_conn.execute(f"CREATE INDEX IF NOT EXISTS {self.NODE_DB_NAME}_{column}_index "
+                                     f"ON {self.NODE_DB_NAME} ({column})")
+
+    def __node_row(self, node) -> tuple:
+        from nucypher.network.nodes import NodeSprout
+        if isinstance(node, NodeSprout):
+            # Spare the cost of maturing the sprout; Sprouts have not been seen yet.
+            node_dict = {'staker_address': node.checksum_address,
+                         'rest_url': node['rest_interface'].uri,
+                         'nickname': node.nickname,
+                         'timestamp': node.timestamp.iso8601(),
+                         'last_seen': str(NEVER_SEEN),
+                         'fleet_state_icon': '?'}
+        else:
+            node_dict = node.node_details(node=node)
+        db_row = tuple(node_dict[column] for column, _type in self.NODE_DB_SCHEMA)
+        return db_row
 
-    def __write_node_metadata(self, node):
-        node.mature()
-        node_dict = node.node_details(node=node)
-        db_row = (node_dict['staker_address'],
-                  node_dict['rest_url'],
-                  node_dict['nickname'],
-                  node_dict['timestamp'],
-                  node_dict['last_seen'],
-                  node_dict['fleet_state_icon'])
-        with self.db_conn:
-            self.db_conn.execute(f'REPLACE INTO {self.NODE_DB_NAME} VALUES(?,?,?,?,?,?)', db_row)
+    def __write_rows(self, rows) -> None:
+        placeholders = ','.join('?' * len(self.NODE_DB_SCHEMA))
+        with self.__db_lock, self.db_conn:
+            self.db_conn.executemany(f'REPLACE INTO {self.NODE_DB_NAME} VALUES({placeholders})', rows)
 
 
 class LocalFileBasedNodeStorage(NodeStorage):
@@ -606,6 +721,274 @@ class TemporaryFileBasedNodeStorage(LocalFileBasedNodeStorage):
         return bool(os.path.isdir(self.metadata_dir) and os.path.isdir(self.certificates_dir))
 
 
+class LocalIndexedNodeStorage(NodeStorage):
+    """
+    Single-file storage of node metadata and certificates.
+
+    Records are appended to one log file and indexed in memory by checksum address;
+    Superseded and removed records are reclaimed by compaction, which atomically
+    replaces the log with a rewritten copy.  All stored nodes are loaded from one
+    read, directly into node sprouts.
+
+    TLS certificates are additionally written to the certificates directory,
+    since the REST client requires a certificate filepath to connect to a node.
+    """
+
+    _name = 'indexed'
+    STORAGE_FILENAME = 'known_nodes.log'
+    COMPACTION_THRESHOLD = 0.5  # Ratio of stale bytes to total bytes that triggers compaction on load
+
+    # Record Kinds
+    _NODE = 1
+    _CERTIFICATE = 2
+    _REMOVED_NODE = 3
+    _REMOVED_CERTIFICATE = 4
+
+    # kind (1 byte), canonical address (20 bytes), payload length (4 bytes)
+    __RECORD_HEADER = struct.Struct('>B20sI')
+
+    def __init__(self,
+                 config_root: str = None,
+                 storage_root: str = None,
+                 storage_filepath: str = None,
+                 certificates_dir: str = None,
+                 *args, **kwargs
+                 ) -> None:
+
+        super().__init__(*args, **kwargs)
+        self.root_dir = storage_root or os.path.join(config_root or DEFAULT_CONFIG_ROOT, 'known_nodes')
+        self.storage_filepath = storage_filepath or os.path.join(self.root_dir, self.STORAGE_FILENAME)
+        self.certificates_dir = certificates_dir or os.path.join(self.root_dir, 'certificates')
+
+        self.__lock = threading.RLock()
+        self.__nodes = dict()          # checksum address -> (offset, length)
+        self.__certificates = dict()   # checksum address -> (offset, length)
+        self.__stale_bytes = 0
+        self.__total_bytes = 0
+        self.__loaded = False
+
+    #
+    # Log File
+    #
+
+    def __encode_record(self, kind: int, checksum_address: str, payload: bytes = b'') -> bytes:
+        header = self.__RECORD_HEADER.pack(kind, to_canonical_address(checksum_address), len(payload))
+        return header + payload
+
+    def __index_record(self, kind: int, checksum_address: str, location: Tuple[int, int], size: int) -> None:
+        index = self.__nodes if kind in (self._NODE, self._REMOVED_NODE) else self.__certificates
+        previous = index.pop(checksum_address, None)
+        if previous is not None:
+            self.__stale_bytes += self.__RECORD_HEADER.size + previous[1]
+        if kind in (self._NODE, self._CERTIFICATE):
+            index[checksum_address] = location
+        else:
+            self.__stale_bytes += size  # Tombstones are only needed until the next compaction
+        self.__total_bytes += size
+
+    def __load_index(self) -> None:
+        with self.__lock:
+            if self.__loaded:
+                return
+            self.__nodes, self.__certificates = dict(), dict()
+            self.__stale_bytes = self.__total_bytes = 0
+
+            try:
+                with open(self.storage_filepath, 'rb') as storage_file:
+                    data = storage_file.read()
+            except FileNotFoundError:
+                data = b''
+
+            offset, header_size = 0, self.__RECORD_HEADER.size
+            while offset + header_size <= len(data):
+                kind, canonical_address, length = self.__RECORD_HEADER.unpack_from(data, offset)
+                if offset + header_size + length > len(data):
+                    break  # Partially written record
+                checksum_address = to_checksum_address(canonical_address)
+                location = (offset + header_size, length)
+                self.__index_record(kind, checksum_address, location, size=header_size + length)
+                offset += header_size + length
+
+            if offset != len(data):
+                # Discard the torn tail of an interrupted append
+                self.log.warn(f"Truncating {len(data) - offset} bytes of incomplete records from {self.storage_filepath}")
+                with open(self.storage_filepath, 'r+b') as storage_file:
+                    storage_file.truncate(offset)
+
+            self.__loaded = True
+            if self.__total_bytes and (self.__stale_bytes / self.__total_bytes) > self.COMPACTION_THRESHOLD:
+                self.compact()
+
+    def __append(self, kind: int, checksum_address: str, payload: bytes = b'') -> None:
+        self.__load_index()
+        record = self.__encode_record(kind=kind, checksum_address=checksum_address, payload=payload)
+        with self.__lock:
+            os.makedirs(os.path.dirname(self.storage_filepath), exist_ok=True)
+            with open(self.storage_filepath, 'ab') as storage_file:
+                offset = storage_file.tell()
+                storage_file.write(record)  # A single write per record; torn tails are discarded on load.
+            location = (offset + self.__RECORD_HEADER.size, len(payload))
+            self.__index_record(kind, checksum_address, location, size=len(record))
+
+    def __read_records(self, index: dict) -> dict:
+        """Read the current payloads of all records in an index with a single read of the log file."""
+        with self.__lock:
+            if not index:
+                return dict()
+            with open(self.storage_filepath, 'rb') as storage_file:
+                data = storage_file.read()
+            return {address: data[offset:offset+length] for address, (offset, length) in index.items()}
+
+    def __read_record(self, index: dict, checksum_address: str) -> bytes:
+        with self.__lock:
+            try:
+                offset, length = index[checksum_address]
+            except KeyError:
+                raise self.UnknownNode(checksum_address)
+            with open(self.storage_filepath, 'rb') as storage_file:
+                storage_file.seek(offset)
+                return storage_file.read(length)
+
+    def compact(self) -> int:
+        """
+        Rewrite the log file with only the current record of each node and certificate,
+        atomically replacing the existing file.  Returns the number of bytes reclaimed.
+        """
+        self.__load_index()
+        with self.__lock:
+            nodes = self.__read_records(self.__nodes)
+            certificates = self.__read_records(self.__certificates)
+            records = [(self._NODE, address, payload) for address, payload in nodes.items()]
+            records.extend((self._CERTIFICATE, address, payload) for address, payload in certificates.items())
+
+            reclaimed = self.__stale_bytes
+            self.__nodes, self.__certificates = dict(), dict()
+            self.__stale_bytes = self.__total_bytes = 0
+
+            os.makedirs(os.path.dirname(self.storage_filepath), exist_ok=True)
+            temp_filepath = f'{self.storage_filepath}.compacting'
+            offset = 0
+            with open(temp_filepath, 'wb') as temp_file:
+                for kind, address, payload in records:
+                    record = self.__encode_record(kind=kind, checksum_address=address, payload=payload)
+                    temp_file.write(record)
+                    location = (offset + self.__RECORD_HEADER.size, len(payload))
+                    self.__index_record(kind, address, location, size=len(record))
+                    offset += len(record)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            os.replace(temp_filepath, self.storage_filepath)
+
+        self.log.debug(f"Compacted {self.storage_filepath}; reclaimed {reclaimed} bytes")
+        return reclaimed
+
+    #
+    # Certificates
+    #
+
+    @validate_checksum_address
+    def generate_certificate_filepath(self, checksum_address: str) -> str:
+        filename = '{}{}'.format(checksum_address, self.TLS_CERTIFICATE_EXTENSION)
+        return os.path.join(self.certificates_dir, filename)
+
+    def store_node_certificate(self, certificate: Certificate, force: bool = True) -> str:
+        checksum_address = read_certificate_pseudonym(certificate=certificate)
+        certificate_filepath = self._write_tls_certificate(certificate=certificate, force=force)
+        certificate_bytes = certificate.public_bytes(self.TLS_CERTIFICATE_ENCODING)
+        self.__load_index()
+        with suppress(self.UnknownNode):
+            if self.__read_record(self.__certificates, checksum_address=checksum_address) == certificate_bytes:
+                return certificate_filepath  # Unchanged
+        self.__append(self._CERTIFICATE, checksum_address, certificate_bytes)
+        return certificate_filepath
+
+    def __load_certificate(self, certificate_bytes: bytes) -> Certificate:
+        return x509.load_pem_x509_certificate(certificate_bytes, backend=default_backend())
+
+    #
+    # API
+    #
+
+    def all(self, federated_only: bool, certificates_only: bool = False) -> Set[Union[Any, Certificate]]:
+        self.__load_index()
+        if certificates_only:
+            certificates = self.__read_records(self.__certificates)
+            return set(self.__load_certificate(c) for c in certificates.values())
+
+        nodes = self.__read_records(self.__nodes)
+        self.log.info("Found {} known nodes in {}".format(len(nodes), self.storage_filepath))
+        batch = bytes().join(bytes(VariableLengthBytestring(n)) for n in nodes.values())
+        sprouts = self.character_class.batch_from_bytes(batch)  # TODO: 466
+        return set(sprouts)
+
+    @validate_checksum_address
+    def get(self, checksum_address: str, federated_only: bool, certificate_only: bool = False):
+        self.__load_index()
+        if certificate_only is True:
+            certificate_bytes = self.__read_record(self.__certificates, checksum_address=checksum_address)
+            return self.__load_certificate(certificate_bytes)
+        node_bytes = self.__read_record(self.__nodes, checksum_address=checksum_address)
+        node = self.character_class.from_bytes(node_bytes)  # TODO: 466
+        return node
+
+    def store_node_metadata(self, node, filepath: str = None) -> str:
+        self.__append(self._NODE, node.checksum_address, bytes(node))
+        return self.storage_filepath
+
+    @validate_checksum_address
+    def remove(self, checksum_address: str, metadata: bool = True, certificate: bool = True) -> Tuple[bool, str]:
+        self.__load_index()
+        if metadata is True and checksum_address in self.__nodes:
+            self.__append(self._REMOVED_NODE, checksum_address)
+        if certificate is True and checksum_address in self.__certificates:
+            self.__append(self._REMOVED_CERTIFICATE, checksum_address)
+            with suppress(FileNotFoundError):
+                os.remove(self.generate_certificate_filepath(checksum_address=checksum_address))
+        self.log.debug("Deleted {} from {}".format(checksum_address, self.storage_filepath))
+        return True, checksum_address
+
+    def clear(self, metadata: bool = True, certificates: bool = True) -> None:
+        """Forget all stored nodes and certificates"""
+        self.__load_index()
+        with self.__lock:
+            if metadata is True:
+                for checksum_address in list(self.__nodes):
+                    self.__append(self._REMOVED_NODE, checksum_address)
+            if certificates is True:
+                for checksum_address in list(self.__certificates):
+                    self.__append(self._REMOVED_CERTIFICATE, checksum_address)
+                    with suppress(FileNotFoundError):
+                        os.remove(self.generate_certificate_filepath(checksum_address=checksum_address))
+            self.compact()
+
+    def payload(self) -> dict:
+        payload = {
+            self._TYPE_LABEL: self._name,
+            'storage_root': self.root_dir,
+            'storage_filepath': self.storage_filepath,
+            'certificates_dir': self.certificates_dir
+        }
+        return payload
+
+    @classmethod
+    def from_payload(cls, payload: dict, *args, **kwargs) -> 'LocalIndexedNodeStorage':
+        payload = dict(payload)
+        storage_type = payload.pop(cls._TYPE_LABEL)
+        if not storage_type == cls._name:
+            raise cls.NodeStorageError("Wrong storage type. got {}".format(storage_type))
+        return cls(*args, **payload, **kwargs)
+
+    def initialize(self) -> bool:
+        for storage_dir in (self.root_dir, self.certificates_dir):
+            try:
+                os.makedirs(storage_dir, mode=0o755)
+            except FileExistsError:
+                self.log.info("There are pre-existing files at {}".format(storage_dir))
+        self.__loaded = False
+        self.__load_index()
+        return bool(all(map(os.path.isdir, (self.root_dir, self.certificates_dir))))
+
+
 #
 # Node Storage Registry
 #
@@ -17,6 +17,8 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 
 import inspect
+import threading
+from collections import OrderedDict
 from typing import List, Tuple, Optional
 
 from eth_utils import to_checksum_address
@@ -271,17 +273,58 @@ class DerivedKeyBasedPower(CryptoPowerUp):
 
 class DelegatingPower(DerivedKeyBasedPower):
 
+    DEFAULT_LABEL_CACHE_SIZE = 64
+
     def __init__(self,
                  keying_material: Optional[bytes] = None,
-                 password: Optional[bytes] = None) -> None:
+                 password: Optional[bytes] = None,
+                 label_cache_size: int = DEFAULT_LABEL_CACHE_SIZE) -> None:
         if keying_material is None:
             self.__umbral_keying_material = UmbralKeyingMaterial()
         else:
             self.__umbral_keying_material = UmbralKeyingMaterial.from_bytes(key_bytes=keying_material,
                                                                             password=password)
 
+        # Secret bytes of derived label keys, least recently used first.  Callers always receive
+        # a fresh key object, so the cached secrets can be zeroed on eviction or lock.
+        self.__label_secrets = OrderedDict()
+        self.__label_secrets_lock = threading.Lock()
+        self.label_cache_size = label_cache_size
+        self.label_cache_hits = 0
+        self.label_cache_misses = 0
+
     def _get_privkey_from_label(self, label):
-        return self.__umbral_keying_material.derive_privkey_by_label(label)
+        with self.__label_secrets_lock:
+            try:
+                secret = self.__label_secrets[label]
+            except KeyError:
+                self.label_cache_misses += 1
+            else:
+                self.__label_secrets.move_to_end(label)
+                self.label_cache_hits += 1
+                return UmbralPrivateKey.from_bytes(bytes(secret))
+
+        private_key = self.__umbral_keying_material.derive_privkey_by_label(label)
+        if self.label_cache_size <= 0:
+            return private_key
+
+        # Umbral clears the bignum of the derived key when it is freed
+        secret = bytearray(private_key.to_bytes())
+        del private_key
+        with self.__label_secrets_lock:
+            secret = self.__label_secrets.setdefault(label, secret)
+            self.__label_secrets.move_to_end(label)
+            while len(self.__label_secrets) > self.label_cache_size:
+                _label, evicted_secret = self.__label_secrets.popitem(last=False)
+                evicted_secret[:] = bytes(len(evicted_secret))
+            return UmbralPrivateKey.from_bytes(bytes(secret))
+
+    def lock(self) -> None:
+        """Zeroes and forgets all cached label secrets"""
+        with self.__label_secrets_lock:
+            while self.__label_secrets:
+                _label, secret = self.__label_secrets.popitem()
+                secret[:] = bytes(len(secret))
 
     def get_pubkey_from_label(self, label):
         return self._get_privkey_from_label(label).get_pubkey()
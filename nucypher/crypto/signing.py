@@ -16,13 +16,22 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 
+import hashlib
+from typing import Iterable, List, Tuple, Union
+
 from bytestring_splitter import BytestringSplitter
+from coincurve import PublicKey
+from cryptography.hazmat.primitives.asymmetric.utils import encode_dss_signature
+from umbral.keys import UmbralPublicKey
 from umbral.signing import Signature, Signer
 
 from nucypher.crypto.api import keccak_digest
 
 signature_splitter = BytestringSplitter(Signature)
 
+# Order of the secp256k1 group
+SECP256K1_ORDER = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+
 
 class SignatureStamp(object):
     """
@@ -30,10 +39,13 @@ class SignatureStamp(object):
     key as bytes.
     """
 
+    __slots__ = ('__signer', '_as_bytes', '_as_umbral_pubkey', '_hash')
+
     def __init__(self, verifying_key, signer: Signer = None) -> None:
         self.__signer = signer
         self._as_bytes = bytes(verifying_key)
         self._as_umbral_pubkey = verifying_key
+        self._hash = int.from_bytes(self._as_bytes, byteorder="big")
 
     def __bytes__(self):
         return self._as_bytes
@@ -42,7 +54,7 @@ class SignatureStamp(object):
         return self.__signer(*args, **kwargs)
 
     def __hash__(self):
-        return int.from_bytes(self, byteorder="big")
+        return self._hash
 
     def __eq__(self, other):
         return other == bytes(self)
@@ -76,6 +88,8 @@ class StrangerStamp(SignatureStamp):
     SignatureStamp of a stranger (ie, can only be used to glean public key, not to sign)
     """
 
+    __slots__ = ()
+
     def __call__(self, *args, **kwargs):
         from nucypher.crypto.powers import NoSigningPower
         message = "This isn't your SignatureStamp; it belongs to (a Stranger).  You can't sign with it."
@@ -84,3 +98,51 @@ class StrangerStamp(SignatureStamp):
 
 class InvalidSignature(Exception):
     """Raised when a Signature is not valid."""
+
+
+def invalid_signatures(signed_messages: Iterable[Tuple[bytes, Union[Signature, bytes], UmbralPublicKey]]) -> List[int]:
+    """
+    Verifies a batch of (message, signature, verifying key) triples, returning the indices of the invalid ones.
+
+    Each distinct verifying key is decompressed once per batch, and messages are SHA256-hashed
+    up front and verified against libsecp256k1.  ECDSA signatures don't support randomized batch
+    verification, so every signature is still checked on its own, which also pinpoints the culprits.
+    """
+    public_keys = dict()
+    invalid = list()
+    for index, (message, signature, verifying_key) in enumerate(signed_messages):
+        key_bytes = bytes(verifying_key)
+        try:
+            public_key = public_keys[key_bytes]
+        except KeyError:
+            try:
+                public_key = PublicKey(key_bytes)
+            except ValueError:
+                public_key = None
+            public_keys[key_bytes] = public_key
+
+        signature_bytes = bytes(signature)
+        middle = len(signature_bytes) // 2
+        r = int.from_bytes(signature_bytes[:middle], byteorder='big')
+        s = int.from_bytes(signature_bytes[middle:], byteorder='big')
+        if s > SECP256K1_ORDER // 2:
+            s = SECP256K1_ORDER - s  # libsecp256k1 only accepts the low-S form of an otherwise equivalent signature
+
+        digest = hashlib.sha256(message).digest()
+        try:
+            is_valid = public_key is not None and public_key.verify(encode_dss_signature(r, s), digest, hasher=None)
+        except ValueError:
+            is_valid = False
+        if not is_valid:
+            invalid.append(index)
+    return invalid
+
+
+def verify_signatures(signed_messages: Iterable[Tuple[bytes, Union[Signature, bytes], UmbralPublicKey]]) -> None:
+    """Verifies a batch of (message, signature, verifying key) triples; Raises InvalidSignature if any is invalid."""
+    signed_messages = list(signed_messages)
+    invalid = invalid_signatures(signed_messages)
+    if invalid:
+        _message, signature, _verifying_key = signed_messages[invalid[0]]
+        raise InvalidSignature(f"{len(invalid)} of {len(signed_messages)} signatures are invalid, "
+                               f"starting with signature #{invalid[0]}: {bytes(signature).hex()}")
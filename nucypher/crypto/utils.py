@@ -15,6 +15,8 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import hashlib
+from functools import lru_cache
 from typing import Any, Union
 
 from coincurve import PublicKey
@@ -26,6 +28,41 @@ from umbral.signing import Signature
 from nucypher.crypto.api import keccak_digest
 from nucypher.crypto.signing import SignatureStamp
 
+# Bounds of the process-wide caches of decompressed keys, canonical addresses, and signature recoveries
+KEY_CACHE_SIZE = 1024
+RECOVERY_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def _key_coordinates(compressed_key: bytes) -> bytes:
+    """Decompresses a serialized public key into its concatenated x and y coordinates"""
+    return PublicKey(compressed_key).format(compressed=False)[1:]
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def _canonical_address_from_key_bytes(compressed_key: bytes) -> bytes:
+    eth_pubkey = EthKeyAPI.PublicKey(_key_coordinates(compressed_key))
+    return eth_pubkey.to_canonical_address()
+
+
+@lru_cache(maxsize=RECOVERY_CACHE_SIZE)
+def _recover_compressed_pubkey(message_hash: bytes, recoverable_signature: bytes) -> bytes:
+    pubkey = PublicKey.from_signature_and_message(serialized_sig=recoverable_signature,
+                                                  message=message_hash,
+                                                  hasher=None)
+    return pubkey.format(compressed=True)
+
+
+@lru_cache(maxsize=RECOVERY_CACHE_SIZE)
+def _recovery_value(message_hash: bytes, signature: bytes, public_key: bytes) -> bytes:
+    for v in (0, 1):
+        v_byte = bytes([v])
+        if public_key == _recover_compressed_pubkey(message_hash, signature + v_byte):
+            return v_byte
+    else:
+        raise ValueError("Signature recovery failed. "
+                         "Either the message, the signature or the public key is not correct")
+
 
 def fingerprint_from_key(public_key: Any):
     """
@@ -43,10 +80,24 @@ def construct_policy_id(label: bytes, stamp: bytes) -> bytes:
     return keccak_digest(label + stamp)
 
 
-def canonical_address_from_umbral_key(public_key: UmbralPublicKey) -> bytes:
-    pubkey_raw_bytes = get_coordinates_as_bytes(public_key)
-    eth_pubkey = EthKeyAPI.PublicKey(pubkey_raw_bytes)
-    canonical_address = eth_pubkey.to_canonical_address()
+def construct_policy_hrac(alice_verifying_key: bytes, bob_verifying_key: bytes, label: bytes) -> bytes:
+    """
+    Forms the "hashed resource access code" of a policy, a keccak hash of
+    Alice's and Bob's verifying keys and the label.
+    """
+    return keccak_digest(alice_verifying_key + bob_verifying_key + label)
+
+
+def construct_map_id(alice_verifying_key: bytes, hrac: bytes) -> str:
+    """
+    Forms the public ID of a policy's TreasureMap, a keccak hash of
+    Alice's verifying key and the policy HRAC, as hex.
+    """
+    return keccak_digest(alice_verifying_key + hrac).hex()
+
+
+def canonical_address_from_umbral_key(public_key: Union[UmbralPublicKey, SignatureStamp]) -> bytes:
+    canonical_address = _canonical_address_from_key_bytes(bytes(public_key))
     return canonical_address
 
 
@@ -79,11 +130,8 @@ def recover_pubkey_from_signature(message: bytes,
     else:
         raise ValueError("Wrong v value. It should be 0, 1, 27 or 28.")
 
-    kwargs = dict(hasher=None) if is_prehashed else {}
-    pubkey = PublicKey.from_signature_and_message(serialized_sig=signature,
-                                                  message=message,
-                                                  **kwargs)
-    return pubkey.format(compressed=True)
+    message_hash = message if is_prehashed else hashlib.sha256(message).digest()
+    return _recover_compressed_pubkey(message_hash, signature)
 
 
 def get_signature_recovery_value(message: bytes,
@@ -105,26 +153,17 @@ def get_signature_recovery_value(message: bytes,
     if len(signature) != ecdsa_signature_size:
         raise ValueError(f"The signature size should be {ecdsa_signature_size} B.")
 
-    kwargs = dict(hasher=None) if is_prehashed else {}
-    for v in (0, 1):
-        v_byte = bytes([v])
-        recovered_pubkey = PublicKey.from_signature_and_message(serialized_sig=signature + v_byte,
-                                                                message=message,
-                                                                **kwargs)
-        if bytes(public_key) == recovered_pubkey.format(compressed=True):
-            return v_byte
-    else:
-        raise ValueError("Signature recovery failed. "
-                         "Either the message, the signature or the public key is not correct")
+    message_hash = message if is_prehashed else hashlib.sha256(message).digest()
+    return _recovery_value(message_hash, signature, bytes(public_key))
 
 
 def get_coordinates_as_bytes(point: Union[Point, UmbralPublicKey, SignatureStamp],
                              x_coord=True,
                              y_coord=True) -> bytes:
-    if isinstance(point, SignatureStamp):
-        point = point.as_umbral_pubkey()
-
-    coordinates_as_bytes = point.to_bytes(is_compressed=False)[1:]
+    if isinstance(point, (SignatureStamp, UmbralPublicKey)):
+        coordinates_as_bytes = _key_coordinates(bytes(point))  # Keys recur; decompress each one once
+    else:
+        coordinates_as_bytes = point.to_bytes(is_compressed=False)[1:]
     middle = len(coordinates_as_bytes)//2
     if x_coord and y_coord:
         return coordinates_as_bytes
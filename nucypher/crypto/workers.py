@@ -0,0 +1,153 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import atexit
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, List, Sequence, Tuple, TYPE_CHECKING
+
+from constant_sorrow import constants
+from twisted.logger import Logger
+from umbral import pre
+from umbral.config import default_params
+from umbral.keys import UmbralPublicKey
+
+from nucypher.crypto.api import encrypt_and_sign
+from nucypher.crypto.kits import UmbralMessageKit
+
+if TYPE_CHECKING:
+    from nucypher.crypto.signing import SignatureStamp
+
+
+#
+# Worker Jobs
+#
+# These run in the worker processes; arguments and results cross the process boundary as bytes.
+#
+
+def _encrypt(recipient_pubkey: bytes, plaintext: bytes) -> Tuple[bytes, bytes]:
+    ciphertext, capsule = pre.encrypt(UmbralPublicKey.from_bytes(recipient_pubkey), plaintext)
+    return ciphertext, capsule.to_bytes()
+
+
+class CryptoWorkerPool:
+    """
+    Spreads the encryption of each Ursula's KFrag during a grant over a pool
+    of worker processes, sidestepping the GIL.
+
+    Only public keys and the already signed payloads are sent to the workers;
+    signing, and KFrag generation, stay in the calling process.  Results are
+    returned in the same order as the inputs. Batches smaller than `min_parallel_jobs`
+    are handled on the calling thread, where the cost of shipping them to a worker
+    would outweigh the gain.
+
+    Characters only use a pool when they are given one; the worker processes are
+    started on first use and shut down when the interpreter exits.
+    """
+
+    MIN_PARALLEL_JOBS = 8
+
+    __shared = None
+    __shared_lock = threading.Lock()
+
+    def __init__(self, max_workers: int = None, min_parallel_jobs: int = MIN_PARALLEL_JOBS):
+        self.log = Logger('crypto-workers')
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_parallel_jobs = min_parallel_jobs
+        self.__executor = None
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def shared(cls) -> 'CryptoWorkerPool':
+        """A process-wide pool, for characters that should share their workers"""
+        with cls.__shared_lock:
+            if cls.__shared is None:
+                cls.__shared = cls()
+            return cls.__shared
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(max_workers={self.max_workers})"
+
+    def _is_parallel(self, jobs: int) -> bool:
+        return self.max_workers > 1 and jobs >= self.min_parallel_jobs
+
+    def __get_executor(self) -> ProcessPoolExecutor:
+        with self.__lock:
+            if self.__executor is None:
+                # Spawn rather than fork; the parent is typically running reactor and learning threads.
+                self.__executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                      mp_context=multiprocessing.get_context('spawn'))
+                atexit.register(self.shutdown)
+            return self.__executor
+
+    def shutdown(self) -> None:
+        with self.__lock:
+            if self.__executor is not None:
+                self.__executor.shutdown(wait=True)
+                self.__executor = None
+                atexit.unregister(self.shutdown)
+
+    def _map(self, job: Callable, *iterables: Sequence) -> list:
+        chunksize = math.ceil(len(iterables[0]) / self.max_workers)
+        try:
+            return list(self.__get_executor().map(job, *iterables, chunksize=chunksize))
+        except BrokenProcessPool:
+            self.log.warn("Crypto worker pool broke; running the batch on the calling thread")
+            with self.__lock:
+                self.__executor = None
+                atexit.unregister(self.shutdown)
+            return list(map(job, *iterables))
+
+    #
+    # Encryption
+    #
+
+    def encrypt_and_sign(self,
+                         recipient_pubkeys: Sequence[UmbralPublicKey],
+                         plaintexts: Sequence[bytes],
+                         signer: 'SignatureStamp',
+                         ) -> List[UmbralMessageKit]:
+        """
+        Signs each plaintext and encrypts it for the corresponding recipient,
+        as nucypher.crypto.api.encrypt_and_sign does with sign_plaintext=True.
+        """
+        if len(recipient_pubkeys) != len(plaintexts):
+            raise ValueError("There must be exactly one recipient for each plaintext.")
+
+        if not self._is_parallel(jobs=len(plaintexts)):
+            return [encrypt_and_sign(recipient_pubkey_enc=recipient_pubkey, plaintext=plaintext, signer=signer)[0]
+                    for recipient_pubkey, plaintext in zip(recipient_pubkeys, plaintexts)]
+
+        signatures = [signer(plaintext) for plaintext in plaintexts]
+        payloads = [constants.SIGNATURE_TO_FOLLOW + signature + plaintext
+                    for signature, plaintext in zip(signatures, plaintexts)]
+        results = self._map(_encrypt, [bytes(recipient_pubkey) for recipient_pubkey in recipient_pubkeys], payloads)
+
+        params = default_params()
+        sender_verifying_key = signer.as_umbral_pubkey()
+        message_kits = list()
+        for (ciphertext, capsule), signature in zip(results, signatures):
+            message_kit = UmbralMessageKit(ciphertext=ciphertext,
+                                           capsule=pre.Capsule.from_bytes(capsule, params),
+                                           sender_verifying_key=sender_verifying_key,
+                                           signature=signature)
+            message_kits.append(message_kit)
+        return message_kits
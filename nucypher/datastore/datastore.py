@@ -28,7 +28,7 @@ from umbral.kfrags import KFrag
 
 from nucypher.crypto.signing import Signature
 from nucypher.crypto.utils import fingerprint_from_key
-from nucypher.datastore.db.models import Key, PolicyArrangement, Workorder
+from nucypher.datastore.db.models import Key, PolicyArrangement, Workorder, ReencryptionResponse
 
 
 class NotFound(Exception):
@@ -281,3 +281,62 @@ class Datastore:
         deleted = workorders.delete()
         self.__commit(session=session)
         return deleted
+
+    #
+    # Re-encryption Responses
+    #
+
+    def save_reencryption_response(self,
+                                   work_order_digest: bytes,
+                                   arrangement_id: bytes,
+                                   response: bytes,
+                                   session=None
+                                   ) -> ReencryptionResponse:
+        """
+        Records the response given to a work order, so that it can be replayed if Bob retries.
+        """
+        session = session or self._session_on_init_thread
+
+        reencryption_response = ReencryptionResponse(id=work_order_digest,
+                                                     arrangement_id=arrangement_id,
+                                                     response=response)
+        session.merge(reencryption_response)
+        self.__commit(session=session)
+        return reencryption_response
+
+    def get_reencryption_response(self,
+                                  work_order_digest: bytes,
+                                  since: datetime = None,
+                                  session=None
+                                  ) -> bytes:
+        """
+        Returns the response recorded for a work order, if it was recorded after `since`.
+        """
+        session = session or self._session_on_init_thread
+
+        query = session.query(ReencryptionResponse).filter_by(id=work_order_digest)
+        if since:
+            query = query.filter(ReencryptionResponse.created_at > since)
+        reencryption_response = query.first()
+        if not reencryption_response:
+            raise NotFound("No re-encryption response for work order {}.".format(work_order_digest.hex()))
+        return reencryption_response.response
+
+    def del_reencryption_responses(self,
+                                   arrangement_id: bytes = None,
+                                   before: datetime = None,
+                                   session=None
+                                   ) -> int:
+        """
+        Deletes the recorded responses for an arrangement, or those recorded before `before`.
+        """
+        session = session or self._session_on_init_thread
+
+        query = session.query(ReencryptionResponse)
+        if arrangement_id:
+            query = query.filter_by(arrangement_id=arrangement_id)
+        if before:
+            query = query.filter(ReencryptionResponse.created_at <= before)
+        deleted = query.delete()
+        self.__commit(session=session)
+        return deleted
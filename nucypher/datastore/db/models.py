@@ -96,3 +96,20 @@ class Workorder(Base):
 
     def __repr__(self):
         return f'{self.__class__.__name__}(id={self.id})'
+
+
+class ReencryptionResponse(Base):
+    __tablename__ = 'reencryptionresponses'
+
+    id = Column(LargeBinary, unique=True, primary_key=True)  # Digest of the work order payload
+    arrangement_id = Column(LargeBinary, unique=False)
+    response = Column(LargeBinary)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __init__(self, id, arrangement_id, response) -> None:
+        self.id = id
+        self.arrangement_id = arrangement_id
+        self.response = response
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(id={self.id})'
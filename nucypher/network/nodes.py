@@ -122,6 +122,13 @@ class FleetStateTracker:
     def __getitem__(self, item):
         return self._nodes[item]
 
+    def __delitem__(self, key):
+        del self._nodes[key]
+
+        if self._tracking:
+            self.log.info("Updating fleet state after forgetting node {}".format(key))
+            self.record_fleet_state()
+
     def __bool__(self):
         return bool(self._nodes)
 
@@ -134,6 +141,14 @@ class FleetStateTracker:
     def __len__(self):
         return len(self._nodes)
 
+    def extend(self, nodes) -> None:
+        """Track many nodes at once, updating the fleet state (if tracking) only after the last one."""
+        for node in nodes:
+            self._nodes[node.checksum_address] = node
+        if self._tracking:
+            self.log.info("Updating fleet state after saving {} nodes".format(len(nodes)))
+            self.record_fleet_state()
+
     def __eq__(self, other):
         return self._nodes == other._nodes
 
@@ -264,13 +279,17 @@ class NodeSprout(PartiallyKwargifiedBytes):
     def stamp(self) -> bytes:
         return self.processed_objects['verifying_key'][0]
 
-    def mature(self):
+    def matured_copy(self):
+        """Returns a new, mature node for this sprout, leaving the sprout itself untouched"""
         mature_node = self.finish()
 
         # As long as we're doing egregious workarounds, here's another one.  # TODO: 1481
         filepath = mature_node._cert_store_function(certificate=mature_node.certificate)
         mature_node.certificate_filepath = filepath
+        return mature_node
 
+    def mature(self):
+        mature_node = self.matured_copy()
         self.__class__ = mature_node.__class__
         self.__dict__ = mature_node.__dict__
 
@@ -331,7 +350,8 @@ class Learner:
                  node_storage=None,
                  save_metadata: bool = False,
                  abort_on_learning_error: bool = False,
-                 lonely: bool = False
+                 lonely: bool = False,
+                 lazy_warm_start: bool = False
                  ) -> None:
 
         self.log = Logger("learning-loop")  # type: Logger
@@ -349,6 +369,7 @@ class Learner:
         self.__known_nodes = self.tracker_class()
 
         self.lonely = lonely
+        self.lazy_warm_start = lazy_warm_start
         self.done_seeding = False
 
         if not node_storage:
@@ -422,10 +443,76 @@ class Learner:
             self.log.warn("No seednodes were available after {} attempts".format(retry_attempts))
             # TODO: Need some actual logic here for situation with no seed nodes (ie, maybe try again much later)  567
 
-    def read_nodes_from_storage(self) -> None:
+    def read_nodes_from_storage(self, lazy: bool = None) -> None:
+        """
+        Remember all nodes from node storage.  In lazy mode, the stored nodes are tracked
+        as unverified sprouts from a single bulk read, recording the fleet state once;
+        maturation and certificate loading are deferred until each node is first used,
+        and verification runs in the background.
+        """
+        lazy = self.lazy_warm_start if lazy is None else lazy
         stored_nodes = self.node_storage.all(federated_only=self.federated_only)  # TODO: #466
+        if not lazy:
+            with self.node_storage.batch():
+                for node in stored_nodes:
+                    self.remember_node(node)
+            return
+
+        warm_nodes = list()
         for node in stored_nodes:
-            self.remember_node(node)
+            if node == self:
+                continue
+            with suppress(KeyError):
+                if not node.timestamp > self.known_nodes[node.checksum_address].timestamp:
+                    continue  # We already know about this node (or a more recent version of it).
+            warm_nodes.append(node)
+
+        # These nodes came from storage; There is no need to write them back.
+        self.known_nodes.extend(warm_nodes)
+        for node in warm_nodes:
+            listeners = self._learning_listeners.pop(node.checksum_address, tuple())
+            for listener in listeners:
+                listener.add(node.checksum_address)
+            self._node_ids_to_learn_about_immediately.discard(node.checksum_address)
+        self.known_nodes.record_fleet_state()
+        self.log.info(f"Warm-started with {len(warm_nodes)} stored nodes; verifying them in the background.")
+
+        verification = deferToThread(self.__verify_stored_nodes, warm_nodes)
+        verification.addErrback(self.handle_learning_errors)
+
+    def __verify_stored_nodes(self, sprouts) -> None:
+        """
+        Runs in a worker thread.  Each stored sprout is matured into a separate node object
+        which is verified here; known nodes are only updated on the reactor thread.
+        """
+        for sprout in sprouts:
+            if self.known_nodes._nodes.get(sprout.checksum_address) is not sprout:
+                continue  # A newer version of this node has been learned since startup.
+            if not isinstance(sprout, NodeSprout):
+                continue  # Matured on the reactor thread when it was first used.
+            try:
+                node = sprout.matured_copy()
+                node.verify_node(network_middleware_client=self.network_middleware.client,
+                                 registry=self.registry)
+            except NodeSeemsToBeDown as e:
+                self.log.info(f"Unable to reach stored node {sprout}; it will be verified when next used: {e}")
+            except (SSLError, Teacher.InvalidNode) as e:
+                # TODO: Bucket this node  567
+                self.log.warn(f"Forgetting stored node {sprout}, which failed verification: {e}")
+                reactor.callFromThread(self.__replace_stored_node, sprout, None)
+            else:
+                reactor.callFromThread(self.__replace_stored_node, sprout, node)
+
+    def __replace_stored_node(self, sprout: NodeSprout, node=None) -> None:
+        """Swaps a verified node in for its stored sprout, or forgets the sprout if there is no node"""
+        if self.known_nodes._nodes.get(sprout.checksum_address) is not sprout:
+            return  # Learned anew in the meantime.
+        if node is not None and not isinstance(sprout, NodeSprout):
+            return  # Matured in place on first use in the meantime.
+        if node is None:
+            del self.known_nodes[sprout.checksum_address]
+        else:
+            self.known_nodes._nodes[sprout.checksum_address] = node  # Same node; the fleet state is unchanged.
 
     def remember_node(self,
                       node,
@@ -877,50 +964,50 @@ class Learner:
 
         sprouts = self.node_class.batch_from_bytes(node_payload)
         remembered = []
-        for sprout in sprouts:
-            fail_fast = True  # TODO  NRN
-            try:
-                node_or_false = self.remember_node(sprout,
-                                                   record_fleet_state=False,
-                                                   # Do we want both of these to be decided by `eager`?
-                                                   eager=eager,
-                                                   grow_node_sprout_into_node=eager)
-                if node_or_false is not False:
-                    remembered.append(node_or_false)
-
-                #
-                # Report Failure
-                #
-
-            except NodeSeemsToBeDown:
-                self.log.info(f"Verification Failed - "
-                              f"Cannot establish connection to {sprout}.")
-
-            except sprout.StampNotSigned:
-                self.log.warn(f'Verification Failed - '
-                              f'{sprout} stamp is unsigned.')
-
-            except sprout.NotStaking:
-                self.log.warn(f'Verification Failed - '
-                              f'{sprout} has no active stakes in the current period '
-                              f'({self.staking_agent.get_current_period()}')
-
-            except sprout.InvalidWorkerSignature:
-                self.log.warn(f'Verification Failed - '
-                              f'{sprout} has an invalid wallet signature for {sprout.decentralized_identity_evidence}')
-
-            except sprout.DetachedWorker:
-                self.log.warn(f'Verification Failed - '
-                              f'{sprout} is not bonded to a Staker.')
-
-            except sprout.Invalidsprout:
-                self.log.warn(sprout.invalid_metadata_message.format(sprout))
-
-            except sprout.SuspiciousActivity:
-                message = f"Suspicious Activity: Discovered sprout with bad signature: {sprout}." \
-                          f"Propagated by: {current_teacher}"
-                self.log.warn(message)
-
+        with self.node_storage.batch():
+            for sprout in sprouts:
+                fail_fast = True  # TODO  NRN
+                try:
+                    node_or_false = self.remember_node(sprout,
+                                                       record_fleet_state=False,
+                                                       # Do we want both of these to be decided by `eager`?
+                                                       eager=eager,
+                                                       grow_node_sprout_into_node=eager)
+                    if node_or_false is not False:
+                        remembered.append(node_or_false)
+
+                    #
+                    # Report Failure
+                    #
+
+                except NodeSeemsToBeDown:
+                    self.log.info(f"Verification Failed - "
+                                  f"Cannot establish connection to {sprout}.")
+
+                except sprout.StampNotSigned:
+                    self.log.warn(f'Verification Failed - '
+                                  f'{sprout} stamp is unsigned.')
+
+                except sprout.NotStaking:
+                    self.log.warn(f'Verification Failed - '
+                                  f'{sprout} has no active stakes in the current period '
+                                  f'({self.staking_agent.get_current_period()}')
+
+                except sprout.InvalidWorkerSignature:
+                    self.log.warn(f'Verification Failed - '
+                                  f'{sprout} has an invalid wallet signature for {sprout.decentralized_identity_evidence}')
+
+                except sprout.DetachedWorker:
+                    self.log.warn(f'Verification Failed - '
+                                  f'{sprout} is not bonded to a Staker.')
+
+                except sprout.Invalidsprout:
+                    self.log.warn(sprout.invalid_metadata_message.format(sprout))
+
+                except sprout.SuspiciousActivity:
+                    message = f"Suspicious Activity: Discovered sprout with bad signature: {sprout}." \
+                              f"Propagated by: {current_teacher}"
+                    self.log.warn(message)
 
         # Is cycling happening in the right order?
         current_teacher.update_snapshot(checksum=checksum,
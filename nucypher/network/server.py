@@ -17,7 +17,11 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 import binascii
 import os
-from typing import Tuple
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Callable, Tuple
 
 from bytestring_splitter import BytestringSplitter
 from constant_sorrow import constants
@@ -31,6 +35,7 @@ from web3.exceptions import TimeExhausted
 
 import nucypher
 from nucypher.config.storages import ForgetfulNodeStorage
+from nucypher.crypto.api import keccak_digest
 from nucypher.crypto.kits import UmbralMessageKit
 from nucypher.crypto.powers import KeyPairBasedPower, PowerUpError
 from nucypher.crypto.signing import InvalidSignature
@@ -77,6 +82,100 @@ class ProxyRESTServer:
         return "{}:{}".format(self.rest_interface.host, self.rest_interface.port)
 
 
+class ReencryptionReplayCache:
+    """
+    Remembers Ursula's recent re-encryption responses, keyed by a digest of the arrangement
+    and Bob's work order payload (which carries his signed receipt). A retried work order is
+    answered with the stored response instead of being re-encrypted and recorded again.
+
+    Responses are kept for `ttl` seconds, in a bounded in-memory LRU backed by the
+    datastore so that they survive a restart.
+    """
+
+    TTL = 60 * 10  # seconds
+    MAX_SIZE = 1024
+
+    def __init__(self, datastore, db_engine, ttl: int = TTL, max_size: int = MAX_SIZE):
+        self.datastore = datastore
+        self.db_engine = db_engine
+        self.ttl = ttl
+        self.max_size = max_size
+
+        self.__responses = OrderedDict()    # digest -> (expiry, arrangement ID, response), oldest first
+        self.__in_flight = dict()           # digest -> lock held while the response is computed
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def digest(arrangement_id: bytes, work_order_payload: bytes) -> bytes:
+        return keccak_digest(arrangement_id, work_order_payload)
+
+    def __get(self, digest: bytes):
+        with self.__lock:
+            try:
+                expiry, _arrangement_id, response = self.__responses[digest]
+            except KeyError:
+                pass
+            else:
+                if expiry > time.monotonic():
+                    self.__responses.move_to_end(digest)
+                    return response
+                del self.__responses[digest]
+
+        since = datetime.utcnow() - timedelta(seconds=self.ttl)
+        try:
+            with ThreadedSession(self.db_engine) as session:
+                response = self.datastore.get_reencryption_response(work_order_digest=digest,
+                                                                    since=since,
+                                                                    session=session)
+        except NotFound:
+            return None
+        self.__remember(digest, arrangement_id=None, response=response)
+        return response
+
+    def __remember(self, digest: bytes, arrangement_id, response: bytes) -> None:
+        with self.__lock:
+            self.__responses[digest] = (time.monotonic() + self.ttl, arrangement_id, response)
+            self.__responses.move_to_end(digest)
+            while len(self.__responses) > self.max_size:
+                self.__responses.popitem(last=False)
+
+    def get_or_compute(self, digest: bytes, arrangement_id: bytes, compute: Callable[[], bytes]) -> bytes:
+        """
+        Returns the stored response for `digest`, or computes and stores it. Concurrent
+        retries of the same work order wait for the first one rather than computing again.
+        """
+        with self.__lock:
+            in_flight = self.__in_flight.setdefault(digest, threading.Lock())
+        try:
+            with in_flight:
+                response = self.__get(digest)
+                if response is None:
+                    response = compute()
+                    with ThreadedSession(self.db_engine) as session:
+                        now = datetime.utcnow()
+                        self.datastore.del_reencryption_responses(before=now - timedelta(seconds=self.ttl),
+                                                                  session=session)
+                        self.datastore.save_reencryption_response(work_order_digest=digest,
+                                                                  arrangement_id=arrangement_id,
+                                                                  response=response,
+                                                                  session=session)
+                    self.__remember(digest, arrangement_id=arrangement_id, response=response)
+                return response
+        finally:
+            with self.__lock:
+                if self.__in_flight.get(digest) is in_flight:
+                    del self.__in_flight[digest]
+
+    def forget(self, arrangement_id: bytes) -> None:
+        """Drops every response given for a revoked arrangement"""
+        with self.__lock:
+            for digest, (_expiry, cached_arrangement_id, _response) in list(self.__responses.items()):
+                if cached_arrangement_id in (arrangement_id, None):
+                    del self.__responses[digest]
+        with ThreadedSession(self.db_engine) as session:
+            self.datastore.del_reencryption_responses(arrangement_id=arrangement_id, session=session)
+
+
 def make_rest_app(
         db_filepath: str,
         this_node,
@@ -103,6 +202,7 @@ def make_rest_app(
     Base.metadata.create_all(engine)
     datastore = datastore.Datastore(engine)
     db_engine = engine
+    replay_cache = ReencryptionReplayCache(datastore=datastore, db_engine=db_engine)
 
     from nucypher.characters.lawful import Alice, Ursula
     _alice_class = Alice
@@ -290,6 +390,7 @@ def make_rest_app(
                 elif revocation.verify_signature(alice_pubkey):
                     datastore.del_policy_arrangement(
                         id_as_hex.encode(), session=session)
+                    replay_cache.forget(arrangement_id=id_as_hex.encode())
         except (NotFound, InvalidSignature) as e:
             log.debug("Exception attempting to revoke: {}".format(e))
             return Response(response='KFrag not found or revocation signature is invalid.', status=404)
@@ -311,32 +412,40 @@ def make_rest_app(
         except NotFound:
             return Response(response=arrangement_id, status=404)
 
-        # Get KFrag
-        # TODO: Yeah, well, what if this arrangement hasn't been enacted?  1702
-        kfrag = KFrag.from_bytes(arrangement.kfrag)
-
-        # Get Work Order
-        from nucypher.policy.collections import WorkOrder  # Avoid circular import
-        alice_verifying_key_bytes = arrangement.alice_verifying_key.key_data
-        alice_verifying_key = UmbralPublicKey.from_bytes(alice_verifying_key_bytes)
-        alice_address = canonical_address_from_umbral_key(alice_verifying_key)
         work_order_payload = request.data
-        work_order = WorkOrder.from_rest_payload(arrangement_id=arrangement_id,
-                                                 rest_payload=work_order_payload,
-                                                 ursula=this_node,
-                                                 alice_address=alice_address)
-        log.info(f"Work Order from {work_order.bob}, signed {work_order.receipt_signature}")
-
-        # Re-encrypt
-        response = this_node._reencrypt(kfrag=kfrag,
-                                        work_order=work_order,
-                                        alice_verifying_key=alice_verifying_key)
-
-        # Now, Ursula saves this workorder to her database...
-        with ThreadedSession(db_engine):
-            this_node.datastore.save_workorder(bob_verifying_key=bytes(work_order.bob.stamp),
-                                               bob_signature=bytes(work_order.receipt_signature),
-                                               arrangement_id=work_order.arrangement_id)
+
+        def reencrypt():
+            # Get KFrag
+            # TODO: Yeah, well, what if this arrangement hasn't been enacted?  1702
+            kfrag = KFrag.from_bytes(arrangement.kfrag)
+
+            # Get Work Order
+            from nucypher.policy.collections import WorkOrder  # Avoid circular import
+            alice_verifying_key_bytes = arrangement.alice_verifying_key.key_data
+            alice_verifying_key = UmbralPublicKey.from_bytes(alice_verifying_key_bytes)
+            alice_address = canonical_address_from_umbral_key(alice_verifying_key)
+            work_order = WorkOrder.from_rest_payload(arrangement_id=arrangement_id,
+                                                     rest_payload=work_order_payload,
+                                                     ursula=this_node,
+                                                     alice_address=alice_address)
+            log.info(f"Work Order from {work_order.bob}, signed {work_order.receipt_signature}")
+
+            # Re-encrypt
+            cfrags_and_signatures = this_node._reencrypt(kfrag=kfrag,
+                                                         work_order=work_order,
+                                                         alice_verifying_key=alice_verifying_key)
+
+            # Now, Ursula saves this workorder to her database...
+            with ThreadedSession(db_engine):
+                this_node.datastore.save_workorder(bob_verifying_key=bytes(work_order.bob.stamp),
+                                                   bob_signature=bytes(work_order.receipt_signature),
+                                                   arrangement_id=work_order.arrangement_id)
+            return cfrags_and_signatures
+
+        # A retried work order gets the response it was given the first time
+        response = replay_cache.get_or_compute(digest=replay_cache.digest(arrangement_id, work_order_payload),
+                                               arrangement_id=id_as_hex.encode(),
+                                               compute=reencrypt)
 
         headers = {'Content-Type': 'application/octet-stream'}
         return Response(headers=headers, response=response)
@@ -19,7 +19,7 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 import binascii
 import json
 from collections import OrderedDict
-from typing import List, Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 import maya
 import msgpack
@@ -33,15 +33,18 @@ from umbral.cfrags import CapsuleFrag
 from umbral.config import default_params
 from umbral.curvebn import CurveBN
 from umbral.keys import UmbralPublicKey
+from umbral.params import UmbralParameters
 from umbral.pre import Capsule
 
 from nucypher.characters.lawful import Bob, Character
 from nucypher.crypto.api import keccak_digest, encrypt_and_sign
 from nucypher.crypto.constants import PUBLIC_ADDRESS_LENGTH, KECCAK_DIGEST_LENGTH
 from nucypher.crypto.kits import UmbralMessageKit
-from nucypher.crypto.signing import Signature, InvalidSignature, signature_splitter
+from nucypher.crypto.signing import Signature, InvalidSignature, signature_splitter, invalid_signatures
 from nucypher.crypto.splitters import key_splitter, capsule_splitter
 from nucypher.crypto.utils import (canonical_address_from_umbral_key,
+                                   construct_map_id,
+                                   construct_policy_hrac,
                                    get_coordinates_as_bytes,
                                    get_signature_recovery_value)
 from nucypher.network.middleware import RestMiddleware
@@ -92,6 +95,7 @@ class TreasureMap:
         self._public_signature = public_signature
         self._hrac = hrac
         self._payload = None
+        self.__public_id = None  # (message kit, HRAC, ID)
 
     def prepare_for_publication(self,
                                 bob_encrypting_key,
@@ -118,7 +122,7 @@ class TreasureMap:
 
         This way, Bob can generate it and use it to find the TreasureMap.
         """
-        self._hrac = keccak_digest(bytes(alice_stamp) + bytes(bob_verifying_key) + label)
+        self._hrac = construct_policy_hrac(bytes(alice_stamp), bytes(bob_verifying_key), label)
         self._public_signature = alice_stamp(bytes(alice_stamp) + self._hrac)
         self._set_payload()
 
@@ -168,8 +172,13 @@ class TreasureMap:
         Ursula will refuse to propagate this if it she can't prove the payload is signed by Alice's public key,
         which is included in it,
         """
-        # TODO: No reason to keccak this over and over again.  Turn into set-once property pattern.
-        _id = keccak_digest(bytes(self._verifying_key) + bytes(self._hrac)).hex()
+        # Computed once per message kit (which carries the verifying key) and HRAC
+        if self.__public_id:
+            message_kit, hrac, _id = self.__public_id
+            if message_kit is self.message_kit and hrac == self._hrac:
+                return _id
+        _id = construct_map_id(bytes(self._verifying_key), bytes(self._hrac))
+        self.__public_id = (self.message_kit, self._hrac, _id)
         return _id
 
     @classmethod
@@ -437,27 +446,30 @@ class WorkOrder:
         return bytes(self.receipt_signature) + self.bob.stamp + payload_elements
 
     def complete(self, cfrags_and_signatures):
-        good_cfrags = []
         if not len(self) == len(cfrags_and_signatures):
             raise ValueError("Ursula gave back the wrong number of cfrags.  "
                              "She's up to something.")
 
         ursula_verifying_key = self.ursula.stamp.as_umbral_pubkey()
 
+        # Re-encryption metadata and re-encryption signatures, verified as one batch
+        signed_messages = list()
         for task, (cfrag, cfrag_signature) in zip(self.tasks.values(), cfrags_and_signatures):
-            # Validate re-encryption metadata
-            metadata_input = bytes(task.signature)
-            metadata_as_signature = Signature.from_bytes(cfrag.proof.metadata)
-            if not metadata_as_signature.verify(metadata_input, ursula_verifying_key):
+            signed_messages.append((bytes(task.signature), cfrag.proof.metadata, ursula_verifying_key))
+            signed_messages.append((bytes(cfrag), cfrag_signature, ursula_verifying_key))
+        invalid = invalid_signatures(signed_messages)
+
+        if invalid:
+            cfrag, _cfrag_signature = cfrags_and_signatures[invalid[0] // 2]
+            if invalid[0] % 2 == 0:
+                # Validate re-encryption metadata
                 raise InvalidSignature(f"Invalid metadata for {cfrag}.")
                 # TODO: Instead of raising, we should do something (#957)
-
-            # Validate re-encryption signatures
-            if cfrag_signature.verify(bytes(cfrag), ursula_verifying_key):
-                good_cfrags.append(cfrag)
             else:
+                # Validate re-encryption signatures
                 raise InvalidSignature(f"{cfrag} is not properly signed by Ursula.")
                 # TODO: Instead of raising, we should do something (#957)
+        good_cfrags = [cfrag for cfrag, _cfrag_signature in cfrags_and_signatures]
 
         for task, (cfrag, cfrag_signature) in zip(self.tasks.values(), cfrags_and_signatures):
             task.attach_work_result(cfrag, cfrag_signature)
@@ -603,11 +615,35 @@ class IndisputableEvidence:
 
         # TODO: check that the metadata is correct.
 
-    def get_proof_challenge_scalar(self) -> CurveBN:
-        capsule = self.task.capsule
-        cfrag = self.task.cfrag
+        # Memoized against the CFrag they were computed for
+        self.__challenge_scalar = None     # (cfrag, scalar)
+        self.__precomputed_values = None   # (cfrag, values)
+        self.__evaluation_arguments = None  # (cfrag, arguments)
 
+    @classmethod
+    def from_tasks(cls, tasks_and_work_orders: Iterable[Tuple['WorkOrder.Task', 'WorkOrder']]) -> List['IndisputableEvidence']:
+        """
+        Builds and precomputes the evidence for many faulty tasks at once, sharing the
+        Umbral parameters, and the serialized coordinates of the capsule points of tasks
+        on the same capsule.
+        """
         umbral_params = default_params()
+        coordinates = dict()
+        evidence = list()
+        for task, work_order in tasks_and_work_orders:
+            task_evidence = cls(task=task, work_order=work_order)
+            task_evidence.precompute_values(umbral_params=umbral_params, coordinates=coordinates)
+            evidence.append(task_evidence)
+        return evidence
+
+    def get_proof_challenge_scalar(self, umbral_params: UmbralParameters = None) -> CurveBN:
+        cfrag = self.task.cfrag
+        if self.__challenge_scalar and self.__challenge_scalar[0] is cfrag:
+            return self.__challenge_scalar[1]
+
+        capsule = self.task.capsule
+
+        umbral_params = umbral_params or default_params()
         e, v, _ = capsule.components()
 
         e1 = cfrag.point_e1
@@ -624,13 +660,22 @@ class IndisputableEvidence:
         hash_input = (e, e1, e2, v, v1, v2, u, u1, u2, metadata)
 
         h = hash_to_curvebn(*hash_input, params=umbral_params, hash_class=ExtendedKeccak)
+        self.__challenge_scalar = (cfrag, h)
         return h
 
-    def precompute_values(self) -> bytes:
-        capsule = self.task.capsule
+    def precompute_values(self, umbral_params: UmbralParameters = None, coordinates: dict = None) -> bytes:
+        """
+        :param coordinates: Optional cache of serialized point coordinates, shared between
+                            the evidence of several tasks; see `from_tasks`.
+        """
         cfrag = self.task.cfrag
+        if self.__precomputed_values and self.__precomputed_values[0] is cfrag:
+            return self.__precomputed_values[1]
 
-        umbral_params = default_params()
+        capsule = self.task.capsule
+
+        umbral_params = umbral_params or default_params()
+        coordinates = dict() if coordinates is None else coordinates
         e, v, _ = capsule.components()
 
         e1 = cfrag.point_e1
@@ -642,7 +687,7 @@ class IndisputableEvidence:
         u2 = cfrag.proof.point_kfrag_pok
         metadata = cfrag.proof.metadata
 
-        h = self.get_proof_challenge_scalar()
+        h = self.get_proof_challenge_scalar(umbral_params=umbral_params)
 
         e1h = h * e1
         v1h = h * v1
@@ -653,24 +698,41 @@ class IndisputableEvidence:
         vz = z * v
         uz = z * u
 
-        only_y_coord = dict(x_coord=False, y_coord=True)
+        capsule_points = (e, v, u)
+
+        def xy(point) -> bytes:
+            if not any(point is capsule_point for capsule_point in capsule_points):
+                return get_coordinates_as_bytes(point)
+            # Only capsule points are shared between tasks, so only those are cached.
+            # Keyed by identity; the point is kept alongside so that its id isn't reused.
+            try:
+                return coordinates[id(point)][1]
+            except KeyError:
+                point_coordinates = get_coordinates_as_bytes(point)
+                coordinates[id(point)] = (point, point_coordinates)
+                return point_coordinates
+
+        def y(point) -> bytes:
+            point_coordinates = xy(point)
+            return point_coordinates[len(point_coordinates)//2:]
+
         # E points
-        e_y = get_coordinates_as_bytes(e, **only_y_coord)
-        ez_xy = get_coordinates_as_bytes(ez)
-        e1_y = get_coordinates_as_bytes(e1, **only_y_coord)
-        e1h_xy = get_coordinates_as_bytes(e1h)
-        e2_y = get_coordinates_as_bytes(e2, **only_y_coord)
+        e_y = y(e)
+        ez_xy = xy(ez)
+        e1_y = y(e1)
+        e1h_xy = xy(e1h)
+        e2_y = y(e2)
         # V points
-        v_y = get_coordinates_as_bytes(v, **only_y_coord)
-        vz_xy = get_coordinates_as_bytes(vz)
-        v1_y = get_coordinates_as_bytes(v1, **only_y_coord)
-        v1h_xy = get_coordinates_as_bytes(v1h)
-        v2_y = get_coordinates_as_bytes(v2, **only_y_coord)
+        v_y = y(v)
+        vz_xy = xy(vz)
+        v1_y = y(v1)
+        v1h_xy = xy(v1h)
+        v2_y = y(v2)
         # U points
-        uz_xy = get_coordinates_as_bytes(uz)
-        u1_y = get_coordinates_as_bytes(u1, **only_y_coord)
-        u1h_xy = get_coordinates_as_bytes(u1h)
-        u2_y = get_coordinates_as_bytes(u2, **only_y_coord)
+        uz_xy = xy(uz)
+        u1_y = y(u1)
+        u1h_xy = xy(u1h)
+        u2_y = y(u2)
 
         # Get hashed KFrag validity message
         hash_function = hashes.Hash(hashes.SHA256(), backend=backend)
@@ -724,15 +786,23 @@ class IndisputableEvidence:
             specification_signature_v,
             ursula_pubkey_prefix_byte,
         )
-        return b''.join(pieces)
+        precomputed_values = b''.join(pieces)
+        self.__precomputed_values = (cfrag, precomputed_values)
+        return precomputed_values
 
     def evaluation_arguments(self) -> Tuple:
-        return (bytes(self.task.capsule),
-                bytes(self.task.cfrag),
-                bytes(self.task.cfrag_signature),
-                bytes(self.task.signature),
-                get_coordinates_as_bytes(self.bob_verifying_key),
-                get_coordinates_as_bytes(self.ursula_pubkey),
-                bytes(self.ursula_identity_evidence),
-                self.precompute_values()
-                )
+        cfrag = self.task.cfrag
+        if self.__evaluation_arguments and self.__evaluation_arguments[0] is cfrag:
+            return self.__evaluation_arguments[1]
+
+        arguments = (bytes(self.task.capsule),
+                     bytes(cfrag),
+                     bytes(self.task.cfrag_signature),
+                     bytes(self.task.signature),
+                     get_coordinates_as_bytes(self.bob_verifying_key),
+                     get_coordinates_as_bytes(self.ursula_pubkey),
+                     bytes(self.ursula_identity_evidence),
+                     self.precompute_values()
+                     )
+        self.__evaluation_arguments = (cfrag, arguments)
+        return arguments
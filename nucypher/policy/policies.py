@@ -30,11 +30,11 @@ from umbral.kfrags import KFrag
 from nucypher.blockchain.eth.actors import BlockchainPolicyAuthor
 from nucypher.blockchain.eth.agents import StakingEscrowAgent, PolicyManagerAgent
 from nucypher.characters.lawful import Alice, Ursula
-from nucypher.crypto.api import secure_random, keccak_digest
+from nucypher.crypto.api import secure_random
 from nucypher.crypto.constants import PUBLIC_KEY_LENGTH
 from nucypher.crypto.kits import RevocationKit
 from nucypher.crypto.powers import DecryptingPower, SigningPower
-from nucypher.crypto.utils import construct_policy_id
+from nucypher.crypto.utils import construct_policy_id, construct_policy_hrac
 from nucypher.network.exceptions import NodeSeemsToBeDown
 from nucypher.network.middleware import RestMiddleware
 
@@ -205,6 +205,10 @@ class Policy(ABC):
         self.treasure_map = TreasureMap(m=m)
         self.expiration = expiration
 
+        # Identifiers, computed once on first use
+        self.__id = None
+        self.__hrac = None
+
         # Keep track of this stuff
         self.selection_buffer = 1
 
@@ -229,7 +233,9 @@ class Policy(ABC):
 
     @property
     def id(self) -> bytes:
-        return construct_policy_id(self.label, bytes(self.bob.stamp))
+        if self.__id is None:
+            self.__id = construct_policy_id(self.label, bytes(self.bob.stamp))
+        return self.__id
 
     def __repr__(self):
         return f"{self.__class__.__name__}:{self.id.hex()[:6]}"
@@ -252,7 +258,9 @@ class Policy(ABC):
         Alice and Bob have all the information they need to construct this.
         Ursula does not, so we share it with her.
         """
-        return keccak_digest(bytes(self.alice.stamp) + bytes(self.bob.stamp) + self.label)
+        if self.__hrac is None:
+            self.__hrac = construct_policy_hrac(bytes(self.alice.stamp), bytes(self.bob.stamp), self.label)
+        return self.__hrac
 
     def publish_treasure_map(self, network_middleware: RestMiddleware) -> dict:
         self.treasure_map.prepare_for_publication(self.bob.public_keys(DecryptingPower),
@@ -334,9 +342,16 @@ class Policy(ABC):
         Assign kfrags to ursulas_on_network, and distribute them via REST,
         populating enacted_arrangements
         """
-        for arrangement in self.__assign_kfrags():
-            arrangement_message_kit = arrangement.encrypt_payload_for_ursula()
+        arrangements = list(self.__assign_kfrags())
+        if self.alice.crypto_workers:
+            message_kits = self.alice.crypto_workers.encrypt_and_sign(
+                recipient_pubkeys=[arrangement.ursula.public_keys(DecryptingPower) for arrangement in arrangements],
+                plaintexts=[arrangement.payload() for arrangement in arrangements],
+                signer=self.alice.stamp)
+        else:
+            message_kits = [arrangement.encrypt_payload_for_ursula() for arrangement in arrangements]
 
+        for arrangement, arrangement_message_kit in zip(arrangements, message_kits):
             try:
                 response = network_middleware.enact_policy(arrangement.ursula,
                                                            arrangement.id,
@@ -16,6 +16,8 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 
+from unittest.mock import patch
+
 import pytest
 from eth_tester.exceptions import TransactionFailed
 
@@ -90,6 +92,33 @@ def test_staker_divides_stake(staker, token_economics):
     assert expected_yet_another_stake.value == staker.stakes[stake_index + 3].value, 'Third stake values are invalid'
 
 
+@pytest.mark.usefixtures("agency")
+def test_staker_stake_list_refresh(testerchain, staker):
+    stakes = staker.stakes
+    staking_agent = stakes.staking_agent
+    stakes.refresh()
+    cached_stakes = list(stakes)
+    assert len(cached_stakes) == 4
+
+    with patch.object(staking_agent, 'get_all_stakes', wraps=staking_agent.get_all_stakes) as get_all_stakes:
+
+        # Nothing happened to this staker in this period, so there is nothing to re-read
+        stakes.refresh()
+        etherbase = testerchain.etherbase_account
+        txhash = testerchain.client.send_transaction({'from': etherbase, 'to': etherbase, 'value': 0})
+        testerchain.wait_for_receipt(txhash)
+        stakes.refresh()
+        assert get_all_stakes.call_count == 0
+
+        # Forced re-reads fetch every sub-stake in one batch and keep the unchanged ones
+        with patch.object(testerchain, '_send_rpc_batch', wraps=testerchain._send_rpc_batch) as send_batch:
+            stakes.refresh(force=True)
+            assert send_batch.call_count == 1
+        assert get_all_stakes.call_count == 1
+
+    assert all(stake is cached_stake for stake, cached_stake in zip(stakes, cached_stakes))
+
+
 def test_staker_manages_restaking(testerchain, test_registry, staker):
 
     # Enable Restaking
@@ -28,7 +28,7 @@ def test_worker_auto_confirmations(testerchain,
     # Get an unused address and create a new worker
     worker_address = testerchain.unassigned_accounts[-1]
 
-    # Control time
+    # Control time; the fallback looping call never runs, so work is only done on period rollovers
     clock = Clock()
     WorkTracker.CLOCK = clock
 
@@ -49,7 +49,13 @@ def test_worker_auto_confirmations(testerchain,
 
     def time_travel(_):
         testerchain.time_travel(periods=1)
-        clock.advance(WorkTracker.REFRESH_RATE+1)
+
+    def confirmation(_):
+        # The block head watcher sees the new period and the work tracker confirms the next one
+        next_period = staker.staking_agent.get_current_period() + 1
+        get_last_active_period = staker.staking_agent.get_last_active_period
+        return testerchain.block_watcher.when(
+            lambda: get_last_active_period(staker_address=staker.checksum_address) == next_period)
 
     def verify(_):
         # Verify that periods were confirmed on-chain automatically
@@ -61,5 +67,6 @@ def test_worker_auto_confirmations(testerchain,
     d = threads.deferToThread(start)
     for i in range(5):
         d.addCallback(time_travel)
+        d.addCallback(confirmation)
         d.addCallback(verify)
     yield d
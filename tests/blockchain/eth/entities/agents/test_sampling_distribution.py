@@ -15,11 +15,15 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import math
+import random
+import time
+
 import pytest
 from collections import Counter
 
 from nucypher.blockchain.economics import StandardTokenEconomics, BaseEconomics
-from nucypher.blockchain.eth.agents import StakingEscrowAgent
+from nucypher.blockchain.eth.agents import StakingEscrowAgent, StakerSampler
 from nucypher.blockchain.eth.interfaces import BlockchainInterface
 from nucypher.blockchain.eth.constants import STAKING_ESCROW_CONTRACT_NAME
 
@@ -142,3 +146,73 @@ def test_sampling_distribution(testerchain, token, deploy_contract):
         assert abs_error < ERROR_TOLERANCE
 
     # TODO: Test something wrt to % of failed
+
+
+def legacy_walk(stakers, points):
+    """The cumulative walk StakingEscrowAgent.sample used before StakerSampler; `points` must be sorted"""
+    selected = list()
+    point_index, sum_of_locked_tokens, staker_index = 0, 0, 0
+    while staker_index < len(stakers) and point_index < len(points):
+        current_staker, staker_tokens = stakers[staker_index]
+        next_sum_value = sum_of_locked_tokens + staker_tokens
+        if sum_of_locked_tokens <= points[point_index] < next_sum_value:
+            selected.append(current_staker)
+            point_index += 1
+        else:
+            staker_index += 1
+            sum_of_locked_tokens = next_sum_value
+    return selected
+
+
+def legacy_sample(stakers, n_tokens, quantity, additional_ursulas, attempts, random_source):
+    sample_size = quantity
+    for _ in range(attempts):
+        sample_size = math.ceil(sample_size * additional_ursulas)
+        points = sorted(random_source.randrange(n_tokens) for _ in range(sample_size))
+        addresses = set(legacy_walk(stakers=stakers, points=points))
+        if len(addresses) >= quantity:
+            return random_source.sample(list(addresses), quantity)
+    raise StakingEscrowAgent.NotEnoughStakers
+
+
+def test_sampler_matches_legacy_point_mapping():
+    stakers = [('A', 10), ('B', 0), ('C', 1), ('D', 25), ('E', 0), ('F', 4)]
+    sampler = StakerSampler(stakers=stakers)
+    assert sampler.total_tokens == 40
+
+    # Every point on the line maps to the same staker, and zero stakes are never selected
+    points = list(range(sampler.total_tokens))
+    assert sampler.draw(points) == legacy_walk(stakers=stakers, points=points)
+    assert not {'B', 'E'} & set(sampler.draw(points))
+
+
+def test_sampler_distribution_matches_legacy_sampling():
+    rng = random.Random(1729)
+    stakers = [(f'staker-{i}', rng.randint(1, 10 ** 6)) for i in range(20)]
+    n_tokens = sum(tokens for _staker, tokens in stakers)
+    sampler = StakerSampler(stakers=stakers)
+
+    SAMPLES = 5000
+    quantity = 3
+    new_counter, legacy_counter = Counter(), Counter()
+    new_random, legacy_random = random.Random(1), random.Random(2)
+    for _ in range(SAMPLES):
+        new_counter.update(sampler.sample(quantity=quantity, additional_ursulas=1.5, random_source=new_random))
+        legacy_counter.update(legacy_sample(stakers=stakers, n_tokens=n_tokens, quantity=quantity,
+                                            additional_ursulas=1.5, attempts=5, random_source=legacy_random))
+
+    total = SAMPLES * quantity
+    for staker, _tokens in stakers:
+        assert abs(new_counter[staker] / total - legacy_counter[staker] / total) < 0.02
+
+
+def test_sampler_draw_performance():
+    stakers = [(f'staker-{i}', random.randint(1, 10 ** 24)) for i in range(10_000)]
+    sampler = StakerSampler(stakers=stakers)
+
+    started = time.time()
+    for _ in range(100):
+        candidates = sampler.sample(quantity=300, additional_ursulas=1.5)
+        assert len(candidates) == len(set(candidates)) == 300
+    elapsed = time.time() - started
+    assert elapsed < 2
@@ -15,7 +15,9 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import math
 import os
+from unittest.mock import patch
 
 import pytest
 from eth_utils.address import to_checksum_address, is_address
@@ -144,6 +146,44 @@ def test_get_swarm(agency, blockchain_ursulas):
     assert is_address(staker_addr)
 
 
+@pytest.mark.slow()
+@pytest.mark.usefixtures("blockchain_ursulas")
+def test_batched_staker_reads(agency):
+    _token_agent, staking_agent, _policy_agent = agency
+    blockchain = staking_agent.blockchain
+    num_stakers = staking_agent.get_staker_population()
+    current_period = staking_agent.get_current_period()
+
+    # One call per staker, the way these were read before batching
+    expected_stakers = [staking_agent.contract.functions.stakers(i).call() for i in range(num_stakers)]
+    expected_periods = [staking_agent.get_last_active_period(staker) for staker in expected_stakers]
+
+    batch_size = 2
+    with patch.object(blockchain, '_send_rpc_batch', wraps=blockchain._send_rpc_batch) as send_batch:
+        stakers = staking_agent.batch_call((staking_agent.contract.functions.stakers(i) for i in range(num_stakers)),
+                                           batch_size=batch_size)
+    assert stakers == expected_stakers
+    assert send_batch.call_count == math.ceil(num_stakers / batch_size)  # O(N/chunk) round trips, not O(N)
+
+    with patch.object(blockchain, '_send_rpc_batch', wraps=blockchain._send_rpc_batch) as send_batch:
+        assert staking_agent.get_stakers() == expected_stakers
+        assert send_batch.call_count == 1
+
+    with patch.object(blockchain, '_send_rpc_batch', wraps=blockchain._send_rpc_batch) as send_batch:
+        staking_agent.get_staker_snapshot(refresh=True)
+        assert send_batch.call_count == 0  # Nothing is read until it's needed...
+        active, pending, missing = staking_agent.partition_stakers_by_activity()
+        assert send_batch.call_count == 2  # ...then stakers, and their last active periods
+
+    for staker, period in zip(expected_stakers, expected_periods):
+        if period == current_period + 1:
+            assert staker in active
+        elif period == current_period:
+            assert staker in pending
+        else:
+            assert staker in missing
+
+
 @pytest.mark.slow()
 @pytest.mark.usefixtures("blockchain_ursulas")
 def test_sample_stakers(agency):
@@ -177,6 +217,38 @@ def test_get_current_period(agency, testerchain):
     assert end_period > start_period
 
 
+def test_staker_snapshot_cache(agency, testerchain):
+    _token_agent, staking_agent, _policy_agent = agency
+
+    snapshot = staking_agent.get_staker_snapshot(refresh=True)
+    assert snapshot.period == staking_agent.get_current_period()
+    assert snapshot.stakers == staking_agent.get_stakers()
+
+    # Within the freshness interval, the chain isn't even checked for changes
+    with patch.object(StakingEscrowAgent, 'SNAPSHOT_FRESHNESS_INTERVAL', 60), \
+            patch.object(staking_agent, 'get_current_period') as get_current_period, \
+            patch.object(staking_agent.blockchain.client.w3.eth, 'getLogs') as get_logs:
+        for _ in range(10):
+            assert staking_agent.get_staker_snapshot() is snapshot
+        assert not get_current_period.called
+        assert not get_logs.called
+
+    # Blocks without staking events don't invalidate the snapshot
+    tx = testerchain.w3.eth.sendTransaction({'from': testerchain.etherbase_account,
+                                             'to': testerchain.unassigned_accounts[-1],
+                                             'value': 1})
+    testerchain.wait_for_receipt(tx)
+    assert staking_agent.get_staker_snapshot() is snapshot
+
+    # Repeated reads of active stakers are served from the snapshot
+    n_tokens, stakers = staking_agent.get_all_active_stakers(periods=1)
+    with patch.object(staking_agent, '_read_active_stakers') as read_active_stakers:
+        assert staking_agent.get_all_active_stakers(periods=1) == (n_tokens, stakers)
+        assert not read_active_stakers.called
+
+    assert staking_agent.get_staker_snapshot(refresh=True) is not snapshot
+
+
 @pytest.mark.slow()
 def test_confirm_activity(agency, testerchain, mock_transacting_power_activation):
     _token_agent, staking_agent, _policy_agent = agency
@@ -185,10 +257,18 @@ def test_confirm_activity(agency, testerchain, mock_transacting_power_activation
 
     mock_transacting_power_activation(account=worker_account, password=INSECURE_DEVELOPMENT_PASSWORD)
 
+    snapshot = staking_agent.get_staker_snapshot()
     receipt = staking_agent.confirm_activity(worker_address=worker_account)
     assert receipt['status'] == 1, "Transaction Rejected"
     assert receipt['logs'][0]['address'] == staking_agent.contract_address
 
+    # The ActivityConfirmed event invalidates the cached staker snapshot
+    new_snapshot = staking_agent.get_staker_snapshot()
+    assert new_snapshot is not snapshot
+    assert new_snapshot.block_number == receipt['blockNumber']
+    active_stakers, _pending, _missing = staking_agent.partition_stakers_by_activity()
+    assert staker_account in active_stakers
+
 
 @pytest.mark.skip('To be implemented')
 def test_divide_stake(agency, token_economics):
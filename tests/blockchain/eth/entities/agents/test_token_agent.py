@@ -14,11 +14,15 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+import math
+from unittest.mock import patch
+
 import pytest
 from eth_tester.exceptions import TransactionFailed
 
 from nucypher.blockchain.eth.agents import NucypherTokenAgent
 from nucypher.blockchain.eth.deployers import NucypherTokenDeployer, DispatcherDeployer
+from nucypher.blockchain.eth.interfaces import NonceManager
 from nucypher.crypto.powers import TransactingPower
 from nucypher.utilities.sandbox.constants import INSECURE_DEVELOPMENT_PASSWORD
 
@@ -96,6 +100,119 @@ def test_transfer(agent, token_economics, mock_transacting_power_activation):
     assert new_balance == old_balance + token_economics.minimum_allowed_locked
 
 
+def test_batch_transfer(agent, token_economics, mock_transacting_power_activation):
+    testerchain = agent.blockchain
+    origin, *recipients = testerchain.client.accounts
+    amount = token_economics.minimum_allowed_locked
+
+    mock_transacting_power_activation(account=origin, password=INSECURE_DEVELOPMENT_PASSWORD)
+
+    old_balances = {recipient: agent.get_balance(recipient) for recipient in recipients}
+    first_nonce = testerchain.client.w3.eth.getTransactionCount(origin, 'pending')
+
+    transfers = [(recipient, amount) for recipient in recipients]
+    w3_eth = testerchain.client.w3.eth
+    with patch.object(w3_eth, 'getTransactionCount', wraps=w3_eth.getTransactionCount) as get_transaction_count:
+        receipts = agent.batch_transfer(transfers=transfers, sender_address=origin, window=4)
+        assert get_transaction_count.call_count == 1  # Nonces are tracked locally within the pipeline
+
+    assert len(receipts) == len(recipients)
+    assert all(receipt['status'] == 1 for receipt in receipts)
+    nonces = [testerchain.client.get_transaction(receipt['transactionHash'])['nonce'] for receipt in receipts]
+    assert nonces == list(range(first_nonce, first_nonce + len(recipients)))
+
+    for recipient in recipients:
+        assert agent.get_balance(recipient) == old_balances[recipient] + amount
+
+    # Unpipelined transactions still see the right nonce afterwards
+    receipt = agent.transfer(amount=amount, target_address=recipients[0], sender_address=origin)
+    assert receipt['status'] == 1
+
+
+def test_batch_transfer_waits_once_per_window(agent, token_economics, mock_transacting_power_activation):
+    testerchain = agent.blockchain
+    client = testerchain.client
+    origin, *recipients = client.accounts
+    transfers = [(recipient, token_economics.minimum_allowed_locked) for recipient in recipients[:6]]
+
+    mock_transacting_power_activation(account=origin, password=INSECURE_DEVELOPMENT_PASSWORD)
+
+    send_raw_transaction = client.send_raw_transaction
+    rounds_by_window = dict()
+    for window in (1, 2, 3, len(transfers)):
+        events = list()
+
+        def broadcast(raw_transaction):
+            events.append('broadcast')
+            return send_raw_transaction(raw_transaction)
+
+        w3_eth = client.w3.eth
+        with patch.object(client, 'send_raw_transaction', side_effect=broadcast), \
+                patch.object(w3_eth, 'getTransactionCount', wraps=w3_eth.getTransactionCount) as get_transaction_count:
+            agent.batch_transfer(transfers=transfers,
+                                 sender_address=origin,
+                                 window=window,
+                                 on_receipt=lambda index, receipt: events.append('receipt'))
+            assert get_transaction_count.call_count == 1
+
+        # Each round trip broadcasts a window of transactions, then waits for their receipts together
+        rounds = sum(1 for event, next_event in zip(events, events[1:]) if (event, next_event) == ('broadcast', 'receipt'))
+        assert events.count('broadcast') == events.count('receipt') == len(transfers)
+        assert rounds == math.ceil(len(transfers) / window)
+        rounds_by_window[window] = rounds
+
+    # Sending one at a time takes a round trip per transaction; a full window, only one
+    assert rounds_by_window == {1: 6, 2: 3, 3: 2, 6: 1}
+
+
+def test_batch_transfer_reports_transfers_made_before_a_failure(agent, token_economics, mock_transacting_power_activation):
+    testerchain = agent.blockchain
+    origin, *recipients = testerchain.client.accounts
+    amount = token_economics.minimum_allowed_locked
+
+    mock_transacting_power_activation(account=origin, password=INSECURE_DEVELOPMENT_PASSWORD)
+
+    old_balances = {recipient: agent.get_balance(recipient) for recipient in recipients[:4]}
+    overdraft = agent.get_balance(origin) + 1
+    transfers = [(recipients[0], amount), (recipients[1], amount), (recipients[2], overdraft), (recipients[3], amount)]
+
+    reported = dict()
+    with pytest.raises((TransactionFailed, ValueError)):
+        agent.batch_transfer(transfers=transfers,
+                             sender_address=origin,
+                             window=4,
+                             on_receipt=lambda index, receipt: reported.update({index: receipt}))
+
+    # Transfers broadcast before the failure are reported; the rest of the window is never sent
+    assert sorted(reported) == [0, 1]
+    assert all(receipt['status'] == 1 for receipt in reported.values())
+    assert agent.get_balance(recipients[0]) == old_balances[recipients[0]] + amount
+    assert agent.get_balance(recipients[1]) == old_balances[recipients[1]] + amount
+    assert agent.get_balance(recipients[3]) == old_balances[recipients[3]]
+
+    # The nonce of the failed transfer was released, so later transactions go through
+    receipt = agent.transfer(amount=amount, target_address=recipients[3], sender_address=origin)
+    assert receipt['status'] == 1
+
+
+def test_nonce_manager_reuses_released_nonces(testerchain):
+    origin = testerchain.client.accounts[0]
+    nonce_manager = NonceManager(client=testerchain.client)
+
+    first_nonce = nonce_manager.sync(origin)
+    assert first_nonce == testerchain.client.w3.eth.getTransactionCount(origin, 'pending')
+    nonces = [nonce_manager.reserve(origin) for _ in range(3)]
+    assert nonces == [first_nonce, first_nonce + 1, first_nonce + 2]
+
+    # Releasing the latest nonce rolls back; releasing an earlier one leaves a gap to be refilled first
+    nonce_manager.release(origin, first_nonce + 2)
+    nonce_manager.release(origin, first_nonce)
+    assert nonce_manager.gaps(origin) == [first_nonce]
+    assert nonce_manager.reserve(origin) == first_nonce
+    assert nonce_manager.reserve(origin) == first_nonce + 2
+    assert not nonce_manager.gaps(origin)
+
+
 def test_approve_and_call(agent, token_economics, mock_transacting_power_activation, deploy_contract):
     testerchain = agent.blockchain
     deployer, someone, *everybody_else = testerchain.client.accounts
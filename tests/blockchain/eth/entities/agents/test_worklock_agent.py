@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 from eth_tester.exceptions import TransactionFailed
 
@@ -42,6 +44,27 @@ def test_get_deposited_eth(testerchain, agency, token_economics, test_registry):
     assert bid == small_bid
 
 
+def test_bidder_table(testerchain, agency, token_economics, test_registry):
+    agent = ContractAgency.get_agent(WorkLockAgent, registry=test_registry)
+    bidders = agent.get_bidders()
+    assert bidders
+
+    blockchain = agent.blockchain
+    with patch.object(blockchain, '_send_rpc_batch', wraps=blockchain._send_rpc_batch) as send_batch:
+        table = agent.get_bidder_table(force_read=True)
+        # Bidder addresses, then work info and lot parameters: one batch each
+        assert send_batch.call_count == 2
+
+        # Cached until the next block
+        assert agent.get_bidder_table() is table
+        assert send_batch.call_count == 2
+
+    assert table.bidders == bidders
+    for bidder in bidders:
+        assert table.get_deposited_eth(bidder) == agent.get_deposited_eth(bidder)
+    assert table.bonus_lot_value == agent.get_bonus_lot_value()
+
+
 def test_cancel_bid(testerchain, agency, token_economics, test_registry):
     bidder = testerchain.client.accounts[1]
     agent = ContractAgency.get_agent(WorkLockAgent, registry=test_registry)
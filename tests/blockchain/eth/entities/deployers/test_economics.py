@@ -16,10 +16,16 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 
+import json
+import os
 from decimal import Decimal, localcontext
 from math import log
+from unittest.mock import patch
 
-from nucypher.blockchain.economics import LOG2, StandardTokenEconomics
+import pytest
+
+from nucypher.blockchain.economics import LOG2, StandardTokenEconomics, EconomicsFactory
+from nucypher.blockchain.eth.interfaces import BlockchainInterface
 
 
 def test_rough_economics():
@@ -193,3 +199,74 @@ def test_economic_parameter_aliases():
     assert isinstance(deployment_params, tuple)
     for parameter in deployment_params:
         assert isinstance(parameter, int)
+
+
+def test_reward_projection_series():
+
+    def legacy_token_supply_at_period(economics, period: int) -> int:
+        with localcontext() as ctx:
+            ctx.prec = economics._precision
+            t = Decimal(period)
+            S_0 = economics.erc20_initial_supply
+            I_0 = 1 * S_0
+            T_half = economics.token_halving
+            T_half_in_days = T_half * 365
+            S_t = S_0 + I_0 * T_half * (1 - 2**(-t / T_half_in_days)) / LOG2
+            return int(S_t)
+
+    for halving_delay in (2, 3):
+        e = StandardTokenEconomics(halving_delay=halving_delay)
+        periods = range(0, 3 * 365)
+        expected_supplies = [legacy_token_supply_at_period(e, period) for period in periods]
+
+        # Bit for bit
+        assert e.token_supply_series(0, periods[-1]) == expected_supplies
+        assert e.cumulative_rewards_series(0, periods[-1]) == [supply - e.erc20_initial_supply
+                                                               for supply in expected_supplies]
+        assert e.rewards_series(1, periods[-1]) == [expected_supplies[period] - expected_supplies[period - 1]
+                                                    for period in periods[1:]]
+        assert all(e.rewards_during_period(period) == reward
+                   for period, reward in zip(range(1, 30), e.rewards_series(1, 29)))
+
+        # Extending a projection only evaluates the new periods
+        with patch('nucypher.blockchain.economics.Decimal', wraps=Decimal) as decimal:
+            assert len(e.rewards_series(periods[-1] - 10, periods[-1] + 10)) == 21
+            assert decimal.call_count == 10
+
+    with pytest.raises(ValueError):
+        e.rewards_series(0, 10)
+
+
+def test_economics_factory_cache(testerchain, agency, test_registry, tmpdir):
+    cache_filepath = os.path.join(str(tmpdir), 'economics.json')
+    assert EconomicsFactory.retrieve_from_cache(registry=test_registry, cache_filepath=cache_filepath) is None
+
+    # All parameters are read in one batch
+    with patch.object(testerchain, '_send_rpc_batch', wraps=testerchain._send_rpc_batch) as send_batch:
+        economics = EconomicsFactory.retrieve_from_blockchain(registry=test_registry, cache_filepath=cache_filepath)
+        assert send_batch.call_count == 1
+
+        # Then served from disk, but for the supplies and proxy targets, which are read again in one batch
+        cached_economics = EconomicsFactory.retrieve_from_cache(registry=test_registry, cache_filepath=cache_filepath)
+        assert send_batch.call_count == 2
+
+    assert cached_economics.erc20_initial_supply == economics.erc20_initial_supply
+    assert cached_economics.erc20_total_supply == economics.erc20_total_supply
+    assert cached_economics.staking_deployment_parameters == economics.staking_deployment_parameters
+    assert cached_economics.slashing_deployment_parameters == economics.slashing_deployment_parameters
+
+    with open(cache_filepath) as cache_file:
+        cache = json.load(cache_file)
+
+    def assert_cache_not_used_with(**changes):
+        with open(cache_filepath, 'w') as cache_file:
+            json.dump({test_registry.id: dict(cache[test_registry.id], **changes)}, cache_file)
+        assert EconomicsFactory.retrieve_from_cache(registry=test_registry, cache_filepath=cache_filepath) is None
+
+    # Economics read at a block that isn't on this chain are not used
+    assert_cache_not_used_with(block_hash='0x' + '00' * 32)
+
+    # Nor are those read before an upgrade of a contract behind its dispatcher
+    target_addresses = cache[test_registry.id]['target_addresses']
+    assert target_addresses
+    assert_cache_not_used_with(target_addresses=[BlockchainInterface.NULL_ADDRESS] * len(target_addresses))
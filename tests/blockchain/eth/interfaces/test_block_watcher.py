@@ -0,0 +1,78 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import pytest_twisted
+from twisted.internet import threads
+from twisted.internet.defer import CancelledError
+from web3.exceptions import TimeExhausted
+
+from nucypher.blockchain.eth.watchers import BlockHeadWatcher
+
+
+def mine_block(testerchain) -> dict:
+    account = testerchain.etherbase_account
+    txhash = testerchain.client.send_transaction({'from': account, 'to': account, 'value': 0})
+    return testerchain.wait_for_receipt(txhash)
+
+
+def test_one_watcher_serves_concurrent_waiters(testerchain):
+    watcher = BlockHeadWatcher(w3=testerchain.w3, poll_interval=0.01)
+    receipt = mine_block(testerchain)
+
+    # Already satisfied conditions return without waiting for a block
+    assert watcher.wait_for_receipt(receipt['transactionHash'], timeout=1)['blockNumber'] == receipt['blockNumber']
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        waiters = [executor.submit(watcher.wait_for_confirmations, receipt, confirmations, 10)
+                   for confirmations in (1, 2, 2, 3)]
+        for _ in range(3):
+            mine_block(testerchain)
+        assert all(waiter.result() == receipt for waiter in waiters)
+
+    with pytest.raises(TimeExhausted):
+        watcher.wait_for_confirmations(receipt=receipt, confirmations=100, timeout=0.1)
+
+
+@pytest_twisted.inlineCallbacks
+def test_deferred_confirmation(testerchain):
+    watcher = BlockHeadWatcher(w3=testerchain.w3, poll_interval=0.01)
+    receipt = mine_block(testerchain)
+
+    d = watcher.when_confirmed(receipt=receipt, confirmations=2)
+    assert not d.called
+
+    yield threads.deferToThread(mine_block, testerchain)
+    yield threads.deferToThread(mine_block, testerchain)
+    confirmed_receipt = yield d
+    assert confirmed_receipt == receipt
+
+
+def test_cancelling_the_last_deferred_wait_stops_the_watcher(testerchain):
+    watcher = BlockHeadWatcher(w3=testerchain.w3, poll_interval=0.01)
+    d = watcher.when(lambda: False)
+    d.addErrback(lambda failure: failure.trap(CancelledError))
+    assert watcher.running
+
+    d.cancel()
+    deadline = time.monotonic() + 5
+    while watcher.running and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not watcher.running
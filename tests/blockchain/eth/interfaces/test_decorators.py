@@ -16,10 +16,14 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import os
+from unittest.mock import patch
+
+import eth_utils
 import pytest
 
 from eth_utils import to_checksum_address
 
+from nucypher.blockchain.eth import decorators
 from nucypher.blockchain.eth.decorators import validate_checksum_address, InvalidChecksumAddress
 
 
@@ -76,3 +80,79 @@ def test_validate_checksum_address(get_random_checksum_address):
     assert multiple_checksum_addresses(42,
                                        worker_address=get_random_checksum_address(),
                                        staking_address=get_random_checksum_address())
+
+
+def test_validate_checksum_address_keyword_only_and_defaults(get_random_checksum_address):
+
+    @validate_checksum_address
+    def keyword_only_address(*, beneficiary_address, owner_address=None):
+        return True
+
+    with pytest.raises(InvalidChecksumAddress):
+        keyword_only_address(beneficiary_address="0x_NOT_VALID")
+
+    with pytest.raises(InvalidChecksumAddress):
+        keyword_only_address(beneficiary_address=get_random_checksum_address(), owner_address="0x_NOT_VALID")
+
+    assert keyword_only_address(beneficiary_address=get_random_checksum_address())
+
+    # Missing arguments are left to the call itself
+    with pytest.raises(TypeError):
+        keyword_only_address()
+
+    # Non-null defaults are validated too
+    @validate_checksum_address
+    def bad_default(checksum_address="0x_NOT_VALID"):
+        return True
+
+    with pytest.raises(InvalidChecksumAddress):
+        bad_default()
+
+    assert bad_default(get_random_checksum_address())
+
+    # Nothing to check, nothing to wrap
+    def no_addresses(whatever):
+        return True
+
+    assert validate_checksum_address(no_addresses) is no_addresses
+
+
+def test_validated_addresses_are_not_validated_again(get_random_checksum_address):
+    verified_addresses = vars(decorators)['__VERIFIED_ADDRESSES']
+    checksum_addresses = [get_random_checksum_address() for _ in range(3)]
+
+    @validate_checksum_address
+    def validate(self, value, staking_address=None):
+        return value
+
+    with patch.dict(verified_addresses, clear=True), \
+            patch('eth_utils.is_checksum_address', wraps=eth_utils.is_checksum_address) as is_checksum_address:
+        for _ in range(100):
+            for checksum_address in checksum_addresses:
+                assert validate(None, 1, staking_address=checksum_address) == 1
+        assert is_checksum_address.call_count == len(checksum_addresses)  # Once per address
+
+        # Invalid addresses are never remembered
+        for _ in range(2):
+            with pytest.raises(InvalidChecksumAddress):
+                validate(None, 1, staking_address=checksum_addresses[0].lower())
+        assert is_checksum_address.call_count == len(checksum_addresses) + 2
+
+
+def test_validated_addresses_are_evicted_least_recently_used_first(get_random_checksum_address):
+    verified_addresses = vars(decorators)['__VERIFIED_ADDRESSES']
+    first, second, third = (get_random_checksum_address() for _ in range(3))
+
+    @validate_checksum_address
+    def validate(checksum_address):
+        return checksum_address
+
+    with patch.dict(verified_addresses, clear=True), \
+            patch.object(decorators, 'VERIFIED_ADDRESSES_CACHE_SIZE', 2), \
+            patch('eth_utils.is_checksum_address', wraps=eth_utils.is_checksum_address) as is_checksum_address:
+        validate(first)
+        validate(second)
+        validate(first)  # Recently used again...
+        validate(third)  # ...so the second address is evicted instead
+        assert list(verified_addresses) == [first, third]
+        assert is_checksum_address.call_count == 3
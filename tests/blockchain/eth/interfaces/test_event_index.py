@@ -0,0 +1,64 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+
+def summarize(event_records):
+    return [(record.block_number, record.transaction_hash, record.args) for record in event_records]
+
+
+@pytest.mark.usefixtures('stakers')
+def test_event_index_serves_events_from_disk(testerchain, agency, tmpdir):
+    _token_agent, staking_agent, _policy_agent = agency
+    db_filepath = os.path.join(str(tmpdir), 'events.db')
+
+    live_deposits = summarize(staking_agent.events.Deposited(from_block=0))
+    assert live_deposits
+
+    index = testerchain.enable_event_index(db_filepath=db_filepath, confirmations=0, block_window=10)
+    try:
+        # Initial sync happens in bounded windows
+        with patch.object(testerchain.client.w3.eth, 'getLogs', wraps=testerchain.client.w3.eth.getLogs) as get_logs:
+            indexed_deposits = summarize(staking_agent.events.Deposited(from_block=0))
+            assert get_logs.call_count >= testerchain.client.block_number // 10
+        assert indexed_deposits == live_deposits
+
+        # Synced blocks and their timestamps are served from disk
+        with patch.object(testerchain.client.w3.eth, 'getBlock', wraps=testerchain.client.w3.eth.getBlock) as get_block:
+            records = list(staking_agent.events.Deposited(from_block=0))
+            assert get_block.call_count == 1  # Only the canonical chain check of the last indexed block
+        assert all(isinstance(record.timestamp, int) for record in records)
+
+        staker = live_deposits[0][2]['staker']
+        staker_deposits = summarize(staking_agent.events.Deposited(from_block=0, staker=staker))
+        assert staker_deposits == [deposit for deposit in live_deposits if deposit[2]['staker'] == staker]
+
+        # The last indexed block is no longer canonical; the index rewinds and syncs again
+        synced_block = index.synced_block(staking_agent.contract_address)
+        with sqlite3.connect(db_filepath) as db:
+            db.execute("UPDATE sync_state SET block_hash = '0xdead'")
+        assert index.sync(staking_agent.contract) == synced_block
+        assert summarize(staking_agent.events.Deposited(from_block=0)) == live_deposits
+
+    finally:
+        testerchain.event_index = None
+        index.close()
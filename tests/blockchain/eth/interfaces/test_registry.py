@@ -16,11 +16,19 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import json
+import os
+from unittest.mock import patch
+
 import pytest
 
+from nucypher.blockchain.eth.agents import NucypherTokenAgent
 from nucypher.blockchain.eth.constants import PREALLOCATION_ESCROW_CONTRACT_NAME
 from nucypher.blockchain.eth.interfaces import BaseContractRegistry
-from nucypher.blockchain.eth.registry import LocalContractRegistry, IndividualAllocationRegistry
+from nucypher.blockchain.eth.registry import (
+    LocalContractRegistry,
+    IndividualAllocationRegistry,
+    InMemoryContractRegistry
+)
 from nucypher.utilities.sandbox.constants import TEMPORARY_DOMAIN
 
 
@@ -70,6 +78,11 @@ def test_contract_registry(tempfile_path):
     assert abi == test_abi
     assert version == test_version
 
+    # ...narrowed to a contract name
+    assert test_registry.search(contract_name=test_name, contract_address=test_addr) == contract_record
+    with pytest.raises(BaseContractRegistry.UnknownContract):
+        test_registry.search(contract_name='this does not exist', contract_address=test_addr)
+
     # Check that searching for an unknown contract raises
     with pytest.raises(BaseContractRegistry.UnknownContract):
         test_registry.search(contract_name='this does not exist')
@@ -84,6 +97,62 @@ def test_contract_registry(tempfile_path):
         test_registry.search(contract_address=test_addr)
 
 
+def test_registry_index_invalidation(tempfile_path, get_random_checksum_address):
+    registry = LocalContractRegistry(filepath=tempfile_path)
+    first_address, second_address = get_random_checksum_address(), get_random_checksum_address()
+    registry.enroll(contract_name='TestContract', contract_version='v1',
+                    contract_address=first_address, contract_abi=['fake', 'data'])
+
+    with patch.object(registry, 'read', wraps=registry.read) as read:
+        registry_id = registry.id
+        assert registry.search(contract_name='TestContract', contract_version='v1')
+        assert registry.search(contract_address=first_address)
+        assert read.call_count == 1
+
+    # Enrolling through the registry invalidates the index
+    registry.enroll(contract_name='TestContract', contract_version='v2',
+                    contract_address=second_address, contract_abi=['fake', 'data'])
+    assert registry.id != registry_id
+    assert len(registry.search(contract_name='TestContract')) == 2
+
+    # So does changing the file behind the registry's back
+    other_registry = LocalContractRegistry(filepath=tempfile_path)
+    other_registry.write(other_registry.read()[:1])
+    stat = os.stat(tempfile_path)
+    os.utime(tempfile_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert len(registry.search(contract_name='TestContract')) == 1
+    assert registry.id == registry_id
+
+    # In-memory registries share the same index
+    memory_registry = InMemoryContractRegistry()
+    memory_registry.write(registry.read())
+    assert memory_registry.search(contract_address=first_address) == registry.search(contract_address=first_address)
+    memory_registry.write(list())
+    with pytest.raises(BaseContractRegistry.UnknownContract):
+        memory_registry.search(contract_address=first_address)
+
+
+def test_agent_construction_with_large_registry(testerchain, test_registry, tempfile_path, get_random_checksum_address):
+    # Many versions of many contracts, followed by the real ones
+    registry_data = list()
+    for contract_index in range(50):
+        for version in range(40):
+            registry_data.append([f'Contract{contract_index}', f'v{version}.0.0',
+                                  get_random_checksum_address(), [{'type': 'fallback'}]])
+    registry_data.extend(test_registry.read())
+
+    large_registry = LocalContractRegistry(filepath=tempfile_path)
+    large_registry.write(registry_data)
+
+    iterations = 100
+    with patch.object(large_registry, 'read', wraps=large_registry.read) as read:
+        for _ in range(iterations):
+            agent = NucypherTokenAgent(registry=large_registry)
+        assert read.call_count == 1
+
+    assert agent.contract_address == NucypherTokenAgent(registry=test_registry).contract_address
+
+
 def test_individual_allocation_registry(get_random_checksum_address,
                                         test_registry,
                                         tempfile_path,
@@ -17,6 +17,7 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 import datetime
 import os
+from unittest.mock import patch
 
 import maya
 import pytest
@@ -26,7 +27,8 @@ from nucypher.characters.lawful import Bob, Enrico
 from nucypher.config.characters import AliceConfiguration
 from nucypher.crypto.api import keccak_digest
 from nucypher.crypto.powers import SigningPower, DecryptingPower
-from nucypher.policy.collections import Revocation, PolicyCredential
+from nucypher.crypto.utils import construct_map_id
+from nucypher.policy.collections import Revocation, PolicyCredential, TreasureMap
 from nucypher.utilities.sandbox.constants import INSECURE_DEVELOPMENT_PASSWORD
 from nucypher.utilities.sandbox.middleware import MockRestMiddleware
 
@@ -126,6 +128,43 @@ def test_federated_grant(federated_alice, federated_bob):
         assert kfrag == retrieved_kfrag
 
 
+def test_treasure_map_publication_and_lookup_benchmark(enacted_federated_policy, federated_alice, federated_bob):
+    treasure_map = enacted_federated_policy.treasure_map
+    alice_verifying_key = federated_alice.stamp.as_umbral_pubkey()
+
+    # Bob and Alice derive the same map ID
+    _hrac, map_id = federated_bob.construct_hrac_and_map_id(alice_verifying_key, enacted_federated_policy.label)
+    assert map_id == treasure_map.public_id()
+    assert _hrac == enacted_federated_policy.hrac()
+
+    # 10k maps, as received by an Ursula, each for its own label
+    labels = [os.urandom(16) for _ in range(10_000)]
+    hracs = [federated_alice.stamp + federated_bob.stamp + label for label in labels]
+    treasure_maps = [TreasureMap(message_kit=treasure_map.message_kit,
+                                 public_signature=treasure_map._public_signature,
+                                 hrac=keccak_digest(hrac))
+                     for hrac in hracs]
+
+    with patch('nucypher.policy.collections.construct_map_id', wraps=construct_map_id) as map_id_digests, \
+            patch('nucypher.characters.lawful.construct_map_id', wraps=construct_map_id) as bob_map_id_digests:
+        # Publication, as Ursula stores them...
+        stored_maps = dict()
+        for each_map in treasure_maps:
+            stored_maps[bytes.fromhex(each_map.public_id())] = each_map
+        assert len(stored_maps) == len(treasure_maps)
+
+        # ...and lookup, as Bob asks for them (twice) and Ursula logs them.
+        for _ in range(2):
+            for label, each_map in zip(labels, treasure_maps):
+                _hrac, map_id = federated_bob.construct_hrac_and_map_id(alice_verifying_key, label)
+                assert stored_maps[bytes.fromhex(map_id)] is each_map
+                assert repr(each_map).endswith(each_map.public_id()[:6])
+
+    # Each map's public ID is hashed only once by the map, and once by Bob, however often it is asked for
+    assert map_id_digests.call_count == len(treasure_maps)
+    assert bob_map_id_digests.call_count == len(labels)
+
+
 def test_federated_alice_can_decrypt(federated_alice, federated_bob):
     """
     Test that alice can decrypt data encrypted by an enrico
@@ -15,16 +15,25 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from unittest.mock import patch
+
 import pytest
 import pytest_twisted
 from twisted.internet import threads
 from umbral import pre
 from umbral.cfrags import CapsuleFrag
+from umbral.curvebn import CurveBN
+from umbral.keys import UmbralPrivateKey
 from umbral.kfrags import KFrag
+from umbral.signing import Signer
 
+from nucypher.characters.lawful import Bob
 from nucypher.crypto.kits import PolicyMessageKit
 from nucypher.utilities.sandbox.middleware import NodeIsDownMiddleware
 from nucypher.crypto.powers import DecryptingPower
+from nucypher.crypto.utils import canonical_address_from_umbral_key
+from nucypher.network.server import ReencryptionReplayCache
+from nucypher.policy.collections import IndisputableEvidence, WorkOrder
 from nucypher.utilities.sandbox.constants import TEMPORARY_DOMAIN
 from nucypher.utilities.sandbox.middleware import MockRestMiddleware
 
@@ -217,6 +226,29 @@ def test_bob_can_issue_a_work_order_to_a_specific_ursula(enacted_federated_polic
     assert work_orders_from_bob[0].bob_signature == work_order.receipt_signature
 
 
+def test_ursula_replays_response_to_retried_work_order(federated_bob, federated_ursulas):
+    # Bob's only completed WorkOrder, from the test above
+    work_orders_by_capsule = list(federated_bob._completed_work_orders.by_ursula.values())[0]
+    work_order = list(work_orders_by_capsule.values())[0]
+    ursula = next(u for u in federated_ursulas if u.rest_interface.port == work_order.ursula.rest_interface.port)
+    saved_work_orders = len(ursula.work_orders(bob=federated_bob))
+
+    # A storm of retries of the same WorkOrder...
+    retries = 50
+    with patch.object(ursula, '_reencrypt', wraps=ursula._reencrypt) as reencrypt:
+        responses = {federated_bob.network_middleware.send_work_order_payload_to_ursula(work_order).content
+                     for _ in range(retries)}
+
+    # ...is answered with the original response, without re-encrypting or recording the WorkOrder again.
+    assert len(responses) == 1
+    assert reencrypt.call_count == 0
+    assert len(ursula.work_orders(bob=federated_bob)) == saved_work_orders
+
+    # The response is persisted too, so a restarted Ursula can still replay it.
+    digest = ReencryptionReplayCache.digest(work_order.arrangement_id, work_order.payload())
+    assert ursula.datastore.get_reencryption_response(work_order_digest=digest) == responses.pop()
+
+
 def test_bob_can_use_cfrag_attached_to_completed_workorder(enacted_federated_policy,
                                                            federated_alice,
                                                            federated_bob,
@@ -678,3 +710,54 @@ def test_bob_retrieves_multiple_messages_in_a_single_adventure(federated_bob,
     assert b"Welcome to flippering number 0." == delivered_cleartexts[0]
     assert b"Welcome to flippering number 0." == delivered_cleartexts[1]
     assert b"Welcome to flippering number 0." == delivered_cleartexts[2]
+
+
+def test_indisputable_evidence_for_many_faulty_cfrags(federated_ursulas):
+    ursula = list(federated_ursulas)[0]
+
+    # One policy, one capsule, and 1k faulty CFrags for it
+    delegating_privkey = UmbralPrivateKey.gen_key()
+    signing_privkey = UmbralPrivateKey.gen_key()
+    bob_privkey = UmbralPrivateKey.gen_key()
+    kfrags = pre.generate_kfrags(delegating_privkey=delegating_privkey,
+                                 receiving_pubkey=bob_privkey.get_pubkey(),
+                                 threshold=2,
+                                 N=4,
+                                 signer=Signer(signing_privkey),
+                                 sign_delegating_key=False,
+                                 sign_receiving_key=False)
+    _symmetric_key, capsule = pre._encapsulate(delegating_privkey.get_pubkey())
+    capsule.set_correctness_keys(delegating_privkey.get_pubkey(), bob_privkey.get_pubkey(), signing_privkey.get_pubkey())
+
+    alice_address = canonical_address_from_umbral_key(signing_privkey.get_pubkey())
+    blockhash = bytes(32)
+    specification = b''.join((bytes(capsule),
+                              bytes(ursula.stamp),
+                              bytes(ursula.decentralized_identity_evidence),
+                              alice_address,
+                              blockhash))
+    task_signature = bytes(Signer(bob_privkey)(specification))
+    metadata = bytes(ursula.stamp(task_signature))
+    bob = Bob.from_public_keys(verifying_key=bob_privkey.get_pubkey())
+
+    tasks_and_work_orders = list()
+    for i in range(1000):
+        cfrag = pre.reencrypt(kfrags[i % len(kfrags)], capsule, metadata=metadata)
+        cfrag.proof.bn_sig = CurveBN.gen_rand(capsule.params.curve)
+        task = WorkOrder.PRETask(capsule, task_signature, cfrag, bytes(ursula.stamp(bytes(cfrag))))
+        work_order = WorkOrder(bob, None, alice_address, [task], None, ursula, blockhash)
+        tasks_and_work_orders.append((task, work_order))
+
+    evidence = IndisputableEvidence.from_tasks(tasks_and_work_orders)
+    assert len(evidence) == len(tasks_and_work_orders)
+
+    # Batched evidence is the same as evidence built on its own...
+    for task_evidence, (task, work_order) in zip(evidence[:10], tasks_and_work_orders):
+        assert task_evidence.precompute_values() == IndisputableEvidence(task, work_order).precompute_values()
+
+    # ...and it is computed only once.
+    with patch('umbral.random_oracles.hash_to_curvebn') as hash_to_curvebn:
+        for task_evidence in evidence:
+            task_evidence.get_proof_challenge_scalar()
+            task_evidence.evaluation_arguments()
+        assert not hash_to_curvebn.called
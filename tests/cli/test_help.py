@@ -32,14 +32,21 @@ def test_echo_nucypher_version(click_runner):
 
 @pytest.mark.parametrize('command', (('--help', ), tuple()))
 def test_nucypher_help_message(click_runner, command):
-    entry_points = {command.name for command in ENTRY_POINTS}
+    entry_points = set(ENTRY_POINTS)
     result = click_runner.invoke(nucypher_cli, tuple(), catch_exceptions=False)
     assert result.exit_code == 0
     assert '[OPTIONS] COMMAND [ARGS]' in result.output, 'Missing or invalid help text was produced.'
     assert all(e in result.output for e in entry_points)
 
 
-@pytest.mark.parametrize('entry_point_name, entry_point', ([command.name, command] for command in ENTRY_POINTS))
+@pytest.mark.parametrize('entry_point_name', sorted(ENTRY_POINTS))
+def test_entry_point_short_help_matches_command(entry_point_name):
+    _import_path, short_help = ENTRY_POINTS[entry_point_name]
+    entry_point = nucypher_cli.get_command(None, entry_point_name)
+    assert short_help == entry_point.get_short_help_str(limit=len(short_help))
+
+
+@pytest.mark.parametrize('entry_point_name, entry_point', ([name, nucypher_cli.get_command(None, name)] for name in ENTRY_POINTS))
 def test_character_help_messages(click_runner, entry_point_name, entry_point):
     help_args = (entry_point_name, '--help')
     result = click_runner.invoke(nucypher_cli, help_args, catch_exceptions=False)
@@ -50,7 +57,7 @@ def test_character_help_messages(click_runner, entry_point_name, entry_point):
             assert f'{sub_command}' in result.output, f'Sub command {sub_command} is missing from help text'
 
 
-@pytest.mark.parametrize('entry_point_name, entry_point', ([command.name, command] for command in ENTRY_POINTS))
+@pytest.mark.parametrize('entry_point_name, entry_point', ([name, nucypher_cli.get_command(None, name)] for name in ENTRY_POINTS))
 def test_character_sub_command_help_messages(click_runner, entry_point_name, entry_point):
     if isinstance(entry_point, click.Group):
         for sub_command in entry_point.commands:
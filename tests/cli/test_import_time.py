@@ -0,0 +1,67 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+from nucypher.cli.main import ENTRY_POINTS
+
+# Modules that only the commands themselves may pull in
+HEAVY_MODULES = ('web3', 'eth_tester', 'solc', 'flask', 'hendrix', 'twisted.internet.reactor')
+
+# Modules that only tests and contract deployment need
+DEVELOPMENT_MODULES = ('eth_tester', 'solc', 'nucypher.blockchain.eth.sol.compile')
+
+LIST_IMPORTED_MODULES = """
+import json, sys
+from nucypher.cli.main import nucypher_cli
+command = sys.argv[1] or None
+if command:
+    nucypher_cli.get_command(None, command)
+else:
+    try:
+        nucypher_cli.main(['--help'], prog_name='nucypher')
+    except SystemExit:
+        pass
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def imported_modules(command: str = None) -> set:
+    """Modules imported, in a fresh interpreter, by `nucypher --help` or by loading `command`"""
+    output = subprocess.check_output([sys.executable, '-c', LIST_IMPORTED_MODULES, command or ''])
+    return set(json.loads(output.decode().splitlines()[-1]))
+
+
+def test_base_command_does_not_import_entry_points():
+    modules = imported_modules()
+    loaded_heavy_modules = set(HEAVY_MODULES) & modules
+    assert not loaded_heavy_modules, f'nucypher --help imports {loaded_heavy_modules}'
+    assert not any(module.startswith('nucypher.cli.commands') for module in modules)
+
+
+@pytest.mark.parametrize('command', sorted(ENTRY_POINTS))
+def test_entry_point_imports_only_itself(command):
+    modules = imported_modules(command)
+    assert f'nucypher.cli.commands.{command}' in modules
+    other_commands = {f'nucypher.cli.commands.{other}' for other in ENTRY_POINTS if other != command}
+    assert not other_commands & modules
+    loaded_development_modules = set(DEVELOPMENT_MODULES) & modules
+    assert not loaded_development_modules, f"'nucypher {command}' imports {loaded_development_modules}"
@@ -50,6 +50,12 @@ def test_generate_alice_keyring(tmpdir):
 
     assert delegating_pubkey == another_delegating_pubkey
 
+    # Locking the keyring drops the label secrets cached by its delegating powers
+    assert delegating_power.label_cache_misses == 1
+    keyring.lock()
+    assert delegating_power.get_pubkey_from_label(label) == delegating_pubkey
+    assert delegating_power.label_cache_misses == 2
+
 
 def test_characters_use_keyring(tmpdir):
     keyring = NucypherKeyring.generate(
@@ -15,11 +15,17 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import os
+import tempfile
+from unittest.mock import patch
+
 import pytest
 
 from nucypher.characters.lawful import Ursula
 from nucypher.config.storages import (
     ForgetfulNodeStorage,
+    InMemoryNodeStorage,
+    LocalIndexedNodeStorage,
     SQLiteForgetfulNodeStorage,
     TemporaryFileBasedNodeStorage,
     NodeStorage)
@@ -106,6 +112,37 @@ class TestInMemoryNodeStorage(BaseTestNodeStorageBackends):
                                            federated_only=BaseTestNodeStorageBackends.federated_only)
     storage_backend.initialize()
 
+    def test_identical_certificates_are_written_once(self, light_ursula):
+        with patch('nucypher.config.storages.os.replace', wraps=os.replace) as certificate_writes, \
+                patch('nucypher.config.storages.os.fsync', wraps=os.fsync) as fsyncs:
+            with self.storage_backend.batch():
+                for _ in range(10):
+                    filepath = self.storage_backend.store_node_certificate(certificate=light_ursula.certificate)
+                assert fsyncs.call_count == 0
+        assert certificate_writes.call_count == 1
+        assert os.path.isfile(filepath)
+        assert 1 <= fsyncs.call_count <= 2  # The certificate, and its directory where supported
+
+        # Already on disk, so nothing to write
+        with patch('nucypher.config.storages.os.replace', wraps=os.replace) as certificate_writes:
+            self.storage_backend.store_node_certificate(certificate=light_ursula.certificate)
+        assert certificate_writes.call_count == 0
+
+
+class TestMemoryOnlyNodeStorage(BaseTestNodeStorageBackends):
+    storage_backend = InMemoryNodeStorage(character_class=BaseTestNodeStorageBackends.character_class,
+                                          federated_only=BaseTestNodeStorageBackends.federated_only)
+    storage_backend.initialize()
+
+    def test_certificates_are_kept_in_a_temporary_directory(self, light_ursula):
+        filepath = self.storage_backend.store_node_certificate(certificate=light_ursula.certificate)
+        assert os.path.dirname(filepath) == self.storage_backend._temp_certificates_dir
+        assert os.path.isfile(filepath)
+        certificate = self.storage_backend.get(checksum_address=light_ursula.checksum_address,
+                                               federated_only=True,
+                                               certificate_only=True)
+        assert certificate == light_ursula.certificate
+
 
 class TestInMemorySQLiteNodeStorage(BaseTestNodeStorageBackends):
     storage_backend = SQLiteForgetfulNodeStorage(db_filepath=':memory:',
@@ -113,8 +150,65 @@ class TestInMemorySQLiteNodeStorage(BaseTestNodeStorageBackends):
                                                  federated_only=BaseTestNodeStorageBackends.federated_only)
     storage_backend.initialize()
 
+    def test_node_status_persists_across_restarts(self, light_ursula):
+        db_filepath = os.path.join(tempfile.mkdtemp(prefix='nucypher-test-sqlite-'), 'nodes.sqlite')
+        node_storage = SQLiteForgetfulNodeStorage(db_filepath=db_filepath, federated_only=True)
+        node_storage.initialize()
+        node_storage.store_node_metadata(node=light_ursula)
+        del node_storage
+
+        restarted_node_storage = SQLiteForgetfulNodeStorage(db_filepath=db_filepath, federated_only=True)
+        restarted_node_storage.initialize()
+        rows = restarted_node_storage.db_conn.execute(f"SELECT staker_address FROM "
+                                                      f"{SQLiteForgetfulNodeStorage.NODE_DB_NAME}").fetchall()
+        assert rows == [(light_ursula.checksum_address, )]
+
+        journal_mode, = restarted_node_storage.db_conn.execute('PRAGMA journal_mode').fetchone()
+        assert journal_mode == 'wal'
+
+    def test_batched_node_status_writes(self, light_ursula):
+        self.storage_backend.clear()
+        with self.storage_backend.batch():
+            self.storage_backend.store_node_metadata(node=light_ursula)
+            query = f"SELECT COUNT(*) FROM {SQLiteForgetfulNodeStorage.NODE_DB_NAME}"
+            assert self.storage_backend.db_conn.execute(query).fetchone() == (0, )  # Not yet written
+        assert self.storage_backend.db_conn.execute(query).fetchone() == (1, )
+
 
 class TestTemporaryFileBasedNodeStorage(BaseTestNodeStorageBackends):
     storage_backend = TemporaryFileBasedNodeStorage(character_class=BaseTestNodeStorageBackends.character_class,
                                                     federated_only=BaseTestNodeStorageBackends.federated_only)
     storage_backend.initialize()
+
+
+class TestLocalIndexedNodeStorage(BaseTestNodeStorageBackends):
+    storage_backend = LocalIndexedNodeStorage(storage_root=tempfile.mkdtemp(prefix='nucypher-test-indexed-nodes-'),
+                                              character_class=BaseTestNodeStorageBackends.character_class,
+                                              federated_only=BaseTestNodeStorageBackends.federated_only)
+    storage_backend.initialize()
+
+    def test_reload_and_compact_storage(self, light_ursula):
+        self.storage_backend.clear()
+        for _ in range(3):
+            self.storage_backend.store_node_metadata(node=light_ursula)
+
+        # A fresh instance indexes the same file
+        payload = self.storage_backend.payload()
+        reloaded_storage = LocalIndexedNodeStorage.from_payload(payload=payload, federated_only=True)
+        assert reloaded_storage.all(federated_only=True) == {light_ursula}
+
+        # Superseded records are reclaimed
+        size_before_compaction = os.path.getsize(reloaded_storage.storage_filepath)
+        assert reloaded_storage.compact() > 0
+        assert os.path.getsize(reloaded_storage.storage_filepath) < size_before_compaction
+        assert reloaded_storage.get(checksum_address=light_ursula.checksum_address, federated_only=True) == light_ursula
+
+    def test_discard_incomplete_trailing_record(self, light_ursula):
+        self.storage_backend.clear()
+        self.storage_backend.store_node_metadata(node=light_ursula)
+        with open(self.storage_backend.storage_filepath, 'ab') as storage_file:
+            storage_file.write(bytes(light_ursula)[:32])  # An interrupted append
+
+        reloaded_storage = LocalIndexedNodeStorage.from_payload(payload=self.storage_backend.payload(),
+                                                                federated_only=True)
+        assert reloaded_storage.all(federated_only=True) == {light_ursula}
@@ -64,6 +64,26 @@ def __very_pretty_and_insecure_scrypt_do_not_use():
     # Re-Enable Scrypt KDF
     Scrypt.derive = original_derivation_function
 
+
+@pytest.fixture(autouse=True, scope='session')
+def __disable_economics_cache():
+    """Keeps the test session from writing economics into the real configuration root"""
+    from nucypher.blockchain.economics import EconomicsFactory
+    original_cache_filepath = EconomicsFactory.cache_filepath
+    EconomicsFactory.cache_filepath = None
+    yield
+    EconomicsFactory.cache_filepath = original_cache_filepath
+
+
+@pytest.fixture(autouse=True, scope='session')
+def __check_staker_snapshots_on_every_read():
+    """Tests change staking state faster than the staker snapshot freshness interval"""
+    from nucypher.blockchain.eth.agents import StakingEscrowAgent
+    original_interval = StakingEscrowAgent.SNAPSHOT_FRESHNESS_INTERVAL
+    StakingEscrowAgent.SNAPSHOT_FRESHNESS_INTERVAL = 0
+    yield
+    StakingEscrowAgent.SNAPSHOT_FRESHNESS_INTERVAL = original_interval
+
 ############################################
 
 
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 from eth_account._utils.transactions import Transaction
 from eth_utils import to_checksum_address
@@ -5,7 +7,7 @@ from eth_utils import to_checksum_address
 from nucypher.blockchain.eth.agents import NucypherTokenAgent
 from nucypher.crypto.api import verify_eip_191
 from nucypher.crypto.powers import (PowerUpError)
-from nucypher.crypto.powers import TransactingPower
+from nucypher.crypto.powers import TransactingPower, DelegatingPower
 from nucypher.utilities.sandbox.constants import INSECURE_DEVELOPMENT_PASSWORD
 from tests.conftest import LOCK_FUNCTION
 
@@ -124,3 +126,40 @@ def test_transacting_power_sign_agent_transaction(testerchain, agency, test_regi
     restored_transaction = Transaction.from_bytes(serialized_bytes=signed_raw_transaction)
     restored_dict = restored_transaction.as_dict()
     assert to_checksum_address(restored_dict['to']) == unsigned_transaction['to']
+
+
+def test_delegating_power_label_key_cache():
+    power = DelegatingPower(label_cache_size=2)
+    keying_material = power._DelegatingPower__umbral_keying_material
+    label = b'llamas'
+
+    with patch.object(keying_material, 'derive_privkey_by_label',
+                      wraps=keying_material.derive_privkey_by_label) as derive:
+        pubkey = power.get_pubkey_from_label(label)
+        for _ in range(10):
+            assert power.get_pubkey_from_label(label) == pubkey
+            power.get_decrypting_power_from_label(label)
+        assert derive.call_count == 1
+    assert power.label_cache_misses == 1
+    assert power.label_cache_hits == 20
+
+    # Callers get their own key object, which eviction and locking never touch
+    handed_out_key = power._get_privkey_from_label(label)
+    assert handed_out_key is not power._get_privkey_from_label(label)
+    power.get_pubkey_from_label(b'alpacas')
+    power.get_pubkey_from_label(b'vicunas')
+    assert handed_out_key.get_pubkey() == pubkey
+    assert power.get_pubkey_from_label(label) == pubkey
+    assert power.label_cache_misses == 4
+
+    # The least recently used secret is zeroed on eviction, and locking zeroes everything
+    secrets = power._DelegatingPower__label_secrets
+    evicted_secret = secrets[b'vicunas']
+    power.get_pubkey_from_label(b'guanacos')
+    power.get_pubkey_from_label(label)
+    assert b'vicunas' not in secrets and not any(evicted_secret)
+    cached_secrets = list(secrets.values())
+    power.lock()
+    assert not secrets and not any(any(secret) for secret in cached_secrets)
+    assert handed_out_key.get_pubkey() == pubkey
+    assert power.get_pubkey_from_label(label) == pubkey
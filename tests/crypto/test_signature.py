@@ -14,13 +14,14 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+
 import pytest
 from cryptography.hazmat.backends.openssl import backend
 from cryptography.hazmat.primitives import hashes
 from umbral.keys import UmbralPrivateKey
 
 from nucypher.crypto.api import ecdsa_sign, verify_ecdsa
-from nucypher.crypto.signing import Signature, Signer
+from nucypher.crypto.signing import Signature, Signer, InvalidSignature, invalid_signatures, verify_signatures
 from nucypher.crypto.utils import recover_pubkey_from_signature, get_signature_recovery_value
 
 
@@ -92,3 +93,51 @@ def test_ecdsa_signature_recovery(execution_number):
                                                                  signature,
                                                                  pubkey,
                                                                  is_prehashed=True)
+
+
+def test_batch_signature_verification():
+    privkeys = [UmbralPrivateKey.gen_key() for _ in range(4)]
+    signed_messages = list()
+    for i in range(100):
+        privkey = privkeys[i % len(privkeys)]
+        message = b"peace at dawn " + bytes([i])
+        signature = Signer(private_key=privkey)(message=message)
+        signed_messages.append((message, signature, privkey.get_pubkey()))
+
+    # Agrees with one-by-one verification, low-S or not
+    assert all(signature.verify(message, pubkey) for message, signature, pubkey in signed_messages)
+    assert invalid_signatures(signed_messages) == []
+    verify_signatures(signed_messages)
+
+    # Culprits are pinpointed
+    tampered = list(signed_messages)
+    message, signature, pubkey = tampered[7]
+    tampered[7] = (message + b"!", signature, pubkey)
+    message, signature, _pubkey = tampered[42]
+    tampered[42] = (message, signature, privkeys[0].get_pubkey())  # Signed by privkeys[2]
+    tampered[99] = (tampered[99][0], bytes(64), tampered[99][2])
+    assert invalid_signatures(tampered) == [7, 42, 99]
+    with pytest.raises(InvalidSignature):
+        verify_signatures(tampered)
+
+
+@pytest.mark.slow()
+def test_batch_signature_verification_of_many_signatures():
+    privkey = UmbralPrivateKey.gen_key()
+    pubkey = privkey.get_pubkey()
+    signer = Signer(private_key=privkey)
+    signed_messages = list()
+    for i in range(1000):
+        message = i.to_bytes(4, byteorder='big')
+        signed_messages.append((message, signer(message=message), pubkey))
+
+    assert all(signature.verify(message, pubkey) for message, signature, pubkey in signed_messages)
+    assert invalid_signatures(signed_messages) == []
+    verify_signatures(signed_messages)
+
+    # A single bad signature is still pinpointed in a large batch
+    message, signature, pubkey = signed_messages[500]
+    signed_messages[500] = (message + b"!", signature, pubkey)
+    assert invalid_signatures(signed_messages) == [500]
+    with pytest.raises(InvalidSignature):
+        verify_signatures(signed_messages)
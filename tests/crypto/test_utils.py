@@ -17,10 +17,17 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 import pytest
 
+from eth_keys import KeyAPI as EthKeyAPI
 from umbral.keys import UmbralPrivateKey
 
-from nucypher.crypto.signing import SignatureStamp
-from nucypher.crypto.utils import get_coordinates_as_bytes
+from nucypher.crypto import utils
+from nucypher.crypto.signing import SignatureStamp, Signer
+from nucypher.crypto.utils import (
+    canonical_address_from_umbral_key,
+    get_coordinates_as_bytes,
+    get_signature_recovery_value,
+    recover_pubkey_from_signature
+)
 
 
 def test_coordinates_as_bytes():
@@ -38,3 +45,37 @@ def test_coordinates_as_bytes():
         assert get_coordinates_as_bytes(p, y_coord=False) == x
         with pytest.raises(ValueError):
             _ = get_coordinates_as_bytes(p, x_coord=False, y_coord=False)
+
+
+def test_key_cache():
+    pubkey = UmbralPrivateKey.gen_key().pubkey
+    stamp = SignatureStamp(verifying_key=pubkey)
+    expected_address = EthKeyAPI.PublicKey(pubkey.to_bytes(is_compressed=False)[1:]).to_canonical_address()
+
+    hits = utils._key_coordinates.cache_info().hits
+    assert canonical_address_from_umbral_key(pubkey) == expected_address
+    assert canonical_address_from_umbral_key(stamp) == expected_address
+    assert get_coordinates_as_bytes(stamp) == get_coordinates_as_bytes(pubkey.point_key)
+    assert utils._key_coordinates.cache_info().hits > hits
+    assert utils._key_coordinates.cache_info().maxsize == utils.KEY_CACHE_SIZE
+
+
+def test_signature_recovery_cache():
+    privkey = UmbralPrivateKey.gen_key()
+    pubkey = privkey.get_pubkey()
+    message = b"peace at dawn"
+    signature = Signer(private_key=privkey)(message=message)
+
+    v = get_signature_recovery_value(message, signature, pubkey)
+    assert recover_pubkey_from_signature(message, signature, v_value_to_try=v[0]) == bytes(pubkey)
+
+    # Memoized per message hash, signature and key
+    misses = utils._recovery_value.cache_info().misses
+    assert get_signature_recovery_value(message, signature, pubkey) == v
+    assert utils._recovery_value.cache_info().misses == misses
+
+    # Failures are not
+    with pytest.raises(ValueError):
+        get_signature_recovery_value(message + b"!", signature, pubkey)
+    with pytest.raises(ValueError):
+        get_signature_recovery_value(message + b"!", signature, pubkey)
@@ -0,0 +1,52 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+import pytest
+from constant_sorrow.constants import SIGNATURE_TO_FOLLOW
+from umbral import pre
+from umbral.keys import UmbralPrivateKey
+
+from nucypher.crypto.signing import Signer, SignatureStamp
+from nucypher.crypto.workers import CryptoWorkerPool
+
+
+@pytest.fixture(scope='module')
+def crypto_workers():
+    workers = CryptoWorkerPool(max_workers=2, min_parallel_jobs=1)
+    yield workers
+    workers.shutdown()
+
+
+def test_parallel_encrypt_and_sign(crypto_workers):
+    signing_privkey = UmbralPrivateKey.gen_key()
+    stamp = SignatureStamp(verifying_key=signing_privkey.get_pubkey(), signer=Signer(signing_privkey))
+    recipient_privkeys = [UmbralPrivateKey.gen_key() for _ in range(5)]
+    plaintexts = [f'kfrag {i}'.encode() for i in range(5)]
+
+    message_kits = crypto_workers.encrypt_and_sign(recipient_pubkeys=[key.get_pubkey() for key in recipient_privkeys],
+                                                   plaintexts=plaintexts,
+                                                   signer=stamp)
+
+    # Each message kit is encrypted for its own recipient, in order, and signed by the sender
+    for privkey, plaintext, message_kit in zip(recipient_privkeys, plaintexts, message_kits):
+        cleartext = pre.decrypt(ciphertext=message_kit.ciphertext, capsule=message_kit.capsule, decrypting_key=privkey)
+        signature = message_kit.signature
+        assert cleartext == SIGNATURE_TO_FOLLOW + signature + plaintext
+        assert signature.verify(plaintext, signing_privkey.get_pubkey())
+        assert message_kit.sender_verifying_key == signing_privkey.get_pubkey()
+
+    with pytest.raises(ValueError):
+        crypto_workers.encrypt_and_sign(recipient_pubkeys=[], plaintexts=plaintexts, signer=stamp)
@@ -75,3 +75,23 @@ def test_workorder_sqlite_datastore(test_datastore):
     deleted = test_datastore.del_workorders(arrangement_id)
     assert deleted > 0
     assert len(test_datastore.get_workorders(arrangement_id)) == 0
+
+
+def test_reencryption_response_sqlite_datastore(test_datastore):
+    arrangement_id = b'test'
+    digest, response = b'digest', b'cfrags and signatures'
+
+    # Test add response
+    test_datastore.save_reencryption_response(digest, arrangement_id, response)
+
+    # Test get response, only if recent enough
+    assert test_datastore.get_reencryption_response(digest) == response
+    assert test_datastore.get_reencryption_response(digest, since=datetime(2000, 1, 1)) == response
+    with pytest.raises(datastore.NotFound):
+        test_datastore.get_reencryption_response(digest, since=datetime.utcnow())
+
+    # Test del responses
+    assert test_datastore.del_reencryption_responses(before=datetime(2000, 1, 1)) == 0
+    assert test_datastore.del_reencryption_responses(arrangement_id=arrangement_id) == 1
+    with pytest.raises(datastore.NotFound):
+        test_datastore.get_reencryption_response(digest)
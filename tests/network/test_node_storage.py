@@ -14,12 +14,15 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+from unittest.mock import patch
 
 import maya
 import pytest
 import pytest_twisted as pt
 from twisted.internet.threads import deferToThread
 
+from nucypher.characters.lawful import Ursula
+from nucypher.network.nodes import NodeSprout
 from nucypher.utilities.sandbox.ursula import make_federated_ursulas
 
 
@@ -53,3 +56,61 @@ def test_one_node_stores_a_bunch_of_others(federated_ursulas, ursula_federated_t
     assert list(newcomer.known_nodes)
     assert len(list(newcomer.known_nodes)) == len(list(newcomer.node_storage.all(True)))
     assert set(list(newcomer.known_nodes)) == set(list(newcomer.node_storage.all(True)))
+
+
+def test_lazy_warm_start_from_storage(federated_ursulas, ursula_federated_test_config):
+    newcomer = make_federated_ursulas(
+        ursula_config=ursula_federated_test_config,
+        quantity=1,
+        know_each_other=False,
+        save_metadata=True).pop()
+
+    for ursula in federated_ursulas:
+        newcomer.node_storage.store_node_metadata(node=Ursula.from_bytes(bytes(ursula)))
+
+    with patch('nucypher.network.nodes.deferToThread') as background_verification:
+        newcomer.read_nodes_from_storage(lazy=True)
+
+    # Verification was handed off to the background
+    assert background_verification.call_count == 1
+
+    # All stored nodes are known, but none have been matured yet
+    assert len(newcomer.known_nodes) == len(federated_ursulas)
+    assert all(isinstance(node, NodeSprout) for node in newcomer.known_nodes)
+
+    # The fleet state was recorded once, for all of them
+    assert len(newcomer.known_nodes.states) == 1
+
+
+def test_stored_nodes_are_verified_off_the_reactor_thread(federated_ursulas, ursula_federated_test_config):
+    newcomer = make_federated_ursulas(
+        ursula_config=ursula_federated_test_config,
+        quantity=1,
+        know_each_other=False,
+        save_metadata=True).pop()
+
+    for ursula in federated_ursulas:
+        newcomer.node_storage.store_node_metadata(node=Ursula.from_bytes(bytes(ursula)))
+    with patch('nucypher.network.nodes.deferToThread'):
+        newcomer.read_nodes_from_storage(lazy=True)
+    sprouts = list(newcomer.known_nodes)
+    impostor = sprouts[0]
+
+    def verify_node(node, *args, **kwargs):
+        if node.checksum_address == impostor.checksum_address:
+            raise Ursula.InvalidNode
+
+    with patch.object(Ursula, 'verify_node', verify_node), \
+            patch('nucypher.network.nodes.reactor.callFromThread') as call_from_thread:
+        newcomer._Learner__verify_stored_nodes(sprouts)
+
+    # The known sprouts were not matured in place by the worker
+    assert all(isinstance(sprout, NodeSprout) for sprout in sprouts)
+    assert call_from_thread.call_count == len(sprouts)
+
+    # On the reactor thread, verified nodes replace their sprouts, and the impostor is forgotten
+    for (replace_stored_node, *args), _kwargs in call_from_thread.call_args_list:
+        replace_stored_node(*args)
+    assert impostor.checksum_address not in newcomer.known_nodes._nodes
+    assert len(newcomer.known_nodes) == len(sprouts) - 1
+    assert all(isinstance(node, Ursula) for node in newcomer.known_nodes)